@@ -65,7 +65,7 @@ for frame in range(600): # 600 frames at 60 FPS = ~10 seconds of running
     game_state.update(16) # 16 ms dt
     
     # Debug print player state and distance
-    player_sprite = game_state.player.sprite
+    player_sprite = game_state.player
     if frame % 10 == 0 or len(game_state.npc_group) > 0:
         print(f"Frame {frame:03d} | Player state: {player_sprite.state} | is_running: {player_sprite.is_running} | dir: {player_sprite.direction} | world_distance: {game_state.world_distance} | npc_count: {len(game_state.npc_group)}")
     
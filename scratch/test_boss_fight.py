@@ -84,7 +84,7 @@ assert boss.event_id == 99, "Expected event_id 99"
 setattr(Player, "is_running", property(lambda self: True))
 setattr(Player, "direction", property(lambda self: 1))
 
-player = game_state.player.sprite
+player = game_state.player
 player._direction = 1
 
 # Run state update
@@ -60,7 +60,7 @@ custom_zone = {
     "required_kills": 2,
     "tier": "minion"
 }
-game_state._spawn_zones = [custom_zone]
+game_state._set_spawn_zones([custom_zone])
 
 print("Starting test...")
 print(f"Required kills config: {custom_zone['required_kills']}")
@@ -79,7 +79,7 @@ print("Killing first skeleton...")
 # We simulate take_damage which will transition state to DEATH
 first_skeleton.take_damage(first_skeleton.max_health)
 # Call game_state method to process death sound/kill count
-game_state._apply_player_damage_to_enemy(game_state.player.sprite, first_skeleton)
+game_state._apply_player_damage_to_enemy(game_state.player, first_skeleton)
 
 print(f"Zone killed count: {custom_zone.get('killed_count', 0)}")
 assert custom_zone.get('killed_count', 0) == 1, "Killed count did not increment to 1!"
@@ -99,7 +99,7 @@ assert len(spawned_skeletons) > 0, "Second skeleton did not spawn!"
 second_skeleton = spawned_skeletons[0]
 print("Killing second skeleton...")
 second_skeleton.take_damage(second_skeleton.max_health)
-game_state._apply_player_damage_to_enemy(game_state.player.sprite, second_skeleton)
+game_state._apply_player_damage_to_enemy(game_state.player, second_skeleton)
 
 print(f"Zone killed count: {custom_zone.get('killed_count', 0)}")
 assert custom_zone.get('killed_count', 0) == 2, "Killed count did not increment to 2!"
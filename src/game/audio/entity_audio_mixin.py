@@ -50,6 +50,16 @@ class EntityAudioMixin:
         _eam_prev_frame_index  — detects animation loops to reset played set
     """
 
+    # Loaded configs keyed by (entity_key, id(audio_manager)). Validation hashes
+    # every referenced audio file, so it runs once per entity type rather than
+    # on every spawn; the dicts are shared and treated as read-only.
+    _eam_config_cache: Dict[tuple[str, int], Dict[str, Any]] = {}
+
+    @classmethod
+    def clear_entity_audio_cache(cls) -> None:
+        """Forget loaded configs so the next spawn re-reads them from disk."""
+        EntityAudioMixin._eam_config_cache.clear()
+
     # ─────────────────────────────────────────────────────────────────────────
     # Initialisation
     # ─────────────────────────────────────────────────────────────────────────
@@ -61,7 +71,8 @@ class EntityAudioMixin:
     ) -> None:
         """
         Load the entity's audio config from ``game_data/<entity_key>_audio_config.json``,
-        validate against its lock, and pre-load all referenced sounds.
+        validate against its lock, and pre-load all referenced sounds. The
+        result is cached per entity type and audio manager.
 
         Args:
             audio_manager: The game's AudioManager instance.
@@ -86,6 +97,22 @@ class EntityAudioMixin:
         self._eam_last_state = None
         self._eam_prev_frame_index = 0
 
+        cache_key = (entity_key, id(audio_manager))
+        config = EntityAudioMixin._eam_config_cache.get(cache_key)
+        if config is None:
+            config = self._load_entity_audio_config(audio_manager, entity_key)
+            EntityAudioMixin._eam_config_cache[cache_key] = config
+        self._eam_config = config
+
+    @staticmethod
+    def _load_entity_audio_config(
+        audio_manager: "AudioManager",
+        entity_key: str,
+    ) -> Dict[str, Any]:
+        """
+        Seed, validate and read ``game_data/<entity_key>_audio_config.json``
+        and pre-load its sounds. Returns ``{}`` when custom audio is disabled.
+        """
         config_path = f"game_data/{entity_key}_audio_config.json"
         lock_path   = f"game_data/{entity_key}_audio_config.lock"
 
@@ -100,8 +127,7 @@ class EntityAudioMixin:
                     f"[EntityAudio:{entity_key}] Warning — could not seed "
                     f"default config: {seed_err}"
                 )
-                self._eam_config = {}
-                return
+                return {}
 
         # ── Validate against lock (non-fatal) ────────────────────────────────
         try:
@@ -112,35 +138,25 @@ class EntityAudioMixin:
                     f"[EntityAudio:{entity_key}] Lock mismatch — {reason}. "
                     f"Custom audio disabled until re-saved via editor."
                 )
-                self._eam_config = {}
-                return
+                return {}
         except Exception as val_err:
             print(f"[EntityAudio:{entity_key}] Validation error: {val_err}")
-            self._eam_config = {}
-            return
+            return {}
 
         # ── Load config ───────────────────────────────────────────────────────
         try:
             with open(config_path, "r") as f:
-                self._eam_config = json.load(f)
+                config: Dict[str, Any] = json.load(f)
         except Exception as load_err:
             print(f"[EntityAudio:{entity_key}] Failed to load config: {load_err}")
-            self._eam_config = {}
-            return
+            return {}
 
         # ── Pre-load all referenced sounds ────────────────────────────────────
-        sounds = self._eam_config.get("sounds", {})
-        for sound_name, file_path in sounds.items():
-            if file_path and sound_name not in audio_manager.sound_library:
-                try:
-                    # Use load_sound_safe so entity configs never override
-                    # sounds already registered by master_audio_config.json
-                    audio_manager.load_sound_safe(sound_name, file_path)
-                except Exception as load_sound_err:
-                    print(
-                        f"[EntityAudio:{entity_key}] Could not load sound "
-                        f"'{sound_name}' from '{file_path}': {load_sound_err}"
-                    )
+        # Entity configs never override sounds already registered by
+        # master_audio_config.json (preload_sounds skips known names)
+        from src.game.audio.sound_preload import preload_sounds
+        preload_sounds(audio_manager, config.get("sounds", {}), label=f"EntityAudio:{entity_key}")
+        return config
 
     # ─────────────────────────────────────────────────────────────────────────
     # Per-frame Update
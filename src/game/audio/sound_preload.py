@@ -0,0 +1,56 @@
+"""
+Sound Preload — decode a batch of sound files on a small thread pool.
+
+``pg.mixer.Sound`` spends nearly all of its time reading and decoding the
+file with the GIL released, so loading a config's worth of MP3/OGG files
+from a few threads overlaps that work instead of paying for it serially
+on the first spawn of each entity type. The workers only build the
+``Sound`` objects; registering them in the manager's library happens back
+on the calling thread, so the manager is never touched from a worker.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import pygame as pg
+
+_MAX_WORKERS = 4
+
+
+def preload_sounds(audio_manager: Any, sounds: Dict[str, str], label: str = "Audio") -> None:
+    """
+    Load every sound in *sounds* that *audio_manager* does not have yet.
+
+    Names already in the library are skipped, so existing registrations
+    (e.g. from master_audio_config.json) are never overridden.
+
+    Args:
+        audio_manager: Engine AudioManager (anything with a ``sound_library``
+            dict of name to ``pg.mixer.Sound``).
+        sounds: Mapping of sound name to file path; empty paths are skipped.
+        label: Log prefix for load failures.
+    """
+    library = audio_manager.sound_library
+    pending = [(name, path) for name, path in sounds.items() if path and name not in library]
+    if not pending:
+        return
+
+    def _decode(item: tuple[str, str]) -> Optional[pg.mixer.Sound]:
+        name, path = item
+        try:
+            return pg.mixer.Sound(path)
+        except Exception as e:
+            print(f"[{label}] Could not load sound '{name}' from '{path}': {e}")
+            return None
+
+    if len(pending) == 1:
+        decoded = [_decode(pending[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(pending))) as pool:
+            decoded = list(pool.map(_decode, pending))
+
+    for (name, _), sound in zip(pending, decoded):
+        if sound is not None:
+            library.setdefault(name, sound)
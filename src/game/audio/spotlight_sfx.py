@@ -44,7 +44,10 @@ class SpotlightSFXManager:
             if isinstance(item, str):
                 self.active_trackers.append(SFXTracker({"name": item}))
             elif isinstance(item, dict):
-                self.active_trackers.append(SFXTracker(item))
+                tracker = SFXTracker(item)
+                # A muted cue would still hold (and mix) a channel all section long
+                if tracker.volume > 0.0:
+                    self.active_trackers.append(tracker)
 
     def stop_all(self, fade_ms: int = 500):
         """Fade out all currently playing spotlight SFX before clearing them."""
@@ -57,7 +60,7 @@ class SpotlightSFXManager:
 class SFXTracker:
     def __init__(self, config: dict):
         self.name = config.get("name")
-        self.volume = config.get("volume", 1.0)
+        self.volume = min(1.0, max(0.0, float(config.get("volume", 1.0))))
         self.loop = config.get("loop", False)
         self.repeat = config.get("repeat", None)
         
@@ -10,6 +10,56 @@ from typing import Dict, Any, Optional, Tuple, List
 
 CONFIG_PATH = os.path.join("game_data", "controls_config.json")
 
+_key_code = pg.key.key_code
+
+# Keyboard binding string -> resolved key codes. Keyed by the raw string, so
+# rebinding an action simply misses and resolves the new binding.
+_keyboard_codes_cache: Dict[str, Tuple[int, ...]] = {}
+
+
+def _keyboard_codes(binding: str) -> Optional[Tuple[int, ...]]:
+    """Resolve a keyboard binding such as ``'left shift + f'`` once."""
+    try:
+        return _keyboard_codes_cache[binding]
+    except KeyError:
+        pass
+    try:
+        codes = tuple(_key_code(part.strip()) for part in binding.split("+"))
+    except Exception:
+        # Not cached: key names can fail to resolve before pygame is initialised
+        return None
+    _keyboard_codes_cache[binding] = codes
+    return codes
+
+
+# Joystick binding string -> parsed inputs: ("BUTTON", index, 0) or
+# ("AXIS", index, -1/+1). Unparseable parts are dropped to ("NONE", 0, 0).
+_joystick_inputs_cache: Dict[str, Tuple[Tuple[str, int, int], ...]] = {}
+
+
+def _joystick_inputs(binding: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Parse a joystick binding such as ``'BUTTON_4 + BUTTON_5'`` once."""
+    inputs = _joystick_inputs_cache.get(binding)
+    if inputs is not None:
+        return inputs
+    parsed = []
+    for part in binding.split("+"):
+        fields = part.strip().split("_")
+        try:
+            if fields[0] == "BUTTON":
+                parsed.append(("BUTTON", int(fields[1]), 0))
+                continue
+            if fields[0] == "AXIS" and len(fields) >= 3 and fields[2] in ("MINUS", "PLUS"):
+                parsed.append(("AXIS", int(fields[1]), -1 if fields[2] == "MINUS" else 1))
+                continue
+        except (IndexError, ValueError):
+            pass
+        parsed.append(("NONE", 0, 0))
+    inputs = tuple(parsed)
+    _joystick_inputs_cache[binding] = inputs
+    return inputs
+
+
 ACTIONS: List[str] = [
     "MOVE_LEFT",
     "MOVE_RIGHT",
@@ -197,31 +247,6 @@ class ControlsManager:
         except Exception:
             return None
 
-    def _check_single_joystick_input(self, js_binding: str, joystick: Any) -> bool:
-        if js_binding.startswith("BUTTON_"):
-            try:
-                btn_idx = int(js_binding.split("_")[1])
-                if btn_idx < joystick.get_numbuttons():
-                    return bool(joystick.get_button(btn_idx))
-            except Exception:
-                return False
-
-        elif js_binding.startswith("AXIS_"):
-            parts = js_binding.split("_")
-            if len(parts) >= 3:
-                try:
-                    axis_idx = int(parts[1])
-                    direction = parts[2]
-                    if axis_idx < joystick.get_numaxes():
-                        val = joystick.get_axis(axis_idx)
-                        if direction == "MINUS" and val < -0.5:
-                            return True
-                        elif direction == "PLUS" and val > 0.5:
-                            return True
-                except Exception:
-                    return False
-        return False
-
     def _check_keyboard_action(self, action: str, keys: Any) -> bool:
         if keys is None:
             return False
@@ -229,10 +254,11 @@ class ControlsManager:
         if not kb_binding:
             return False
 
-        parts = [p.strip() for p in kb_binding.split("+")]
-        for part in parts:
+        codes = _keyboard_codes(kb_binding)
+        if codes is None:
+            return False
+        for code in codes:
             try:
-                code = pg.key.key_code(part)
                 if not keys[code]:
                     return False
             except Exception:
@@ -246,10 +272,18 @@ class ControlsManager:
         if not js_binding:
             return False
 
-        parts = [p.strip() for p in js_binding.split("+")]
-        for part in parts:
-            if not self._check_single_joystick_input(part, joystick):
-                return False
+        try:
+            for kind, index, direction in _joystick_inputs(js_binding):
+                if kind == "BUTTON":
+                    if index >= joystick.get_numbuttons() or not joystick.get_button(index):
+                        return False
+                elif kind == "AXIS":
+                    if index >= joystick.get_numaxes() or joystick.get_axis(index) * direction <= 0.5:
+                        return False
+                else:
+                    return False
+        except Exception:
+            return False
         return True
 
     def is_action_pressed(
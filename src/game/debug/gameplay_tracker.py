@@ -350,7 +350,20 @@ class GameplayTracker:
                     "left": False, "right": False, "jump": False, "attack": False,
                     "roll": False, "dash": False, "special": False, "transform": False
                 }
-                if pg.display.get_init():
+                snapshot = getattr(entity, "input_snapshot", None)
+                if snapshot is not None:
+                    # Reuse the bindings the player resolved this frame
+                    inputs.update({
+                        "left": snapshot.move_left,
+                        "right": snapshot.move_right,
+                        "jump": snapshot.jump,
+                        "attack": snapshot.attack_thrust or snapshot.attack_smash or snapshot.attack_power,
+                        "roll": snapshot.roll,
+                        "dash": snapshot.dash,
+                        "special": snapshot.special_attack,
+                        "transform": snapshot.transform,
+                    })
+                elif pg.display.get_init():
                     try:
                         keys = pg.key.get_pressed()
                         inputs["left"] = keys[pg.K_LEFT] or keys[pg.K_a]
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict, Tuple, Any
 import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager
+from src.game.systems.render_batch import blit_batch
 
 
 class VisualEffect(pg.sprite.Sprite):
@@ -25,25 +26,49 @@ class VisualEffect(pg.sprite.Sprite):
         target_entity: Optional[Any] = None,
     ):
         super().__init__()
+        self._pooled = False  # set by VisualEffectManager so kill() recycles the effect
+        self._in_pool = False
+        self.reset(x, y, frames, fps, target_entity)
+
+    def reset(
+        self,
+        x: int,
+        y: int,
+        frames: List[pg.Surface],
+        fps: float = 30.0,
+        target_entity: Optional[Any] = None,
+    ) -> None:
+        """Restart the effect at (x, y) with a (possibly different) frame set."""
         self.frames = frames
         self.frame_duration = 1.0 / fps
-        self.current_frame = 0.0
+        self.frame_index = 0
+        self._frame_timer = 0.0
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=(x, y))
         self.target_entity = target_entity
 
+    def kill(self) -> None:
+        super().kill()
+        if self._pooled:
+            VisualEffectManager._release(self)
+
     def update(self, dt: float = 0.016, scroll_speed: int = 0) -> None:
         if self.target_entity is not None and hasattr(self.target_entity, "rect"):
             self.rect.center = self.target_entity.rect.center
         else:
             self.rect.x -= scroll_speed
 
-        self.current_frame += dt / self.frame_duration
-        idx = int(self.current_frame)
-        if idx >= len(self.frames):
+        self._frame_timer += dt
+        if self._frame_timer < self.frame_duration:
+            return
+        while self._frame_timer >= self.frame_duration:
+            self._frame_timer -= self.frame_duration
+            self.frame_index += 1
+
+        if self.frame_index >= len(self.frames):
             self.kill()
         else:
-            self.image = self.frames[idx]
+            self.image = self.frames[self.frame_index]
 
     def draw(self, surface: pg.Surface) -> None:
         surface.blit(self.image, self.rect)
@@ -55,6 +80,10 @@ class VisualEffectManager:
     _vfx_cache: Dict[Tuple[str, float], List[pg.Surface]] = {}
     _active_effects: pg.sprite.Group = pg.sprite.Group()
 
+    # Finished effects waiting to be reused by the next hit
+    _free: List[VisualEffect] = []
+    _MAX_POOLED = 32
+
     VFX_PATHS = {
         "magic_shot": "assets/graphics/Magic shots/1",
         "magic_swirl": "assets/graphics/swirl magic shots/1",
@@ -125,18 +154,38 @@ class VisualEffectManager:
         if not frames:
             return None
 
-        vfx = VisualEffect(x, y, frames, target_entity=target_entity or entity)
+        target = target_entity or entity
+        if cls._free:
+            vfx = cls._free.pop()
+            vfx._in_pool = False
+            vfx.reset(x, y, frames, target_entity=target)
+        else:
+            vfx = VisualEffect(x, y, frames, target_entity=target)
+            vfx._pooled = True
         cls._active_effects.add(vfx)
         return vfx
 
+    @classmethod
+    def _release(cls, vfx: VisualEffect) -> None:
+        """Take back an effect that has finished playing."""
+        if vfx._in_pool or len(cls._free) >= cls._MAX_POOLED:
+            return
+        vfx._in_pool = True
+        vfx.target_entity = None
+        cls._free.append(vfx)
+
     @classmethod
     def update(cls, dt: float = 0.016, scroll_speed: int = 0) -> None:
         cls._active_effects.update(dt=dt, scroll_speed=scroll_speed)
 
     @classmethod
     def draw(cls, surface: pg.Surface) -> None:
-        for vfx in cls._active_effects:
-            vfx.draw(surface)
+        # Effects are plain image blits, so they all go out in one batched call
+        effects = cls._active_effects
+        if not effects:
+            return
+        blit_seq = [(vfx.image, vfx.rect) for vfx in effects]
+        blit_batch(surface, blit_seq)
 
     @classmethod
     def clear(cls) -> None:
@@ -1,5 +1,7 @@
 import pygame as pg
-from v3x_zulfiqar_gideon import Animation, Animator, AssetManager
+from v3x_zulfiqar_gideon import Animation, Animator
+
+from src.game.systems import image_cache
 
 class Bat(pg.sprite.Sprite):
     """
@@ -55,19 +57,13 @@ class Bat(pg.sprite.Sprite):
         base_path = "assets/graphics/bat"
         
         def load_and_scale(path):
-            """Helper to load and scale animation frames."""
-            frames = AssetManager.get_animation_frames(path)
-            if self.scale != 1.0:
-                scaled_frames = []
-                for frame in frames:
-                    # Calculate new size while maintaining aspect ratio
-                    new_size = (
-                        int(frame.get_width() * self.scale),
-                        int(frame.get_height() * self.scale)
-                    )
-                    scaled_frames.append(pg.transform.scale(frame, new_size))
-                return scaled_frames
-            return frames
+            """Helper to load, scale and face animation frames right.
+
+            The bat only ever flies rightwards, so frames are mirrored once
+            at load (and shared by every bat at this scale) instead of having
+            the Animator flip a fresh copy every frame.
+            """
+            return image_cache.scaled_frames(path, self.scale, flip=True)
         
         # Load idle animation (when bat is hovering)
         idle_frames = load_and_scale(f"{base_path}/idle")
@@ -105,7 +101,6 @@ class Bat(pg.sprite.Sprite):
             # Fly in from left side of screen
             self.rect.x += self.speed * dt_sec
             self.animator.set("fly")
-            self.animator.flip_x = True  # Face right (flipped)
             
             # Switch to IDLE when reaching center
             if self.rect.centerx >= self.screen_width // 2:
@@ -130,7 +125,6 @@ class Bat(pg.sprite.Sprite):
             # Fly off to the right
             self.rect.x += self.speed * dt_sec
             self.animator.set("fly")
-            self.animator.flip_x = True  # Keep facing right
             
             # Reset position when off screen (for looping behavior)
             if self.rect.left > self.screen_width:
@@ -14,6 +14,7 @@ import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, Actor, AttackConfig
 from src.game.audio.entity_audio_mixin import EntityAudioMixin
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
 from ..services import ConfigClient
 
@@ -66,6 +67,9 @@ class BloodZombie(EntityAudioMixin, Actor):
         BloodZombieState.DEATH: StateConfig(0.15, loops=False, interruptible=False),
     }
 
+    # Scaled frame lists shared by every blood zombie, keyed by (path_pattern, count, scale)
+    _frame_cache: dict[tuple[str, int, float], list[pg.Surface]] = {}
+
     def __init__(
         self,
         x: int,
@@ -132,18 +136,9 @@ class BloodZombie(EntityAudioMixin, Actor):
                 self.scale *= 1.8
                 # Scale all animation frames
                 for state in list(self.animations.keys()):
-                    self.animations[state] = [
-                        pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                        for img in self.animations[state]
-                    ]
-                self._attack1_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                    for img in self._attack1_frames
-                ]
-                self._attack2_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                    for img in self._attack2_frames
-                ]
+                    self.animations[state] = self._tier_scaled(self.animations[state], 1.8)
+                self._attack1_frames = self._tier_scaled(self._attack1_frames, 1.8)
+                self._attack2_frames = self._tier_scaled(self._attack2_frames, 1.8)
             
             self._max_health = custom_health if custom_health is not None else 180.0  # Higher than regular skeleton boss
             self._speed = 3.0
@@ -198,6 +193,13 @@ class BloodZombie(EntityAudioMixin, Actor):
             knockback_force=self.ATTACK_2_CONFIG.knockback_force * knockback_scale,
         )
         
+        # Seed the Actor's flip cache with the shared mirrored frames so turning
+        # around never flips surfaces per instance. ATTACK swaps between two
+        # equal-length lists at runtime, so it keeps the lazy per-instance flip.
+        for state, frames in self.animations.items():
+            if frames and state != BloodZombieState.ATTACK:
+                self._animations_flipped[state] = image_cache.flipped(frames)
+
         # Initial setup
         self.set_state(BloodZombieState.IDLE)
         if self.state in self.animations:
@@ -251,7 +253,12 @@ class BloodZombie(EntityAudioMixin, Actor):
         """
         if scale_factor is None:
             scale_factor = self.scale
-        
+
+        cache_key = (path_pattern, count, scale_factor)
+        cached = BloodZombie._frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         frames: list[pg.Surface] = []
         
         for i in range(count):
@@ -270,9 +277,32 @@ class BloodZombie(EntityAudioMixin, Actor):
                 
         if not frames:
             raise RuntimeError(f"Failed to load any frames from pattern: {path_pattern}")
-            
+
+        BloodZombie._store_frames(cache_key, frames)
         return frames
 
+    @staticmethod
+    def _tier_scaled(frames: list[pg.Surface], factor: float) -> list[pg.Surface]:
+        """
+        Return a cached frame list rescaled by a tier *factor*, shared by every
+        spawn (the source lists are cached, so their ids stay valid).
+        """
+        cache_key = (f"tier:{id(frames)}", len(frames), factor)
+        cached = BloodZombie._frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        scaled = [
+            pg.transform.scale(img, (int(img.get_width() * factor), int(img.get_height() * factor)))
+            for img in frames
+        ]
+        BloodZombie._store_frames(cache_key, scaled)
+        return scaled
+
+    @staticmethod
+    def _store_frames(cache_key: tuple[str, int, float], frames: list[pg.Surface]) -> None:
+        """Cache a scaled frame list shared by every blood zombie."""
+        BloodZombie._frame_cache[cache_key] = frames
+
     # ─────────────────────────────────────────────────────────────────────────
     # Public API: Combat and State Inspection
     # ─────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,44 @@
+"""
+Shared visual-effect tables and helpers for the boss entities.
+"""
+
+from typing import Final, Optional
+
+import pygame as pg
+
+# Recharge-aura radius jitter (px), cycled one entry per frame while a boss
+# recharges instead of rolling the RNG every frame. The length is a power of
+# two so the cycle index wraps with a mask.
+AURA_JITTER: Final[tuple[float, ...]] = (3.1, 0.4, 5.2, 1.8, 4.6, 0.9, 5.8, 2.5)
+AURA_JITTER_MASK: Final[int] = len(AURA_JITTER) - 1
+
+
+class AlphaFlash:
+    """
+    Per-instance alpha flicker over shared animation frames.
+
+    Boss frames come from class-level and image_cache caches shared by every
+    instance, so their alpha must not be changed in place. While a flash is
+    active the current frame is copied once (re-copied only when the
+    animation moves to another frame) and the alpha goes on the copy.
+    """
+
+    __slots__ = ("_source", "_copy")
+
+    def __init__(self) -> None:
+        self._source: Optional[pg.Surface] = None
+        self._copy: Optional[pg.Surface] = None
+
+    def apply(self, image: pg.Surface, alpha: Optional[int]) -> pg.Surface:
+        """Return the surface to draw for *image*; *alpha* None ends the flash."""
+        if image is self._copy:
+            # The animation has not swapped frames since the last call
+            image = self._source
+        if alpha is None:
+            self._source = self._copy = None
+            return image
+        if image is not self._source:
+            self._source = image
+            self._copy = image.copy()
+        self._copy.set_alpha(alpha)
+        return self._copy
@@ -26,6 +26,11 @@ class BossManager:
         "green_monster": GreenMonster,
         "skeleton": Skeleton,
     }
+
+    # Health bar label font (created on first draw) and the last rendered
+    # (label, surface) pair; the label only changes when the boss takes damage
+    _label_font: Optional[pg.font.Font] = None
+    _label_cache: tuple = (None, None)
     
     @classmethod
     def resolve_boss_class(cls, sprite_dir: Optional[str]) -> Type[Actor]:
@@ -182,8 +187,11 @@ class BossManager:
             pg.draw.rect(surface, (231, 76, 60), top_rect, border_radius=4)
             
         # Draw boss name and health numbers
-        font = pg.font.SysFont("Arial", 14, bold=True)
         lbl = f"{title.upper()}  —  {int(health)}/{int(max_health)}"
-        txt_surf = font.render(lbl, True, (255, 255, 255))
+        if cls._label_cache[0] != lbl:
+            if cls._label_font is None:
+                cls._label_font = pg.font.SysFont("Arial", 14, bold=True)
+            cls._label_cache = (lbl, cls._label_font.render(lbl, True, (255, 255, 255)).convert_alpha())
+        txt_surf = cls._label_cache[1]
         txt_rect = txt_surf.get_rect(center=bg_rect.center)
         surface.blit(txt_surf, txt_rect)
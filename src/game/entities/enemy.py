@@ -1,14 +1,40 @@
 import pygame as pg
 import random
 import math
+from array import array
 from enum import Enum
 from v3x_zulfiqar_gideon import Actor, AssetManager
 from .hitbox_registry import HitboxRegistry
 from src.game.audio.entity_audio_mixin import EntityAudioMixin
+from src.game.systems import image_cache
 
 class EnemyState(Enum):
     FLY = 0
 
+# One full sine period sampled into a power-of-two table, so the per-frame
+# bobbing lookup is a multiply, a mask and an index instead of math.sin.
+_SIN_TABLE_SIZE = 1024
+_SIN_TABLE_MASK = _SIN_TABLE_SIZE - 1
+_SIN_TABLE = array("f", (math.sin(math.tau * i / _SIN_TABLE_SIZE) for i in range(_SIN_TABLE_SIZE)))
+
+_BAT_FRAME_COUNT = 7
+
+# Bat-to-bat avoidance radius (px) and peak vertical push per neighbour
+_AVOID_RADIUS = 45.0
+_AVOID_PUSH = 3.0
+_bat_frames_raw: list[pg.Surface] | None = None
+
+
+def _get_bat_frames() -> list[pg.Surface]:
+    """Load the unscaled bat flight frames once and share them across all bats."""
+    global _bat_frames_raw
+    if _bat_frames_raw is None:
+        _bat_frames_raw = [
+            AssetManager.get_texture(f"assets/graphics/bat/running/bat_running_{i}.png")
+            for i in range(_BAT_FRAME_COUNT)
+        ]
+    return _bat_frames_raw
+
 class EnemyStateConfig:
     def __init__(self, animation_speed: float):
         self.animation_speed = animation_speed
@@ -26,6 +52,8 @@ class Enemy(EntityAudioMixin, Actor):
     def __init__(self, audio_manager=None):
         super().__init__(0, 0)
         self._bat_audio_manager = audio_manager  # store for post-init setup
+        self._pool: EnemyPool | None = None  # set by EnemyPool so kill() recycles the bat
+        self._in_pool = False
         
         # Load margins and base scale
         margins = HitboxRegistry.get_margins("enemy")
@@ -37,27 +65,11 @@ class Enemy(EntityAudioMixin, Actor):
         scale = round(base_scale * self.depth_scale_factor, 1)
         # Store actual scale factor relative to the base scale
         self.depth_scale_factor = scale / base_scale
-        
-        # Load frames only once per scale if not already cached
-        if scale not in Enemy._fly_frames_caches:
-            cache = []
-            try:
-                for i in range(7):
-                    path = f"assets/graphics/bat/running/bat_running_{i}.png"
-                    frame = AssetManager.get_texture(path)
-                    
-                    original_size = frame.get_size()
-                    scaled_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-                    
-                    scaled_frame = pg.transform.scale(frame, scaled_size)
-                    cache.append(scaled_frame)
-            except Exception as e:
-                print(f"Error loading bat animation for scale {scale}: {e}")
-                cache = [pg.Surface((int(25 * scale), int(25 * scale)), pg.SRCALPHA) for _ in range(7)]
-            Enemy._fly_frames_caches[scale] = cache
+        # Draw layer in a BatSwarm: farther (smaller) bats are kept behind
+        self._layer = self.depth_scale_factor
         
         # Use actor system
-        self.animations = {EnemyState.FLY: Enemy._fly_frames_caches[scale]}
+        self.animations = {EnemyState.FLY: Enemy._scaled_fly_frames(scale)}
         
         # Randomize flapping speed to give a natural, non-synchronized feel
         random_flap_speed = 0.12 + random.random() * 0.12
@@ -78,6 +90,7 @@ class Enemy(EntityAudioMixin, Actor):
         # 1. Horizontal speed: faster flapping = faster horizontal flight (range: -2.0 to -4.0)
         # We also scale by depth_scale_factor to simulate 3D perspective parallax (farther = slower)
         self.speed = (-2.0 - flap_ratio * 2.0) * self.depth_scale_factor
+        self._dx = int(self.speed)  # whole pixels per frame, applied with the scroll
         
         # 2. Vertical bobbing amplitude: faster flight = tighter, more stable vertical range (range: 12 to 24)
         self.y_base = 0
@@ -85,7 +98,10 @@ class Enemy(EntityAudioMixin, Actor):
         
         # 3. Vertical bobbing frequency: faster flapping = higher frequency vertical adjustment (range: 0.03 to 0.07)
         self.y_frequency = 0.03 + flap_ratio * 0.04
-        self.time = random.randint(0, 100)
+        # y_frequency expressed in sine-table entries per frame; the bob phase
+        # is kept directly in table units so each frame is one add, not a multiply
+        self._sin_step = self.y_frequency * _SIN_TABLE_SIZE / math.tau
+        self._sin_phase = random.randint(0, 100) * self._sin_step
         
         # Setup separation/steering variables
         self.y_avoid_offset = 0.0
@@ -98,27 +114,60 @@ class Enemy(EntityAudioMixin, Actor):
         # Reduce hitbox using the margins loaded from the HitboxRegistry
         margins = HitboxRegistry.get_margins("enemy")
         self.adjust_hitbox_sides(left=margins.left, right=margins.right, top=margins.top, bottom=margins.bottom)
+        # rect.right < 0 expressed against rect.x, so the cull needs no property read
+        self._off_screen_x = -self.rect.width
 
         # Audio trigger system (non-fatal; gracefully skipped if audio_manager is None)
         self._init_entity_audio_config(self._bat_audio_manager, "bat")
 
-    def take_damage(self, amount: float, knockback: tuple[float, float] | None = None) -> None:
-        """Apply damage to this enemy. Override in subclasses."""
-        pass
+    @classmethod
+    def _scaled_fly_frames(cls, scale: float) -> list[pg.Surface]:
+        """Scale frames only once per scale bucket; raw frames are decoded once per process."""
+        cache = cls._fly_frames_caches.get(scale)
+        if cache is None:
+            cache = []
+            try:
+                for frame in _get_bat_frames():
+                    original_size = frame.get_size()
+                    scaled_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+                    cache.append(pg.transform.scale(frame, scaled_size))
+                cache = image_cache.pack_frames(cache)
+            except Exception as e:
+                print(f"Error loading bat animation for scale {scale}: {e}")
+                cache = [pg.Surface((int(25 * scale), int(25 * scale)), pg.SRCALPHA) for _ in range(_BAT_FRAME_COUNT)]
+            cls._fly_frames_caches[scale] = cache
+        return cache
 
-    def update(self, dt=None, scroll_speed=0):
+    @classmethod
+    def warm_frame_caches(cls) -> None:
         """
-        Update enemy state each frame.
+        Decode and scale the flight frames for every depth-scale bucket up
+        front, so the first bat wave does not stall gameplay on disk loads.
         """
-        if dt is None: dt = 1.0/60.0
-        
-        # Apply scrolling (move left with the world)
-        self.rect.x -= scroll_speed
-        
-        # Move enemy based on its speed
-        self.rect.x += int(self.speed)
-        
-        # Calculate separation force from other bats in the same group to steer around each other
+        base_scale = HitboxRegistry.get_margins("enemy").scale
+        lo = round(base_scale * 0.85, 1)
+        hi = round(base_scale * 1.15, 1)
+        for tenths in range(round(lo * 10), round(hi * 10) + 1):
+            cls._scaled_fly_frames(round(tenths / 10, 1))
+
+    def reset(self, x: int, y_base: int) -> None:
+        """
+        Re-arm a recycled bat at a new spawn point.
+
+        Per-bat traits (scale, flap speed, bobbing shape) are kept; only the
+        position and the phase of the flight/flap cycles are re-rolled.
+        """
+        self.y_base = y_base
+        self.rect.midleft = (x, y_base)
+        self._sin_phase = random.randint(0, 100) * self._sin_step
+        self.y_avoid_offset = 0.0
+        self.y_avoid_vel = 0.0
+        num_frames = len(self.animations[EnemyState.FLY])
+        self.animation_index = random.uniform(0.0, float(num_frames))
+        self.image = self.animations[EnemyState.FLY][int(self.animation_index) % num_frames]
+
+    def _separation_from_group(self) -> float:
+        """Vertical push away from nearby bats in this bat's first group."""
         separation_y = 0.0
         groups = self.groups()
         if groups:
@@ -128,15 +177,45 @@ class Enemy(EntityAudioMixin, Actor):
                     dx = self.rect.centerx - other.rect.centerx
                     dy = self.rect.centery - other.rect.centery
                     dist = math.hypot(dx, dy)
-                    if dist < 45: # avoidance radius
+                    if dist < _AVOID_RADIUS:
                         if dist == 0:
                             dist = 0.1
-                        push_strength = (45 - dist) / 45.0
+                        push_strength = (_AVOID_RADIUS - dist) / _AVOID_RADIUS
                         # Push vertically based on relative position, breaking tie if centery matches
-                        y_direction = (dy / dist) if dist > 0 else (1.0 if id(self) > id(other) else -1.0)
+                        y_direction = dy / dist
                         if abs(dy) < 5:
                             y_direction = 1.0 if self.rect.centery >= other.rect.centery else -1.0
-                        separation_y += y_direction * push_strength * 3.0
+                        separation_y += y_direction * push_strength * _AVOID_PUSH
+        return separation_y
+
+    def kill(self) -> None:
+        """Remove from all groups and hand the bat back to its pool, if any."""
+        super().kill()
+        if self._pool is not None:
+            self._pool.release(self)
+
+    def take_damage(self, amount: float, knockback: tuple[float, float] | None = None) -> None:
+        """Apply damage to this enemy. Override in subclasses."""
+        pass
+
+    def update(self, dt=None, scroll_speed=0, separation_y: float | None = None):
+        """
+        Update enemy state each frame.
+
+        *separation_y* is the flock's push on this bat when a BatSwarm has
+        already resolved it; otherwise the bat scans its group itself.
+        """
+        if dt is None: dt = 1.0/60.0
+        
+        # Own flight speed plus scrolling with the world; the rect is written
+        # once per frame below (the fallback separation scan needs it early)
+        rect = self.rect
+        x = rect.x + self._dx - scroll_speed
+        
+        # Separation force from other bats so they steer around each other
+        if separation_y is None:
+            rect.x = x
+            separation_y = self._separation_from_group()
 
         # Apply separation to vertical velocity with damping
         self.y_avoid_vel = self.y_avoid_vel * 0.85 + separation_y * 0.15
@@ -147,13 +226,127 @@ class Enemy(EntityAudioMixin, Actor):
             self.y_avoid_offset *= 0.95
             
         # Update sine wave movement for floating effect + separation offset
-        self.time += 1
-        sine_y = self.y_base + self.y_amplitude * math.sin(self.y_frequency * self.time)
-        self.rect.y = int(sine_y + self.y_avoid_offset)
+        phase = self._sin_phase + self._sin_step
+        if phase >= _SIN_TABLE_SIZE:
+            phase -= _SIN_TABLE_SIZE
+        self._sin_phase = phase
+        sine_y = self.y_base + self.y_amplitude * _SIN_TABLE[int(phase) & _SIN_TABLE_MASK]
+        rect.topleft = (x, int(sine_y + self.y_avoid_offset))
         
         # Remove if off-screen to the left
-        if self.rect.right < 0:
+        if x < self._off_screen_x:
             self.kill()
             
         super().update(dt)  # Actor handles animation and base components
         self._update_animation_audio()
+
+
+class EnemyPool:
+    """
+    Free-list of Enemy bats so spawn waves reuse instances instead of
+    constructing (and garbage-collecting) a new sprite per bat.
+
+    Bats handed out by acquire() return themselves here when kill() is
+    called, e.g. after flying off the left edge of the screen.
+    """
+
+    def __init__(self, audio_manager=None, max_size: int = 32) -> None:
+        self._audio_manager = audio_manager
+        self._max_size = max_size
+        self._free: list[Enemy] = []
+
+    def acquire(self, x: int, y_base: int) -> Enemy:
+        """Return a bat positioned with its midleft at (x, y_base)."""
+        if self._free:
+            bat = self._free.pop()
+            bat._in_pool = False
+        else:
+            bat = Enemy(audio_manager=self._audio_manager)
+            bat._pool = self
+        bat.reset(x, y_base)
+        return bat
+
+    def acquire_many(self, spawns: list[tuple[int, int]]) -> list[Enemy]:
+        """Return one bat per ``(x, y_base)`` spawn point, e.g. a whole wave."""
+        acquire = self.acquire
+        return [acquire(x, y_base) for x, y_base in spawns]
+
+    def release(self, bat: Enemy) -> None:
+        """Take back a bat that has been removed from its groups."""
+        if bat._in_pool or len(self._free) >= self._max_size:
+            return
+        bat._in_pool = True
+        self._free.append(bat)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+
+def _rect_centerx(sprite: pg.sprite.Sprite) -> int:
+    return sprite.rect.centerx
+
+
+class BatSwarm(pg.sprite.LayeredUpdates):
+    """
+    Sprite group for the ambient bat flock.
+
+    Bats are layered by their depth scale, so the group already iterates
+    back to front and drawing needs no per-frame depth sort.
+
+    Before the per-bat updates run, bat centres are copied into flat
+    coordinate lists and the separation forces for the whole flock are
+    resolved in one sweep over the bats in x order: each bat only visits
+    the neighbours that follow it within the avoid radius, and a cheap
+    y check and a squared-distance test reject distant pairs before any
+    square root. The flock is then stepped in that same pass order, each
+    bat receiving its force as an argument instead of scanning the group
+    itself or round-tripping it through an attribute.
+    """
+
+    def update(self, dt=None, scroll_speed=0) -> None:
+        bats, forces = self.resolve_separation()
+        others = [s for s in self.sprites() if not isinstance(s, Enemy)] if len(bats) != len(self) else ()
+        for bat, force in zip(bats, forces):
+            bat.update(dt, scroll_speed, force)
+        for sprite in others:
+            sprite.update(dt, scroll_speed)
+
+    def resolve_separation(self) -> tuple[list[Enemy], list[float]]:
+        """Return the flock's bats in x order and each one's separation force."""
+        bats = [s for s in self.sprites() if isinstance(s, Enemy)]
+        # Work in x order directly, so the inner loop indexes flat lists
+        # rather than going through a permutation on every access
+        bats.sort(key=_rect_centerx)
+        count = len(bats)
+        xs = [b.rect.centerx for b in bats]
+        ys = [b.rect.centery for b in bats]
+        forces = [0.0] * count
+        radius = _AVOID_RADIUS
+        radius_sq = radius * radius
+        push_scale = _AVOID_PUSH / radius
+        sqrt = math.sqrt
+
+        for i in range(count):
+            xi, yi = xs[i], ys[i]
+            for j in range(i + 1, count):
+                dx = xs[j] - xi
+                if dx >= radius:
+                    break  # every later bat in x order is farther still
+                yj = ys[j]
+                dy = yi - yj
+                if dy >= radius or dy <= -radius:
+                    continue
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= radius_sq:
+                    continue
+                dist = sqrt(dist_sq) if dist_sq else 0.1
+                push = (radius - dist) * push_scale
+                if -5 < dy < 5:
+                    forces[i] += push if yi >= yj else -push
+                    forces[j] += push if yj >= yi else -push
+                else:
+                    f = dy / dist * push
+                    forces[i] += f
+                    forces[j] -= f
+
+        return bats, forces
@@ -16,7 +16,9 @@ from typing import TYPE_CHECKING, Final, Optional
 import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, Actor, AttackConfig
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
+from .boss_fx import AURA_JITTER, AURA_JITTER_MASK, AlphaFlash
 from ..services import ConfigClient
 
 if TYPE_CHECKING:
@@ -40,6 +42,7 @@ class Fireball(pg.sprite.Sprite):
         self._player = player
         self.direction = direction
         self.speed = 6.0
+        self._dx = int(direction * self.speed)
         self.damage = damage
         self.knockback = knockback
         
@@ -63,9 +66,8 @@ class Fireball(pg.sprite.Sprite):
         if dt is None:
             dt = 1.0 / 60.0
             
-        # Move horizontally
-        self.rect.x -= scroll_speed
-        self.rect.x += int(self.direction * self.speed)
+        # Move horizontally (own speed plus world scroll)
+        self.rect.x += self._dx - scroll_speed
         
         # Destroy if way off screen
         if self.rect.right < -200 or self.rect.left > 2000:
@@ -156,6 +158,9 @@ class FireWizard(EntityAudioMixin, Actor):
         FireWizardState.DEATH: StateConfig(0.15, loops=False, interruptible=False),
     }
 
+    # Index into AURA_JITTER for the recharge aura flicker; advanced in update
+    _aura_tick: int = 0
+
     def __init__(
         self,
         x: int,
@@ -207,6 +212,7 @@ class FireWizard(EntityAudioMixin, Actor):
         self._chase_delay_timer: float = 0.0
         self._chase_delay_active: bool = False
         self._teleport_flash_timer: float = 0.0
+        self._teleport_flash = AlphaFlash()
         self._teleport_after_hurt: bool = False
         
         # Load margins and scale
@@ -266,6 +272,11 @@ class FireWizard(EntityAudioMixin, Actor):
             knockback_force=self.ATTACK_CONFIG.knockback_force * knockback_scale,
         )
         
+        # Seed the Actor's flip cache with the shared mirrored frames so turning
+        # around never flips surfaces per instance
+        for state, frames in self.animations.items():
+            self._animations_flipped[state] = image_cache.flipped(frames)
+
         # Initial state setup
         self.set_state(FireWizardState.IDLE)
         if self.state in self.animations:
@@ -318,12 +329,20 @@ class FireWizard(EntityAudioMixin, Actor):
         except Exception as e:
             print(f"[WARNING] Error applying wizard config: {e}")
 
+    # Scaled frame lists shared across boss spawns, keyed by (path_pattern, count, scale)
+    _frames_cache: dict[tuple[str, int, float], list[pg.Surface]] = {}
+
     def _load_frames(
         self,
         path_pattern: str,
         count: int,
     ) -> list[pg.Surface]:
         """Load and scale animation frames."""
+        cache_key = (path_pattern, count, self.scale)
+        cached = FireWizard._frames_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         frames: list[pg.Surface] = []
         for i in range(count):
             path = path_pattern.format(i)
@@ -341,6 +360,7 @@ class FireWizard(EntityAudioMixin, Actor):
                 
         if not frames:
             raise RuntimeError(f"Failed to load any frames from pattern: {path_pattern}")
+        FireWizard._frames_cache[cache_key] = frames
         return frames
     
     @property
@@ -431,6 +451,7 @@ class FireWizard(EntityAudioMixin, Actor):
             
         # Mana recharge logic
         if self._is_recharging:
+            self._aura_tick = (self._aura_tick + 1) & AURA_JITTER_MASK
             self._mana = min(self._max_mana, self._mana + self._mana_recharge_rate * dt_sec)
             if self._mana >= self._max_mana:
                 self._is_recharging = False
@@ -452,11 +473,12 @@ class FireWizard(EntityAudioMixin, Actor):
             self._trigger_teleport_recharge()
             
         # Apply teleport transparency/glow effect
+        # (on a per-instance copy; the frames are shared with other bosses)
         if self._teleport_flash_timer > 0.0:
             alpha = 100 if int(self._teleport_flash_timer * 30) % 2 == 0 else 200
-            self.image.set_alpha(alpha)
+            self.image = self._teleport_flash.apply(self.image, alpha)
         else:
-            self.image.set_alpha(255)
+            self.image = self._teleport_flash.apply(self.image, None)
         
         # Clean up once death animation is fully finished
         if self.state == FireWizardState.DEATH and int(self.animation_index) >= len(self.animations[FireWizardState.DEATH]) - 1:
@@ -696,5 +718,5 @@ class FireWizard(EntityAudioMixin, Actor):
         
         # Draw charging cyan aura if actively recharging
         if self._is_recharging:
-            glow_radius = int(24 * self.scale + 6 * random.random())
+            glow_radius = int(24 * self.scale + AURA_JITTER[self._aura_tick])
             pg.draw.circle(surface, (0, 191, 255), self.rect.center, glow_radius, 2)
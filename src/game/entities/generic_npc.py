@@ -27,6 +27,7 @@ from enum import Enum
 import pygame as pg
 
 from v3x_zulfiqar_gideon import Actor, AssetManager
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
 
 
@@ -127,16 +128,13 @@ class GenericNPC(Actor):
         self.scale = final_scale
 
         # ── 1. Load IDLE animation frames ──────────────────────────────────
-        raw_idle_frames = AssetManager.get_animation_frames(sprite_dir)
-        if not raw_idle_frames:
+        scaled_idle = image_cache.scaled_frames(sprite_dir, final_scale)
+        if not scaled_idle:
             placeholder = pg.Surface((32, 32), pg.SRCALPHA)
             placeholder.fill((255, 0, 255, 180))
-            raw_idle_frames = [placeholder]
-
-        scaled_idle = [
-            pg.transform.scale(f, (int(f.get_width() * final_scale), int(f.get_height() * final_scale)))
-            for f in raw_idle_frames
-        ]
+            scaled_idle = [
+                pg.transform.scale(placeholder, (int(32 * final_scale), int(32 * final_scale)))
+            ]
         self.animations[_GenericNPCState.IDLE] = scaled_idle
         self.state_configs[_GenericNPCState.IDLE] = type(
             "SC", (), {"animation_speed": frame_duration, "loops": True, "interruptible": False}
@@ -144,12 +142,8 @@ class GenericNPC(Actor):
 
         # ── 2. Load WALK animation frames ──────────────────────────────────
         if self.walk_sprite_dir and os.path.exists(self.walk_sprite_dir):
-            raw_walk_frames = AssetManager.get_animation_frames(self.walk_sprite_dir)
-            if raw_walk_frames:
-                scaled_walk = [
-                    pg.transform.scale(f, (int(f.get_width() * final_scale), int(f.get_height() * final_scale)))
-                    for f in raw_walk_frames
-                ]
+            scaled_walk = image_cache.scaled_frames(self.walk_sprite_dir, final_scale)
+            if scaled_walk:
                 self.animations[_GenericNPCState.WALK] = scaled_walk
                 self.state_configs[_GenericNPCState.WALK] = type(
                     "SC", (), {"animation_speed": frame_duration, "loops": True, "interruptible": False}
@@ -157,12 +151,8 @@ class GenericNPC(Actor):
 
         # ── 3. Load SPAWN animation frames ──────────────────────────────────
         if self.spawn_sprite_dir and os.path.exists(self.spawn_sprite_dir):
-            raw_spawn_frames = AssetManager.get_animation_frames(self.spawn_sprite_dir)
-            if raw_spawn_frames:
-                scaled_spawn = [
-                    pg.transform.scale(f, (int(f.get_width() * final_scale), int(f.get_height() * final_scale)))
-                    for f in raw_spawn_frames
-                ]
+            scaled_spawn = image_cache.scaled_frames(self.spawn_sprite_dir, final_scale)
+            if scaled_spawn:
                 self.animations[_GenericNPCState.SPAWN] = scaled_spawn
                 self.state_configs[_GenericNPCState.SPAWN] = type(
                     "SC", (), {"animation_speed": frame_duration, "loops": False, "interruptible": False}
@@ -170,12 +160,8 @@ class GenericNPC(Actor):
 
         # ── 4. Load DEATH animation frames ──────────────────────────────────
         if self.play_death_on_interact and self.death_sprite_dir and os.path.exists(self.death_sprite_dir):
-            raw_death_frames = AssetManager.get_animation_frames(self.death_sprite_dir)
-            if raw_death_frames:
-                scaled_death = [
-                    pg.transform.scale(f, (int(f.get_width() * final_scale), int(f.get_height() * final_scale)))
-                    for f in raw_death_frames
-                ]
+            scaled_death = image_cache.scaled_frames(self.death_sprite_dir, final_scale)
+            if scaled_death:
                 self.animations[_GenericNPCState.DEATH] = scaled_death
                 self.state_configs[_GenericNPCState.DEATH] = type(
                     "SC", (), {"animation_speed": frame_duration, "loops": False, "interruptible": False}
@@ -326,13 +312,13 @@ class GenericNPC(Actor):
 
         super().update(delta_time)
 
-    def draw(self, surface: pg.Surface) -> None:
+    def draw(self, surface: pg.Surface, current_time_ms: Optional[int] = None) -> None:
         super().draw(surface)
 
         if not self.can_interact:
             return
 
-        ticks = pg.time.get_ticks()
+        ticks = pg.time.get_ticks() if current_time_ms is None else current_time_ms
         alpha = 180 + int(75 * abs(((ticks // 8) % 200 - 100) / 100))
         self._prompt_surface.set_alpha(alpha)
 
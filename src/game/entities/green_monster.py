@@ -18,8 +18,10 @@ from typing import TYPE_CHECKING, Final, Optional
 
 import pygame as pg
 
-from v3x_zulfiqar_gideon import AssetManager, Actor, AttackConfig
+from v3x_zulfiqar_gideon import Actor, AttackConfig
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
+from .boss_fx import AURA_JITTER, AURA_JITTER_MASK, AlphaFlash
 from ..services import ConfigClient
 
 if TYPE_CHECKING:
@@ -44,6 +46,7 @@ class ToxicGlob(pg.sprite.Sprite):
         self._player = player
         self.direction = direction
         self.speed = 5.0
+        self._dx = int(direction * self.speed)
         self._vy = -6.0
         self._gravity = 0.35
         self.damage = damage
@@ -63,8 +66,7 @@ class ToxicGlob(pg.sprite.Sprite):
         self.is_boss = False
 
     def update(self, dt: Optional[float] = None, scroll_speed: int = 0) -> None:
-        self.rect.x -= scroll_speed
-        self.rect.x += int(self.direction * self.speed)
+        self.rect.x += self._dx - scroll_speed
 
         self._vy += self._gravity
         self.rect.y += int(self._vy)
@@ -91,6 +93,8 @@ class ToxicGlob(pg.sprite.Sprite):
 class MagicShotProjectile(pg.sprite.Sprite):
     """An animated magic projectile fired during Gatekeeper's Enraged phase."""
 
+    _FRAME_DURATION: Final[float] = 1.0 / 25.0
+
     def __init__(
         self,
         x: int,
@@ -105,22 +109,21 @@ class MagicShotProjectile(pg.sprite.Sprite):
         self._player = player
         self.direction = direction
         self.speed = 8.5
+        self._dx = int(direction * self.speed)
         self.damage = damage
         self.knockback = knockback
 
-        raw_frames = AssetManager.get_animation_frames("assets/graphics/Magic shots/1")
-        if not raw_frames:
+        # Scaled shot frames are shared by every projectile at this scale
+        self.frames: list[pg.Surface] = image_cache.scaled_frames("assets/graphics/Magic shots/1", scale * 1.5)
+        if not self.frames:
             surf = pg.Surface((28, 28), pg.SRCALPHA)
             pg.draw.circle(surf, (200, 50, 255), (14, 14), 12)
-            raw_frames = [surf]
-
-        self.frames: list[pg.Surface] = []
-        for frame in raw_frames:
-            w = int(frame.get_width() * scale * 1.5)
-            h = int(frame.get_height() * scale * 1.5)
-            self.frames.append(pg.transform.scale(frame, (w, h)))
+            size = int(28 * scale * 1.5)
+            self.frames = [pg.transform.scale(surf, (size, size))]
 
-        self.frame_index: float = 0.0
+        self._frame_count = len(self.frames)
+        self.frame_index = 0
+        self._frame_timer = 0.0
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=(x, y))
         self.is_projectile = True
@@ -128,11 +131,16 @@ class MagicShotProjectile(pg.sprite.Sprite):
 
     def update(self, dt: Optional[float] = None, scroll_speed: int = 0) -> None:
         delta = dt if dt is not None else 0.016
-        self.rect.x -= scroll_speed
-        self.rect.x += int(self.direction * self.speed)
+        self.rect.x += self._dx - scroll_speed
 
-        self.frame_index = (self.frame_index + delta * 25) % len(self.frames)
-        self.image = self.frames[int(self.frame_index)]
+        self._frame_timer += delta
+        if self._frame_timer >= self._FRAME_DURATION:
+            while self._frame_timer >= self._FRAME_DURATION:
+                self._frame_timer -= self._FRAME_DURATION
+                self.frame_index += 1
+            if self.frame_index >= self._frame_count:
+                self.frame_index %= self._frame_count
+            self.image = self.frames[self.frame_index]
 
         if self.rect.right < -200 or self.rect.left > 2200:
             self.kill()
@@ -175,6 +183,13 @@ class StateConfig:
     interruptible: bool = True
 
 
+# Slam dive arc sin(p * pi) sampled over progress p in [0, 1]
+_DIVE_ARC_STEPS: Final[int] = 64
+_DIVE_ARC: Final[tuple[float, ...]] = tuple(
+    math.sin(i / _DIVE_ARC_STEPS * math.pi) for i in range(_DIVE_ARC_STEPS + 1)
+)
+
+
 class GreenMonster(EntityAudioMixin, Actor):
     """
     The Gatekeeper -- a hovering elite enemy. Keeps just out of easy reach,
@@ -201,6 +216,9 @@ class GreenMonster(EntityAudioMixin, Actor):
     # Frame (within the 9-frame "2atk" clip) at which the toxic glob is released.
     _SPIT_RELEASE_FRAME: Final[int] = 5
 
+    # Index into AURA_JITTER for the recharge aura flicker; advanced in update
+    _aura_tick: int = 0
+
     def __init__(
         self,
         x: int,
@@ -256,6 +274,7 @@ class GreenMonster(EntityAudioMixin, Actor):
         self._chase_delay_timer: float = 0.0
         self._chase_delay_active: bool = False
         self._teleport_flash_timer: float = 0.0
+        self._teleport_flash = AlphaFlash()
         self._teleport_after_hurt: bool = False
 
         # Load margins/scale via the shared "boss:<folder>" registry convention
@@ -317,6 +336,19 @@ class GreenMonster(EntityAudioMixin, Actor):
             knockback_force=self.ATTACK_CONFIG.knockback_force * knockback_scale,
         )
 
+        # Seed the Actor's flip cache with the shared mirrored frames so turning
+        # around never flips surfaces per instance. ATTACK swaps between the slam
+        # and spit lists at runtime, so it keeps the lazy per-instance flip.
+        for state, folder in (
+            (GatekeeperState.IDLE, "idle"),
+            (GatekeeperState.CHASE, "walk"),
+            (GatekeeperState.HURT, "hurt"),
+            (GatekeeperState.DEATH, "death"),
+        ):
+            self._animations_flipped[state] = image_cache.scaled_frames(
+                f"{self._base_path}/{folder}", self.scale, flip=True
+            )
+
         # Initial state/frame
         self.set_state(GatekeeperState.IDLE)
         if self.state in self.animations:
@@ -359,18 +391,14 @@ class GreenMonster(EntityAudioMixin, Actor):
             print(f"[WARNING] Error applying green_monster config overrides: {e}")
 
     def _load_scaled(self, folder: str) -> list[pg.Surface]:
-        """Load every frame in a folder (natural-sorted) and scale it."""
-        frames = AssetManager.get_animation_frames(folder)
+        """Load every frame in a folder (natural-sorted) and scale it.
+
+        The scaled list is shared with every other Gatekeeper at this scale.
+        """
+        frames = image_cache.scaled_frames(folder, self.scale)
         if not frames:
             raise RuntimeError(f"Failed to load any frames from '{folder}'")
-        if self.scale == 1.0:
-            return list(frames)
-        scaled = []
-        for frame in frames:
-            w = int(frame.get_width() * self.scale)
-            h = int(frame.get_height() * self.scale)
-            scaled.append(pg.transform.scale(frame, (w, h)))
-        return scaled
+        return frames
 
     # ── Combat interface (mirrors Skeleton/FireWizard) ─────────────────────
     @property
@@ -462,6 +490,7 @@ class GreenMonster(EntityAudioMixin, Actor):
 
         # Mana recovery
         if self._is_recharging:
+            self._aura_tick = (self._aura_tick + 1) & AURA_JITTER_MASK
             self._mana = min(self._max_mana, self._mana + self._mana_recharge_rate * dt_sec)
             if self._mana >= self._max_mana:
                 self._is_recharging = False
@@ -488,11 +517,12 @@ class GreenMonster(EntityAudioMixin, Actor):
             self._trigger_teleport_recharge()
 
         # Apply teleport transparency/glow effect
+        # (on a per-instance copy; the frames are shared with other bosses)
         if self._teleport_flash_timer > 0.0:
             alpha = 100 if int(self._teleport_flash_timer * 30) % 2 == 0 else 200
-            self.image.set_alpha(alpha)
+            self.image = self._teleport_flash.apply(self.image, alpha)
         else:
-            self.image.set_alpha(255)
+            self.image = self._teleport_flash.apply(self.image, None)
 
         # Clean up once death animation is fully finished
         if (
@@ -507,7 +537,7 @@ class GreenMonster(EntityAudioMixin, Actor):
             frames = self._attack_slam_frames
             progress = self.animation_index / max(1, len(frames) - 1)
             # sin wave: 0 -> 1 -> 0
-            dive = math.sin(min(1.0, progress) * math.pi)
+            dive = _DIVE_ARC[int(min(1.0, progress) * _DIVE_ARC_STEPS)]
             # Scale the jump height based on his size/scale
             jump_height = int(90 * self.scale)
             self.rect.bottom = int(self._ground_y - dive * jump_height)
@@ -752,5 +782,5 @@ class GreenMonster(EntityAudioMixin, Actor):
 
         # Draw charging green aura if actively recharging
         if self._is_recharging:
-            glow_radius = int(24 * self.scale + 6 * random.random())
+            glow_radius = int(24 * self.scale + AURA_JITTER[self._aura_tick])
             pg.draw.circle(surface, (50, 205, 50), self.rect.center, glow_radius, 2)
@@ -53,6 +53,7 @@ import json
 import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, Actor, FootstepController
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
 from ..services import ConfigClient
 from ..controls_manager import ControlsManager
@@ -68,6 +69,10 @@ from v3x_zulfiqar_gideon import (
 if TYPE_CHECKING:
     from v3x_zulfiqar_gideon import AudioManager
 
+# Bound once instead of resolved every update. pg.key.get_pressed stays a
+# dotted lookup: simulation autoplay swaps it out at runtime.
+_get_ticks = pg.time.get_ticks
+
 
 class PlayerState(Enum):
     """
@@ -138,6 +143,51 @@ class StateConfig:
     locks_input: bool = False
 
 
+@dataclass(slots=True)
+class InputSnapshot:
+    """
+    Per-frame resolution of every player action binding.
+
+    Built once at the top of ``Player.update`` so input handling and the
+    defend hold check read plain booleans instead of re-walking the
+    ControlsManager bindings for each consumer.
+    """
+
+    move_left: bool = False
+    move_right: bool = False
+    jump: bool = False
+    attack_thrust: bool = False
+    attack_smash: bool = False
+    attack_power: bool = False
+    defend: bool = False
+    roll: bool = False
+    dash: bool = False
+    special_attack: bool = False
+    transform: bool = False
+
+    @classmethod
+    def capture(
+        cls,
+        keys: pg.key.ScancodeWrapper,
+        joystick: Optional[pg.joystick.JoystickType],
+    ) -> "InputSnapshot":
+        """Resolve all actions from one keyboard/joystick poll."""
+        pressed = ControlsManager().is_action_pressed
+        return cls(
+            move_left=pressed("MOVE_LEFT", keys, joystick),
+            move_right=pressed("MOVE_RIGHT", keys, joystick),
+            jump=pressed("JUMP", keys, joystick),
+            attack_thrust=pressed("ATTACK_THRUST", keys, joystick),
+            attack_smash=pressed("ATTACK_SMASH", keys, joystick),
+            attack_power=pressed("ATTACK_POWER", keys, joystick),
+            defend=pressed("DEFEND", keys, joystick),
+            roll=pressed("ROLL", keys, joystick),
+            dash=pressed("DASH", keys, joystick),
+            special_attack=pressed("SPECIAL_ATTACK", keys, joystick),
+            transform=pressed("TRANSFORM", keys, joystick),
+        )
+
+
 class Player(Actor):
     def to_dict(self) -> dict:
         """Return a JSON‑serializable representation of the player."""
@@ -692,6 +742,11 @@ class Player(Actor):
         
         self._audio_manager: AudioManager = audio_manager
         self._joystick: Optional[pg.joystick.JoystickType] = None
+        # Device count only changes on hotplug; re-polled after refresh_joystick()
+        self._joystick_stale: bool = True
+        # Most recent frame's resolved input, for readers outside Player.update
+        # (e.g. the gameplay tracker) so they need not poll the devices again
+        self.input_snapshot: InputSnapshot = InputSnapshot()
         
         # State machine configuration (from static registry, dynamically overridden from config if present)
         self.state_configs = dict(self._STATE_CONFIGS)
@@ -858,6 +913,10 @@ class Player(Actor):
         surf = pg.display.get_surface()
         height = surf.get_height() if surf else 720
         self._ground_y: int = height - margins.ground_offset
+        self._screen_w: int = surf.get_width() if surf else 1280
+        # Derived ground thresholds used by the per-frame grounded checks
+        self._grounded_bottom: int = self._ground_y - 1
+        self._jump_floor_y: int = self._ground_y - self._AIRBORNE_THRESHOLD
         
         # Movement state
         self._direction: int = 0
@@ -880,9 +939,25 @@ class Player(Actor):
         # Add this line with other state variables
         self._defend_handled = False  
 
+    # Validated audio configs keyed by id(audio_manager). Validation hashes
+    # every referenced sound file and preloading decodes them, so a player
+    # rebuilt on restart reuses the first result; the dict is read-only.
+    _audio_config_cache: dict[int, dict] = {}
+
+    @classmethod
+    def clear_audio_config_cache(cls) -> None:
+        """Forget the loaded config so the next Player re-reads it from disk."""
+        Player._audio_config_cache.clear()
+
     def _init_audio_config(self, audio_manager: AudioManager) -> None:
         """Load, validate, and register dynamic audio configurations."""
+        cached = Player._audio_config_cache.get(id(audio_manager))
+        if cached is not None:
+            self._custom_audio_config = cached
+            return
+
         from src.game.audio.audio_lock import verify_config_integrity, save_config_and_lock, AudioValidationError
+        from src.game.audio.sound_preload import preload_sounds
         config_path = "game_data/player_audio_config.json"
         lock_path = "game_data/player_audio_config.lock"
         
@@ -936,10 +1011,8 @@ class Player(Actor):
             raise AudioValidationError(f"Failed to load player audio config: {e}")
             
         # Pre-load sounds into the audio manager if needed
-        sounds = self._custom_audio_config.get("sounds", {})
-        for sound_name, file_path in sounds.items():
-            if file_path and sound_name not in audio_manager.sound_library:
-                audio_manager.load_sound(sound_name, file_path)
+        preload_sounds(audio_manager, self._custom_audio_config.get("sounds", {}), label="Player")
+        Player._audio_config_cache[id(audio_manager)] = self._custom_audio_config
         
     def _load_all_animations(self) -> None:
         scale = self.scale
@@ -1028,6 +1101,10 @@ class Player(Actor):
         # Frames before this play as the "raise" intro; frames after play on release.
         self._DEFEND_HOLD_FRAME = 3
     
+    # Scaled frame lists shared by every Player (one per run/level), keyed by
+    # (path_pattern, count, start_index, scale_factor)
+    _frames_cache: dict[tuple[str, int, int, float], list[pg.Surface]] = {}
+
     def _load_frames(
         self,
         path_pattern: str,
@@ -1047,6 +1124,11 @@ class Player(Actor):
         Returns:
             List of scaled pygame Surface objects.
         """
+        cache_key = (path_pattern, count, start_index, scale_factor)
+        cached = Player._frames_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         frames: list[pg.Surface] = []
         
         for i in range(start_index, start_index + count):
@@ -1063,6 +1145,8 @@ class Player(Actor):
             except (FileNotFoundError, pg.error) as e:
                 print(f"Warning: Failed to load frame '{path}': {e}")
                 
+        if frames:
+            Player._frames_cache[cache_key] = frames
         return frames
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -1378,7 +1462,7 @@ class Player(Actor):
         if self._stamina < self._THRUST_STAMINA_COST:
             return False
         # Ground attacks require the player to be on the ground
-        if self.rect.bottom < self._ground_y - 1:
+        if self.rect.bottom < self._grounded_bottom:
             return False
         if not self._can_transition_to(PlayerState.ATTACK_THRUST):
             return False
@@ -1410,7 +1494,7 @@ class Player(Actor):
         if self._stamina < self._SMASH_STAMINA_COST:
             return False
         # Ground attacks require the player to be on the ground
-        if self.rect.bottom < self._ground_y - 1:
+        if self.rect.bottom < self._grounded_bottom:
             return False
         if not self._can_transition_to(PlayerState.ATTACK_SMASH):
             return False
@@ -1442,7 +1526,7 @@ class Player(Actor):
         if self._stamina < self._POWER_STAMINA_COST:
             return False
         # Ground attacks require the player to be on the ground
-        if self.rect.bottom < self._ground_y - 1:
+        if self.rect.bottom < self._grounded_bottom:
             return False
         if not self._can_transition_to(PlayerState.ATTACK_POWER):
             return False
@@ -1492,7 +1576,7 @@ class Player(Actor):
             return False
         if not self._can_transition_to(PlayerState.ROLL):
             return False
-        on_ground = self.rect.bottom >= self._ground_y - 1
+        on_ground = self.rect.bottom >= self._grounded_bottom
         if not on_ground:
             return False
         self._spend_stamina(self._ROLL_STAMINA_COST)
@@ -1576,22 +1660,24 @@ class Player(Actor):
         Returns:
             True if jump started, False if not grounded, low stamina, or blocked.
         """
-        if self._stamina < self._JUMP_STAMINA_COST:
+        if not self._can_jump():
             return False
-            
-        # Must be on ground
-        if self.rect.bottom < self._ground_y - self._AIRBORNE_THRESHOLD:
-            return False
-            
-        if not self._can_transition_to(PlayerState.JUMP_UP):
-            return False
-            
+
         self._gravity = self._JUMP_VELOCITY
         self._transition_to(PlayerState.JUMP_UP)
         self._spend_stamina(self._JUMP_STAMINA_COST)
         self._audio_manager.play_sound("jump_grunt")
         self._audio_manager.play_sound("jump")
         return True
+
+    def _can_jump(self) -> bool:
+        """Whether a jump could start this frame (stamina, grounded, state)."""
+        return (
+            self._stamina >= self._JUMP_STAMINA_COST
+            # Must be on ground
+            and self.rect.bottom >= self._jump_floor_y
+            and self._can_transition_to(PlayerState.JUMP_UP)
+        )
     
     def grant_invincibility(self, duration: float) -> None:
         """
@@ -1652,8 +1738,13 @@ class Player(Actor):
             return StateConfig()
         return self.state_configs.get(self.state, StateConfig())
 
-    def player_input(self) -> None:
-        """Process player input and update movement/action state."""
+    def player_input(self, keys=None, joystick=None, snapshot: Optional[InputSnapshot] = None) -> None:
+        """Process player input and update movement/action state.
+
+        ``snapshot`` is the per-frame input resolved by ``update``; when
+        omitted it is captured here from ``keys``/``joystick`` (polled if
+        those are omitted too).
+        """
         config = self._get_current_config()
         
         # Input locked during certain states or cinematic locks
@@ -1661,18 +1752,28 @@ class Player(Actor):
             self._direction = 0
             return
             
-        keys = pg.key.get_pressed()
-        joystick = self._get_joystick()
+        if snapshot is None:
+            if keys is None:
+                keys = pg.key.get_pressed()
+                joystick = self._get_joystick()
+            snapshot = InputSnapshot.capture(keys, joystick)
         
         # Movement input (only if not locked)
         if not config.locks_movement:
-            self._process_movement_input(keys, joystick)
+            self._process_movement_input(snapshot)
         
         # Action input
-        self._process_action_input(keys, joystick)
+        self._process_action_input(snapshot)
     
+    def refresh_joystick(self) -> None:
+        """Re-detect the gamepad on the next input poll (call on hotplug)."""
+        self._joystick_stale = True
+
     def _get_joystick(self) -> Optional[pg.joystick.JoystickType]:
         """Get the first connected joystick, if any."""
+        if not self._joystick_stale:
+            return self._joystick
+        self._joystick_stale = False
         if pg.joystick.get_count() > 0:
             if self._joystick is None:
                 try:
@@ -1710,59 +1811,45 @@ class Player(Actor):
             pass
         return False
 
-    def _process_movement_input(
-        self,
-        keys: pg.key.ScancodeWrapper,
-        joystick: Optional[pg.joystick.JoystickType],
-    ) -> None:
-        """Process horizontal movement input via ControlsManager."""
-        controls_mgr = ControlsManager()
-        move_left = controls_mgr.is_action_pressed("MOVE_LEFT", keys, joystick)
-        move_right = controls_mgr.is_action_pressed("MOVE_RIGHT", keys, joystick)
-        
-        if move_left:
+    def _process_movement_input(self, snapshot: InputSnapshot) -> None:
+        """Process horizontal movement input from the frame's snapshot."""
+        if snapshot.move_left:
             self._direction = -1
             self.facing_left = True
-        elif move_right:
+        elif snapshot.move_right:
             self._direction = 1
             self.facing_left = False
         else:
             self._direction = 0
     
-    def _process_action_input(
-        self,
-        keys: pg.key.ScancodeWrapper,
-        joystick: Optional[pg.joystick.JoystickType],
-    ) -> None:
-        """Process action button input via ControlsManager."""
-        controls_mgr = ControlsManager()
-
-        if controls_mgr.is_action_pressed("JUMP", keys, joystick):
+    def _process_action_input(self, snapshot: InputSnapshot) -> None:
+        """Process action button input from the frame's snapshot."""
+        if snapshot.jump and self._can_jump():
             self.jump()
 
-        if controls_mgr.is_action_pressed("ATTACK_THRUST", keys, joystick):
+        if snapshot.attack_thrust:
             self.attack_thrust()
 
-        if controls_mgr.is_action_pressed("ATTACK_SMASH", keys, joystick):
+        if snapshot.attack_smash:
             self.attack_smash()
 
-        if controls_mgr.is_action_pressed("ATTACK_POWER", keys, joystick):
+        if snapshot.attack_power:
             self.attack_power()
 
-        if controls_mgr.is_action_pressed("DEFEND", keys, joystick):
+        if snapshot.defend:
             if self.state != PlayerState.DEFEND:   # don't re-trigger mid-defend
                 self.defend()
 
-        if controls_mgr.is_action_pressed("ROLL", keys, joystick):
+        if snapshot.roll:
             self.roll()
 
-        if controls_mgr.is_action_pressed("DASH", keys, joystick):
+        if snapshot.dash:
             self.dash()
 
-        if controls_mgr.is_action_pressed("SPECIAL_ATTACK", keys, joystick):
+        if snapshot.special_attack:
             self.special_attack()
 
-        if controls_mgr.is_action_pressed("TRANSFORM", keys, joystick):
+        if snapshot.transform:
             self.transform()
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -1771,6 +1858,11 @@ class Player(Actor):
 
     def _apply_gravity(self) -> None:
         """Apply gravitational acceleration and ground collision."""
+        # Resting on the ground: the integrate-then-clamp below is a no-op
+        if self._gravity == 0.0 and self.rect.bottom >= self._ground_y:
+            self.rect.bottom = self._ground_y
+            return
+
         self._gravity += self._GRAVITY_ACCELERATION
         self.rect.y += int(self._gravity)
 
@@ -1802,7 +1894,7 @@ class Player(Actor):
                 return
 
             # Use different speeds for ground and air movement
-            if self.rect.bottom >= self._ground_y - 1:  # On ground
+            if self.rect.bottom >= self._grounded_bottom:  # On ground
                 move_speed = self._MOVE_SPEED
             else:  # In air
                 move_speed = self._AIR_MOVE_SPEED
@@ -1810,10 +1902,8 @@ class Player(Actor):
             self.rect.x += int(self._direction * move_speed)
 
         # Clamp to screen bounds
-        screen_surf = pg.display.get_surface()
-        screen_w = screen_surf.get_width() if screen_surf else 1280
         self.rect.left = max(self.rect.left, self._SCREEN_BOUND_LEFT)
-        self.rect.right = min(self.rect.right, int(screen_w * self.right_bound_ratio))
+        self.rect.right = min(self.rect.right, int(self._screen_w * self.right_bound_ratio))
 
     # ─────────────────────────────────────────────────────────────────────────
     # State Transition Helpers
@@ -1851,6 +1941,13 @@ class Player(Actor):
         orig_animations = self.animations
         if self._is_enhanced:
             self.animations = self.enhanced_animations
+        # Facing left needs mirrored frames: hand the Actor the process-wide
+        # copy instead of letting every Player (and every transform) re-flip
+        state = self.state
+        if self.facing_left and state not in self._animations_flipped:
+            frames = self.animations.get(state)
+            if frames:
+                self._animations_flipped[state] = image_cache.flipped(frames)
         try:
             super().update_animation(dt)
         finally:
@@ -1862,7 +1959,7 @@ class Player(Actor):
 
     def _update_state_logic(self) -> None:
         """Auto-manage state transitions based on physics (grounded, airborne, etc.)."""
-        on_ground = self.rect.bottom >= self._ground_y - 1
+        on_ground = self.rect.bottom >= self._grounded_bottom
 
         # Airborne state management
         if not on_ground:
@@ -1890,16 +1987,19 @@ class Player(Actor):
             if self.state != PlayerState.IDLE:
                 self._transition_to(PlayerState.IDLE)
 
-    def _update_defend_logic(self) -> None:
+    def _update_defend_logic(self, snapshot: Optional[InputSnapshot] = None) -> None:
         """Handle defend animation hold/release behavior."""
         if self.state != PlayerState.DEFEND:
             self._defend_releasing = False
             return
 
-        # Check if defend button is still held via ControlsManager
-        keys = pg.key.get_pressed()
-        joystick = self._get_joystick()
-        defend_held = ControlsManager().is_action_pressed("DEFEND", keys, joystick)
+        # Check if defend button is still held
+        if snapshot is None:
+            defend_held = ControlsManager().is_action_pressed(
+                "DEFEND", pg.key.get_pressed(), self._get_joystick()
+            )
+        else:
+            defend_held = snapshot.defend
 
         current_frame = int(self.animation_index)
 
@@ -1970,7 +2070,7 @@ class Player(Actor):
         else:
             self._stamina = min(self._max_stamina, self._stamina + self._STAMINA_REGEN_RATE * dt)
 
-    def update(self, dt: Optional[float] = None) -> None:
+    def update(self, dt: Optional[float] = None, current_time_ms: Optional[int] = None) -> None:
         if dt is None: dt = 1.0 / 60.0
 
         if self._invincibility_timer > 0:
@@ -1978,23 +2078,25 @@ class Player(Actor):
 
         self._update_resources(dt)
 
-        self.player_input()
+        # One input snapshot per frame, shared by input and defend handling
+        snapshot = InputSnapshot.capture(pg.key.get_pressed(), self._get_joystick())
+        self.input_snapshot = snapshot
+
+        self.player_input(snapshot=snapshot)
         self._apply_gravity()
         self._apply_movement()
         self._update_state_logic()
-        self._update_defend_logic()
+        self._update_defend_logic(snapshot)
         
         super().update(dt)
 
         self._update_attack_audio()
-        if self.state == PlayerState.RUN:
-             self._footsteps.try_play(active=True, current_time_ms=pg.time.get_ticks())
-        else:
-             self._footsteps.try_play(active=False, current_time_ms=pg.time.get_ticks())
+        now = _get_ticks() if current_time_ms is None else current_time_ms
+        self._footsteps.try_play(active=self.state == PlayerState.RUN, current_time_ms=now)
         
         # Visual feedback for invincibility (skip during HURT/DEFEND)
         if self.is_invincible and self.state not in (PlayerState.HURT, PlayerState.DEFEND):
-            if int(pg.time.get_ticks() / 100) % 2 == 0:
+            if (now // 100) % 2 == 0:
                 self.image.set_alpha(128)
             else:
                 self.image.set_alpha(255)
@@ -16,6 +16,7 @@ import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, Actor, AttackConfig
 from src.game.audio.entity_audio_mixin import EntityAudioMixin
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
 from ..services import ConfigClient
 
@@ -67,6 +68,14 @@ class Skeleton(EntityAudioMixin, Actor):
         SkeletonState.DEATH: StateConfig(0.15, loops=False, interruptible=False),
     }
 
+    # Health bar geometry; one pre-rendered bar per fill width, built on first draw
+    _HEALTH_BAR_WIDTH: Final[int] = 40
+    _HEALTH_BAR_HEIGHT: Final[int] = 5
+    _health_bar_cache: list[pg.Surface] = []
+
+    # Scaled frame lists shared by every skeleton, keyed by (path_pattern, count, scale)
+    _frame_cache: dict[tuple[str, int, float], list[pg.Surface]] = {}
+
     def __init__(
         self,
         x: int,
@@ -148,6 +157,10 @@ class Skeleton(EntityAudioMixin, Actor):
                 tag_to_folders.setdefault(tag, []).append(os.path.join(sprite_root, sub))
                 
             def load_from_folders(folders: list[str]) -> list[pg.Surface]:
+                cache_key = ("|".join(folders), -1, self.scale)
+                cached = Skeleton._frame_cache.get(cache_key)
+                if cached is not None:
+                    return cached
                 frames = []
                 for f in folders:
                     raw = AssetManager.get_animation_frames(f)
@@ -155,6 +168,8 @@ class Skeleton(EntityAudioMixin, Actor):
                         w = int(frame.get_width() * self.scale)
                         h = int(frame.get_height() * self.scale)
                         frames.append(pg.transform.scale(frame, (w, h)))
+                if frames:
+                    Skeleton._store_frames(cache_key, frames)
                 return frames
                 
             if "idle" in tag_to_folders:
@@ -186,18 +201,9 @@ class Skeleton(EntityAudioMixin, Actor):
                 self.scale *= 1.8
                 # Scale all pre-loaded animation frames to boss scale
                 for state in list(self.animations.keys()):
-                    self.animations[state] = [
-                        pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                        for img in self.animations[state]
-                    ]
-                self._attack1_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                    for img in self._attack1_frames
-                ]
-                self._attack2_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.8), int(img.get_height() * 1.8)))
-                    for img in self._attack2_frames
-                ]
+                    self.animations[state] = self._tier_scaled(self.animations[state], 1.8)
+                self._attack1_frames = self._tier_scaled(self._attack1_frames, 1.8)
+                self._attack2_frames = self._tier_scaled(self._attack2_frames, 1.8)
             self._max_health = custom_health if custom_health is not None else 150.0
             self._speed = 3.2
             damage_scale = 3.0
@@ -212,18 +218,9 @@ class Skeleton(EntityAudioMixin, Actor):
                 self.scale *= 1.3
                 # Scale all pre-loaded animation frames to elite scale
                 for state in list(self.animations.keys()):
-                    self.animations[state] = [
-                        pg.transform.scale(img, (int(img.get_width() * 1.3), int(img.get_height() * 1.3)))
-                        for img in self.animations[state]
-                    ]
-                self._attack1_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.3), int(img.get_height() * 1.3)))
-                    for img in self._attack1_frames
-                ]
-                self._attack2_frames = [
-                    pg.transform.scale(img, (int(img.get_width() * 1.3), int(img.get_height() * 1.3)))
-                    for img in self._attack2_frames
-                ]
+                    self.animations[state] = self._tier_scaled(self.animations[state], 1.3)
+                self._attack1_frames = self._tier_scaled(self._attack1_frames, 1.3)
+                self._attack2_frames = self._tier_scaled(self._attack2_frames, 1.3)
             self._max_health = custom_health if custom_health is not None else 60.0
             self._speed = 3.2
             damage_scale = 1.6
@@ -292,6 +289,12 @@ class Skeleton(EntityAudioMixin, Actor):
             knockback_force=self.ATTACK_2_CONFIG.knockback_force * knockback_scale,
         )
         
+        # Seed the Actor's flip cache with the shared mirrored frames so facing
+        # right never flips surfaces per instance
+        for state, frames in self.animations.items():
+            if frames:
+                self._animations_flipped[state] = image_cache.flipped(frames)
+
         # Initial setup
         self.set_state(SkeletonState.IDLE)
         if self.state in self.animations:
@@ -308,6 +311,7 @@ class Skeleton(EntityAudioMixin, Actor):
         surf = pg.display.get_surface()
         height = surf.get_height() if surf else 720
         self._ground_y: int = height - margins.ground_offset
+        self._screen_w: int = surf.get_width() if surf else 1280
         
         # AI configuration
         if not hasattr(self, "_detection_range"):
@@ -334,6 +338,10 @@ class Skeleton(EntityAudioMixin, Actor):
     ) -> list[pg.Surface]:
         """
         Load and scale animation frames from a file pattern.
+
+        Results are cached at class level, so every skeleton spawned with the
+        same pattern and scale shares one list of surfaces (and one mirrored
+        copy for facing right).
         
         Args:
             path_pattern: Format string for frame paths with index placeholder.
@@ -349,6 +357,11 @@ class Skeleton(EntityAudioMixin, Actor):
         if scale_factor is None:
             scale_factor = self.scale
 
+        cache_key = (path_pattern, count, scale_factor)
+        cached = Skeleton._frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         frames: list[pg.Surface] = []
         
         for i in range(count):
@@ -370,8 +383,31 @@ class Skeleton(EntityAudioMixin, Actor):
             raise RuntimeError(
                 f"Failed to load any frames from pattern: {path_pattern}"
             )
-            
+
+        Skeleton._store_frames(cache_key, frames)
         return frames
+
+    @staticmethod
+    def _tier_scaled(frames: list[pg.Surface], factor: float) -> list[pg.Surface]:
+        """
+        Return a cached frame list rescaled by a tier *factor*, shared by every
+        spawn of that tier (the source lists are cached, so their ids stay valid).
+        """
+        cache_key = (f"tier:{id(frames)}", len(frames), factor)
+        cached = Skeleton._frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        scaled = [
+            pg.transform.scale(img, (int(img.get_width() * factor), int(img.get_height() * factor)))
+            for img in frames
+        ]
+        Skeleton._store_frames(cache_key, scaled)
+        return scaled
+
+    @staticmethod
+    def _store_frames(cache_key: tuple[str, int, float], frames: list[pg.Surface]) -> None:
+        """Cache a scaled frame list shared by every skeleton."""
+        Skeleton._frame_cache[cache_key] = frames
     
     # ─────────────────────────────────────────────────────────────────────────
     # Public API: Combat and State Inspection
@@ -422,6 +458,9 @@ class Skeleton(EntityAudioMixin, Actor):
     def update(self, dt: Optional[float] = None, scroll_speed: int = 0) -> None:
         if dt is None: dt = 1.0 / 60.0
         self.rect.x -= scroll_speed
+
+        if self._is_dormant():
+            return
         
         # Apply horizontal knockback velocity
         if abs(self._knockback_vel_x) > 0.1:
@@ -508,6 +547,20 @@ class Skeleton(EntityAudioMixin, Actor):
         if self.state == SkeletonState.CHASE:
             self._chase_player(player_rect)
     
+    def _is_dormant(self) -> bool:
+        """
+        True when an idle, grounded skeleton is off-screen and beyond its
+        detection range. The AI would keep it IDLE and nothing of it is
+        visible, so update() only scrolls it with the world.
+        """
+        if self.state != SkeletonState.IDLE or self._player is None:
+            return False
+        if self.rect.bottom < self._ground_y or self._knockback_vel_x != 0.0:
+            return False
+        if self.rect.right >= 0 and self.rect.left <= self._screen_w:
+            return False
+        return abs(self.rect.centerx - self._player.rect.centerx) >= self._detection_range
+
     def _begin_attack(self) -> None:
         if random.random() < 0.5:
             # Primary attack animation
@@ -533,6 +586,11 @@ class Skeleton(EntityAudioMixin, Actor):
     
     def _apply_gravity(self) -> None:
         """Apply gravitational acceleration and ground collision."""
+        # Resting on the ground: the integrate-then-clamp below is a no-op
+        if self._gravity == 0.0 and self.rect.bottom >= self._ground_y:
+            self.rect.bottom = self._ground_y
+            return
+
         self._gravity += 1.0
         self.rect.y += int(self._gravity)
         
@@ -564,22 +622,22 @@ class Skeleton(EntityAudioMixin, Actor):
     
     def _draw_health_bar(self, surface: pg.Surface) -> None:
         """Render the health bar above the skeleton."""
-        bar_width: int = 40
-        bar_height: int = 5
-        bar_x: int = self.rect.centerx - bar_width // 2
-        bar_y: int = self.rect.top - 10
-        
-        # Background (empty health)
-        pg.draw.rect(
-            surface,
-            (50, 50, 50),
-            (bar_x, bar_y, bar_width, bar_height),
-        )
-        
-        # Current health (red fill)
+        bars = Skeleton._health_bar_cache
+        if not bars:
+            bars.extend(Skeleton._build_health_bar(fill) for fill in range(self._HEALTH_BAR_WIDTH + 1))
+
         health_ratio = self._health / self._max_health
-        pg.draw.rect(
-            surface,
-            (255, 0, 0),
-            (bar_x, bar_y, int(bar_width * health_ratio), bar_height),
-        )
\ No newline at end of file
+        fill = max(0, min(self._HEALTH_BAR_WIDTH, int(self._HEALTH_BAR_WIDTH * health_ratio)))
+        surface.blit(
+            bars[fill],
+            (self.rect.centerx - self._HEALTH_BAR_WIDTH // 2, self.rect.top - 10),
+        )
+
+    @classmethod
+    def _build_health_bar(cls, fill: int) -> pg.Surface:
+        """Pre-render one bar: grey background (empty health) with *fill* px of red."""
+        bar = pg.Surface((cls._HEALTH_BAR_WIDTH, cls._HEALTH_BAR_HEIGHT))
+        bar.fill((50, 50, 50))
+        if fill:
+            bar.fill((255, 0, 0), (0, 0, fill, cls._HEALTH_BAR_HEIGHT))
+        return bar
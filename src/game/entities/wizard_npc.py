@@ -6,6 +6,7 @@ from enum import Enum
 import pygame as pg
 
 from v3x_zulfiqar_gideon import Actor, AssetManager
+from src.game.systems import image_cache
 from .hitbox_registry import HitboxRegistry
 
 
@@ -82,7 +83,8 @@ class WizardNPC(Actor):
             if self.scale != 1.0:
                 new_w = int(frame.get_width() * self.scale)
                 new_h = int(frame.get_height() * self.scale)
-                frame = pg.transform.scale(frame, (new_w, new_h))
+                # Resized once per size and shared by every wizard
+                frame = image_cache.load(path, (new_w, new_h))
             frames.append(frame)
 
         self.animations[NPCState.IDLE] = frames
@@ -143,7 +145,7 @@ class WizardNPC(Actor):
         self.rect.x -= scroll_speed
         super().update(dt if dt is not None else 0.0)
 
-    def draw(self, surface: pg.Surface) -> None:
+    def draw(self, surface: pg.Surface, current_time_ms: Optional[int] = None) -> None:
         """Render the NPC sprite and, if applicable, the talk prompt."""
         super().draw(surface)
 
@@ -151,7 +153,7 @@ class WizardNPC(Actor):
             return
 
         # Pulsing alpha for visibility
-        ticks = pg.time.get_ticks()
+        ticks = pg.time.get_ticks() if current_time_ms is None else current_time_ms
         alpha = 180 + int(75 * abs(((ticks // 8) % 200 - 100) / 100))
         self._prompt_surface.set_alpha(alpha)
 
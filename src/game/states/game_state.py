@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import json
+from bisect import bisect_right
 from random import randint
 from typing import TYPE_CHECKING, Final, Optional, Any
 from dataclasses import dataclass
@@ -16,7 +17,7 @@ from dataclasses import dataclass
 import pygame
 import pygame as pg
 
-from src.game.entities.enemy import Enemy
+from src.game.entities.enemy import Enemy, EnemyPool, BatSwarm
 from v3x_zulfiqar_gideon import WorldEventManager, InteractionPoint, WorldLoader, Sky
 from src.game.entities.wizard_npc import WizardNPC
 from src.game.entities.generic_npc import GenericNPC
@@ -28,6 +29,7 @@ from src.game.entities.boss_manager import BossManager
 from src.game.ui import PlayerUI, ObjectiveDisplay, ObjectiveTriggerManager, NotificationBanner, TutorialOverlay
 from src.game.effects.vfx_manager import VisualEffectManager
 from src.game.systems.environment_manager import EnvironmentManager
+from src.game.systems.render_batch import blit_batch
 from v3x_zulfiqar_gideon import AssetManager, State
 
 if TYPE_CHECKING:
@@ -51,6 +53,13 @@ _DEFAULT_SPAWN_ZONES: list[dict] = [
 ]
 
 
+# One-shot timer event that marks the next ambient bat wave as due
+_BAT_WAVE_EVENT: Final[int] = pg.event.custom_type()
+
+# Gamepad hotplug events; the player caches its joystick between them
+_JOYDEVICE_EVENTS: Final[tuple[int, int]] = (pg.JOYDEVICEADDED, pg.JOYDEVICEREMOVED)
+
+
 class GameState(State):
     """
     Primary gameplay state managing entities, physics, and game logic.
@@ -69,6 +78,12 @@ class GameState(State):
     
     # Game over delay in milliseconds
     _GAME_OVER_DELAY_MS: Final[int] = 3000
+    # Game over deadline while no death is pending; no tick count reaches it
+    _NO_GAME_OVER: Final[int] = 1 << 62
+
+    # High-frequency events gameplay never reads (input is polled); kept out of
+    # the queue while this state is active
+    _BLOCKED_EVENTS: Final[tuple[int, ...]] = (pg.MOUSEMOTION, pg.FINGERMOTION, pg.JOYAXISMOTION)
 
     def __init__(self, manager: StateManager) -> None:
         """
@@ -107,12 +122,11 @@ class GameState(State):
         CombatCollisionLogger.get_instance(self.audio_manager)
         
         # Entity groups
-        self.player = pg.sprite.GroupSingle()
-        self.player.add(
-            Player(200, self.height + 135, self.audio_manager)
-        )
+        self.player: Player = Player(200, self.height + 135, self.audio_manager)
         self.obstacle_group: pg.sprite.Group = pg.sprite.Group()
-        self.ambient_group: pg.sprite.Group = pg.sprite.Group()
+        self.ambient_group: BatSwarm = BatSwarm()
+        self.bat_pool = EnemyPool(audio_manager=self.audio_manager)
+        Enemy.warm_frame_caches()
         
         # Initialize skeleton spawning
         
@@ -136,23 +150,21 @@ class GameState(State):
         self.trigger_manager = ObjectiveTriggerManager()
         self._setup_triggers()
         self._game_start_ticks: int = pg.time.get_ticks()
+        self._frame_ticks: int = self._game_start_ticks
         
         # Environment Manager (data-driven background & sky)
         self.environment_manager = EnvironmentManager(self.width, self.height)
         self.sky = self.environment_manager.sky
 
-        # Background parallax variables
-        self.bg_x1: int = 0
-        self.bg_x2: int = self.width
+        # World scroll speed; the environment manager owns the parallax layers
         self.bg_scroll_speed: int = 0
         self.max_bg_scroll_speed: int = 5
         
         # Game state
         self.score: int = 0
-        self.start_time: int = int(pg.time.get_ticks() / 1000)
-        self.next_bat_group_time: int = pg.time.get_ticks()
+        self._bat_wave_due: bool = True  # first wave on the first update
         self.next_skeleton_spawn_time: int = pg.time.get_ticks()
-        self._game_over_start_time: Optional[int] = None
+        self._game_over_at: int = self._NO_GAME_OVER
 
         # ── Soul Harvest System ──────────────────────────────────────────────
         self.total_souls: int = 0  # Souls gathered *this level*
@@ -281,9 +293,9 @@ class GameState(State):
                 for zone in json_zones:
                     if zone["max_dist"] >= 99999:
                         zone["max_dist"] = float("inf")
-                self._spawn_zones = json_zones
+                self._set_spawn_zones(json_zones)
             else:
-                self._spawn_zones = _DEFAULT_SPAWN_ZONES
+                self._set_spawn_zones(_DEFAULT_SPAWN_ZONES)
 
             # Bat spawn config
             bat_cfg = level_data.get("bat_spawn", {})
@@ -297,7 +309,7 @@ class GameState(State):
                 None
             )
             if player_data:
-                self.player.sprite.rect.midbottom = (
+                self.player.rect.midbottom = (
                     player_data["x"],
                     player_data["y"],
                 )
@@ -367,7 +379,7 @@ class GameState(State):
         else:
             self.BAT_GROUP_MIN_DELAY = 5000
             self.BAT_GROUP_MAX_DELAY = 15000
-            self._spawn_zones = _DEFAULT_SPAWN_ZONES
+            self._set_spawn_zones(_DEFAULT_SPAWN_ZONES)
             self._bat_min_count = 3
             self._bat_max_count = 5
             self._intro_npc_done = True
@@ -388,6 +400,14 @@ class GameState(State):
         """Initial interaction points (none — they spawn by distance now)."""
         pass  # Entities are spawned dynamically in _spawn_world_entities()
 
+    def _set_spawn_zones(self, zones: list[dict]) -> None:
+        """Store spawn zones sorted by ``min_dist`` for bisect lookups."""
+        self._spawn_zones = sorted(zones, key=lambda z: z.get("min_dist", 0))
+        self._spawn_zone_starts = [z.get("min_dist", 0) for z in self._spawn_zones]
+        # (distance, zone) of the last lookup; distance only changes as the
+        # player pushes further, so most frames reuse it
+        self._spawn_zone_cache: tuple[float, Optional[dict]] = (-1.0, None)
+
     def _get_spawn_zone(self) -> Optional[dict]:
         """Get the current spawn zone based on how far the player has traveled.
 
@@ -397,14 +417,20 @@ class GameState(State):
 
         Returns the zone where min_dist <= max_distance_reached <= max_dist.
         """
-        for zone in reversed(self._spawn_zones):
-            min_dist = zone.get("min_dist", 0)
+        dist = self.max_distance_reached
+        cached_dist, cached_zone = self._spawn_zone_cache
+        if dist == cached_dist:
+            return cached_zone
+        # Zones starting at or before dist, latest start first (usually one step)
+        for i in range(bisect_right(self._spawn_zone_starts, dist) - 1, -1, -1):
+            zone = self._spawn_zones[i]
             max_dist = zone.get("max_dist")
-            
-            if self.max_distance_reached >= min_dist:
-                if max_dist is None or self.max_distance_reached <= max_dist:
-                    return zone
-        return None
+            if max_dist is None or dist <= max_dist:
+                break
+        else:
+            zone = None
+        self._spawn_zone_cache = (dist, zone)
+        return zone
 
     def _setup_world_events(self) -> None:
         """Register handlers for world events. Scheduling is handled via JSON config."""
@@ -515,13 +541,12 @@ class GameState(State):
         enemy_type = params.get("type", "bat")
         
         if enemy_type == "bat":
+            spawn_x, y_max = self.width, self.height // 2
+            spawns = []
             for _ in range(count):
-                y_pos = randint(50, self.height // 2)
-                x_offset = randint(0, 175)
-                bat = Enemy(audio_manager=self.audio_manager)
-                bat.rect.midleft = (self.width + x_offset, y_pos)
-                bat.y_base = y_pos
-                self.ambient_group.add(bat)
+                y_pos = randint(50, y_max)
+                spawns.append((spawn_x + randint(0, 175), y_pos))
+            self.ambient_group.add(self.bat_pool.acquire_many(spawns))
             self.audio_manager.play_sound("bats")
         elif enemy_type == "skeleton":
             for _ in range(count):
@@ -529,7 +554,7 @@ class GameState(State):
 
     def _handle_boss_spawn(self, params: dict) -> None:
         """Handler for 'boss' events."""
-        player_sprite = self.player.sprite
+        player_sprite = self.player
         if player_sprite is None:
             return
 
@@ -600,6 +625,12 @@ class GameState(State):
         """Initialize state when entering gameplay."""
         self.audio_manager.stop_music()
         self.audio_manager.stop_all_sounds()
+        pg.event.set_blocked(list(self._BLOCKED_EVENTS))
+        # on_exit cancels the pending wave; re-arm it so bats resume on re-entry
+        if not self._bat_wave_due:
+            self._arm_bat_wave_timer()
+        # Gamepads may have been plugged or unplugged while another state ran
+        self.player.refresh_joystick()
         
         # Dynamically resolve background music track from master audio config (game_loop)
         # Always use play_music() so it routes through the dedicated music Channel 0,
@@ -609,7 +640,10 @@ class GameState(State):
         
         self.audio_manager.play_music(bg_track_key, loop=True)
         self.bg_music_channel_id = 0  # music always on channel 0
-        self.player_ui.start_timer()
+        # The HUD clock times the whole run; re-entering (e.g. after a pushed
+        # menu pops) must not restart it
+        if self.player_ui.start_time == 0:
+            self.player_ui.start_timer()
 
         # Show level notification banner on first entry
         if self._show_objective_on_start:
@@ -623,12 +657,22 @@ class GameState(State):
         
     def on_exit(self) -> None:
         """Cleanup when leaving gameplay state."""
+        pg.event.set_allowed(list(self._BLOCKED_EVENTS))
+        pg.time.set_timer(_BAT_WAVE_EVENT, 0)
         if self.bg_music_channel_id is not None:
             self.audio_manager.stop_sound(self.bg_music_channel_id)
             self.bg_music_channel_id = None
         if self.tracker is not None:
             self.tracker.close()
         
+    def _arm_bat_wave_timer(self) -> None:
+        """Schedule the next bat wave as a one-shot _BAT_WAVE_EVENT."""
+        pg.time.set_timer(
+            _BAT_WAVE_EVENT,
+            randint(self.BAT_GROUP_MIN_DELAY, self.BAT_GROUP_MAX_DELAY),
+            loops=1,
+        )
+
     def handle_event(self, event: pg.event.Event) -> None:
         """
         Process input events.
@@ -636,6 +680,14 @@ class GameState(State):
         Args:
             event: Pygame event to process.
         """
+        # Spawn timers fire even while overlays freeze gameplay; update() spawns on resume
+        if event.type == _BAT_WAVE_EVENT:
+            self._bat_wave_due = True
+            return
+
+        if event.type in _JOYDEVICE_EVENTS:
+            self.player.refresh_joystick()
+
         # While tutorial overlay is active, capture its input
         if self.tutorial_overlay.is_active:
             self.tutorial_overlay.handle_event(event)
@@ -688,10 +740,9 @@ class GameState(State):
         Args:
             current_time: Current game time in milliseconds.
         """
-        zone = self._get_spawn_zone()
-
-        # Spawn bats
-        if current_time >= self.next_bat_group_time:
+        # Spawn bats (flagged by the _BAT_WAVE_EVENT timer)
+        if self._bat_wave_due:
+            self._bat_wave_due = False
             from v3x_zulfiqar_gideon import SettingsManager
             quality = SettingsManager().get("graphics_quality")
             if quality == "low":
@@ -701,24 +752,20 @@ class GameState(State):
             else:
                 bat_count = randint(self._bat_min_count, self._bat_max_count)
                 
-            for _ in range(bat_count):
-                y_pos = randint(50, self.height // 2)
-                x_offset = randint(0, 175)
-                
-                bat = Enemy(audio_manager=self.audio_manager)
-                bat.rect.midleft = (self.width + x_offset, y_pos)
-                bat.y_base = y_pos
-                self.ambient_group.add(bat)
-                
             if bat_count > 0:
+                # Whole wave's spawn points first, then one pool call and one group add
+                spawn_x, y_max = self.width, self.height // 2
+                spawns = [(spawn_x + randint(0, 175), randint(50, y_max)) for _ in range(bat_count)]
+                self.ambient_group.add(self.bat_pool.acquire_many(spawns))
                 self.audio_manager.play_sound("bats")
-            self.next_bat_group_time = current_time + randint(
-                self.BAT_GROUP_MIN_DELAY,
-                self.BAT_GROUP_MAX_DELAY,
-            )
+            self._arm_bat_wave_timer()
         
         # Spawn skeletons (distance-scaled) — blocked until intro NPC sequence finishes
-        if self._intro_npc_done and zone is not None and current_time >= self.next_skeleton_spawn_time:
+        if (
+            self._intro_npc_done
+            and current_time >= self.next_skeleton_spawn_time
+            and (zone := self._get_spawn_zone()) is not None
+        ):
             current_skeletons = sum(1 for sprite in self.obstacle_group 
                                  if isinstance(sprite, Skeleton))
             
@@ -729,11 +776,12 @@ class GameState(State):
                 if current_skeletons < zone.get("max_skeletons", 0):
                     self.spawn_skeleton(zone)
                     self.next_skeleton_spawn_time = current_time + zone.get("delay", 6000)
-                    print(f"[SPAWN] Skeleton spawned! "
-                          f"alive={current_skeletons + 1}/{zone.get('max_skeletons', 0)} "
-                          f"delay={zone.get('delay', 6000)}ms "
-                          f"dist={int(self.max_distance_reached)} "
-                          f"kills={killed_count}/{required_kills if required_kills > 0 else 'inf'}")
+                    if self._verbose_logging:
+                        print(f"[SPAWN] Skeleton spawned! "
+                              f"alive={current_skeletons + 1}/{zone.get('max_skeletons', 0)} "
+                              f"delay={zone.get('delay', 6000)}ms "
+                              f"dist={int(self.max_distance_reached)} "
+                              f"kills={killed_count}/{required_kills if required_kills > 0 else 'inf'}")
     
     def spawn_skeleton(self, zone: Optional[dict] = None) -> None:
         """Spawn a new skeleton at a random position on the right side of the screen."""
@@ -741,11 +789,6 @@ class GameState(State):
         spawn_x = self.width + randint(100, 300)
         spawn_y = self.height - 50  # Same as initial spawn height
         
-        # Get player sprite from GroupSingle
-        player_sprite = self.player.sprite
-        if player_sprite is None:
-            return  # Can't spawn skeleton without player
-            
         sprite_root = None
         behaviour_map = None
         tier = "minion"
@@ -758,7 +801,7 @@ class GameState(State):
         skeleton = Skeleton(
             x=spawn_x,
             y=spawn_y,
-            player=player_sprite,  # Pass the actual Player instance
+            player=self.player,
             sprite_root=sprite_root,
             behaviour_map=behaviour_map,
             tier=tier,
@@ -769,32 +812,6 @@ class GameState(State):
             skeleton.spawn_zone = zone
         self.audio_manager.play_sound(sound_name="skeleton_spawn", volume=0.15)
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # Background Parallax
-    # ─────────────────────────────────────────────────────────────────────────
-    
-    def update_background(self, scroll_delta: int) -> None:
-        """
-        Update parallax background positions.
-        
-        Args:
-            scroll_delta: Horizontal scroll amount this frame.
-        """
-        self.bg_x1 -= scroll_delta
-        self.bg_x2 -= scroll_delta
-        
-        # Wrap background images for infinite scroll, maintaining perfect contiguity
-        if scroll_delta > 0:
-            if self.bg_x1 <= -self.width:
-                self.bg_x1 = self.bg_x2 + self.width
-            if self.bg_x2 <= -self.width:
-                self.bg_x2 = self.bg_x1 + self.width
-        elif scroll_delta < 0:
-            if self.bg_x1 >= self.width:
-                self.bg_x1 = self.bg_x2 - self.width
-            if self.bg_x2 >= self.width:
-                self.bg_x2 = self.bg_x1 - self.width
-    
     # ─────────────────────────────────────────────────────────────────────────
     # Combat Collision Detection
     # ─────────────────────────────────────────────────────────────────────────
@@ -807,7 +824,7 @@ class GameState(State):
         ensuring damage is only applied during configured hit frames with
         duplicate hit prevention.
         """
-        player_sprite = self.player.sprite
+        player_sprite = self.player
         
         if player_sprite.is_dead:
             return
@@ -841,10 +858,9 @@ class GameState(State):
         if attack_hitbox is None:
             return
         
-        # Check against all obstacles
-        colliderect = attack_hitbox.colliderect
-        try_register_hit = player.try_register_hit
-        
+        # Gather live, vulnerable obstacles and their hitboxes as parallel lists
+        targets: list = []
+        hitboxes: list[pg.Rect] = []
         for obstacle in self.obstacle_group:
             # Skip dead enemies
             if getattr(obstacle, "is_dead", False):
@@ -859,9 +875,13 @@ class GameState(State):
             if target_hitbox is None:
                 continue
             
-            # Gate 2: Check hitbox collision
-            if not colliderect(target_hitbox):
-                continue
+            targets.append(obstacle)
+            hitboxes.append(target_hitbox)
+        
+        # Gate 2: Check hitbox collision (one C-level sweep over all hitboxes)
+        try_register_hit = player.try_register_hit
+        for index in attack_hitbox.collidelistall(hitboxes):
+            obstacle = targets[index]
             
             # Gate 3: Check if already hit this attack (prevent duplicates)
             target_id = getattr(obstacle, "entity_id", None)
@@ -983,8 +1003,7 @@ class GameState(State):
 
                 # ── Deactivate Boss Arena ─────────────────────────────────
                 self._arena_active = False
-                if self.player.sprite:
-                    self.player.sprite.right_bound_ratio = getattr(self.player.sprite, "_RUN_RIGHT_BOUND_RATIO", 0.65)
+                self.player.right_bound_ratio = getattr(self.player, "_RUN_RIGHT_BOUND_RATIO", 0.65)
                 # ─────────────────────────────────────────────────────────
 
                 # Check for final boss defeat (tier == "boss")
@@ -1013,9 +1032,10 @@ class GameState(State):
             zone = getattr(enemy, "spawn_zone", None)
             if zone is not None:
                 zone["killed_count"] = zone.get("killed_count", 0) + 1
-                print(f"[KILL] Enemy from zone killed! "
-                      f"kills={zone['killed_count']}/{zone.get('required_kills', 0)} "
-                      f"souls+={soul_reward} total={self.player_ui.current_soul_total}")
+                if self._verbose_logging:
+                    print(f"[KILL] Enemy from zone killed! "
+                          f"kills={zone['killed_count']}/{zone.get('required_kills', 0)} "
+                          f"souls+={soul_reward} total={self.player_ui.current_soul_total}")
 
             # Fire "first_kill" flag for objective triggers
             self.trigger_manager.set_flag("first_kill")
@@ -1023,6 +1043,11 @@ class GameState(State):
         # Score reward
         self.score += self._SCORE_PER_HIT
 
+    @property
+    def _verbose_logging(self) -> bool:
+        """Console spawn/kill logs are only emitted in debug mode or simulations."""
+        return self.debug_mode or self._is_simulating
+
     def _is_boss_active(self) -> bool:
         """Check if any boss is currently active and alive in the scene."""
         return BossManager.is_boss_active(self.obstacle_group)
@@ -1041,38 +1066,57 @@ class GameState(State):
         if player.is_invincible:
             return
             
-        # Process attacks from all obstacles that can attack
+        # Gather every attacker on a live hit frame with its attack hitbox
+        attackers: list = []
+        hitboxes: list[pg.Rect] = []
         for obstacle in self.obstacle_group:
             if isinstance(obstacle, (Skeleton, FireWizard, GreenMonster)):
-                self._handle_skeleton_attack(player, obstacle)
+                hitbox = self._get_live_attack_hitbox(obstacle)
+                if hitbox is not None:
+                    attackers.append(obstacle)
+                    hitboxes.append(hitbox)
+        if not attackers:
+            return
 
-    def _handle_skeleton_attack(self, player: Player, skeleton: Skeleton | FireWizard | GreenMonster) -> None:
+        # Gate 3: Check hitbox collision (one C-level sweep over all hitboxes)
+        for index in player.rect.collidelistall(hitboxes):
+            self._handle_skeleton_attack(player, attackers[index])
+
+    @staticmethod
+    def _get_live_attack_hitbox(skeleton: Skeleton | FireWizard | GreenMonster) -> Optional[pg.Rect]:
         """
-        Handle skeleton attack collision with frame-precise damage.
-        
+        Return the attack hitbox of an enemy that can land a hit this frame.
+
         Args:
-            player: Player sprite instance.
-            skeleton: Attacking skeleton/wizard instance.
+            skeleton: Skeleton/wizard/gatekeeper instance.
+
+        Returns:
+            The attack hitbox (or ``rect`` for entities without one), or None
+            if the enemy is not on an unregistered hit frame of an attack.
         """
         # Gate 1: Entity must be in attack state
         state = getattr(skeleton, "state", None)
         if state is None or "ATTACK" not in getattr(state, "name", ""):
-            return
+            return None
         
         # Gate 2: Must be on a hit frame and not already registered
         if not skeleton.should_deal_damage():
-            return 
+            return None
         
-        # Gate 3: Check hitbox collision (use skeleton's attack hitbox if available)
-        skeleton_hitbox = getattr(skeleton, 'get_attack_hitbox', None)
-        if skeleton_hitbox is not None:
-            skeleton_hitbox = skeleton_hitbox()
-        else:
-            skeleton_hitbox = skeleton.rect
-            
-        if skeleton_hitbox is None or not skeleton_hitbox.colliderect(player.rect):
-            return
+        # Use skeleton's attack hitbox if available
+        get_attack_hitbox = getattr(skeleton, 'get_attack_hitbox', None)
+        if get_attack_hitbox is not None:
+            return get_attack_hitbox()
+        return skeleton.rect
+
+    def _handle_skeleton_attack(self, player: Player, skeleton: Skeleton | FireWizard | GreenMonster) -> None:
+        """
+        Apply a skeleton attack whose live hitbox overlaps the player.
         
+        Args:
+            player: Player sprite instance.
+            skeleton: Attacking skeleton/wizard instance.
+        """
         # Always register the hit attempt to prevent multi-hit exploitation.
         # This ensures the skeleton can't "save" its hit for when i-frames end.
         skeleton.register_hit(id(player))
@@ -1169,9 +1213,7 @@ class GameState(State):
             # Fallback: Direct position offset with screen bounds clamping
             player.rect.x += int(force)
             player.rect.left = max(player.rect.left, 0)
-            
-            screen_width = pg.display.get_surface().get_width()
-            player.rect.right = min(player.rect.right, screen_width)
+            player.rect.right = min(player.rect.right, self.width)
     
     # ─────────────────────────────────────────────────────────────────────────
     # Main Update Loop
@@ -1496,6 +1538,8 @@ class GameState(State):
         Args:
             dt: Delta time since last update in seconds.
         """
+        # One tick query per frame, reused by draw for the HUD clock and effects
+        self._frame_ticks = pg.time.get_ticks()
 
         # Freeze gameplay while tutorial or objective overlay is active
         if self.tutorial_overlay.is_active:
@@ -1523,7 +1567,7 @@ class GameState(State):
                 self._pending_difficulty_fetch = None
                 self._pending_difficulty_boss = None
 
-        current_time = pg.time.get_ticks()
+        current_time = self._frame_ticks
         
         # Enemy spawning
         self.spawn_enemies(current_time)
@@ -1537,7 +1581,7 @@ class GameState(State):
             and not getattr(npc, "is_death_complete", False)
             for npc in self.npc_group
         )
-        player_sprite = self.player.sprite
+        player_sprite = self.player
         if intro_npc_locked:
             player_sprite.can_move = False
             self.bg_scroll_speed = 0
@@ -1590,9 +1634,8 @@ class GameState(State):
         
         # Update systems
         self.environment_manager.update(dt / 1000.0, float(self.bg_scroll_speed * 60.0))
-        self.update_background(self.bg_scroll_speed)
-        self.player_ui.update()
-        self.player.update()
+        self.player_ui.update(current_time)
+        self.player.update(current_time_ms=current_time)
         self.obstacle_group.update(dt, self.bg_scroll_speed)
         self.ambient_group.update(dt, self.bg_scroll_speed)
         self.interaction_group.update(dt, self.bg_scroll_speed)
@@ -1647,7 +1690,7 @@ class GameState(State):
         self._handle_combat_collisions()
         
         # State transitions
-        self._check_game_over()
+        self._check_game_over(current_time)
 
         if self._is_simulating:
             self._sim_log_counter += 1
@@ -1920,20 +1963,18 @@ class GameState(State):
     # Rendering
     # ─────────────────────────────────────────────────────────────────────────
     
-    def _check_game_over(self) -> None:
+    def _check_game_over(self, now: int) -> None:
         """Check if game over conditions are met and handle transition."""
-        player = self.player.sprite
-        if player.is_dead and self._game_over_start_time is None:
-            self._game_over_start_time = pg.time.get_ticks()
-        
-        # Wait for the game over delay before transitioning
-        if (self._game_over_start_time is not None and 
-            pg.time.get_ticks() - self._game_over_start_time >= self._GAME_OVER_DELAY_MS):
+        # A pending death is a deadline, so the alive case is one comparison
+        # and the is_dead read instead of a pair of None checks
+        if now >= self._game_over_at:
             # TODO: Add game over state transition
             print("Game Over!")
             # Reset game over state
-            self._game_over_start_time = None
-            player.reset()
+            self._game_over_at = self._NO_GAME_OVER
+            self.player.reset()
+        elif self.player.is_dead and self._game_over_at == self._NO_GAME_OVER:
+            self._game_over_at = now + self._GAME_OVER_DELAY_MS
     
     def draw(self, surface: pg.Surface) -> None:
         """
@@ -1946,26 +1987,48 @@ class GameState(State):
         self.environment_manager.draw(surface, cam_x=self.world_distance)
         
         # UI layer
-        self.player_ui.draw(surface)
+        self.player_ui.draw(surface, self._frame_ticks)
         
         # NPCs (drawn before player so they appear behind)
+        now = self._frame_ticks
         for npc in self.npc_group:
-            npc.draw(surface)
+            npc.draw(surface, now)
 
         # Interaction point prompts ("Talk" indicators)
         for point in self.interaction_group:
             point.draw(surface)
 
-        # Ambient creatures (sorted by scale so further ones are drawn behind closer ones)
-        for ambient in sorted(self.ambient_group, key=lambda a: getattr(a, 'depth_scale_factor', 1.0)):
-            ambient.draw(surface)
+        # Ambient creatures (the swarm keeps them in depth order, so further ones
+        # are drawn behind closer ones). Bats are plain image blits, so the whole
+        # flock goes out in one batched call.
+        ambient_blits = [
+            (ambient.image, ambient.rect.topleft - ambient.image_offset)
+            for ambient in self.ambient_group
+        ]
+        if ambient_blits:
+            blit_batch(surface, ambient_blits)
 
         # Player (drawn after NPCs so player appears in front)
-        self.player.sprite.draw(surface)
+        self.player.draw(surface)
         
-        # Enemies
+        # Enemies draw themselves (health bars, auras); their projectiles are
+        # plain image blits and go out in one batched call on top
+        projectile_blits = []
+        screen_w = surface.get_width()
         for enemy in self.obstacle_group:
-            enemy.draw(surface)
+            # x-band reject: skeletons walking in from past the right edge and
+            # projectiles flying out would be clipped to nothing anyway. The
+            # sprite's own width is kept as slack for offset art and health bars.
+            rect = enemy.rect
+            slack = enemy.image.get_width()
+            if rect.right + slack < 0 or rect.left - slack > screen_w:
+                continue
+            if getattr(enemy, "is_projectile", False):
+                projectile_blits.append((enemy.image, enemy.rect))
+            else:
+                enemy.draw(surface)
+        if projectile_blits:
+            blit_batch(surface, projectile_blits)
             
         # Hit Visual Effects (Blood Bursts, Sparks, Magic Shots)
         VisualEffectManager.draw(surface)
@@ -1997,7 +2060,7 @@ class GameState(State):
         Args:
             surface: Target surface for debug rendering.
         """
-        player_sprite = self.player.sprite
+        player_sprite = self.player
         
         # Player bounding rect (blue)
         pg.draw.rect(surface, (0, 100, 255), player_sprite.rect, 2)
@@ -1,8 +1,14 @@
+import math
+
 import pygame as pg
 from v3x_zulfiqar_gideon import State, AssetManager, Button
 import sys
 
 class MainMenuState(State):
+    # Motion events nothing in the menu reads while it has no hoverable
+    # buttons; dropping them at the SDL queue keeps them out of handle_event
+    _MOTION_EVENTS = (pg.MOUSEMOTION, pg.FINGERMOTION, pg.JOYAXISMOTION)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.width = pg.display.get_surface().get_width() 
@@ -27,13 +33,16 @@ class MainMenuState(State):
 
         # Title - bottom
         self.title_font = AssetManager.get_font('assets/font/Abaddon Bold.ttf', 100)
-        self.title_surf = self.title_font.render("Guardian Runner", False, (111, 196, 169))
+        # Non-antialiased text renders as 8-bit palette surfaces; convert once so
+        # the per-frame blit doesn't pay for a palette lookup on every pixel
+        self.title_surf = self.title_font.render("Guardian Runner", False, (111, 196, 169)).convert()
         self.title_rect = self.title_surf.get_rect(center=(self.width // 2, 150))
 
         # Title - top
         self.title_font_top  = AssetManager.get_font('assets/font/Abaddon Bold.ttf', 100)
-        self.title_surf_top = self.title_font_top.render("Guardian Runner", False, (0, 0, 0))
+        self.title_surf_top = self.title_font_top.render("Guardian Runner", False, (0, 0, 0)).convert()
         self.title_rect_top = self.title_surf_top.get_rect(center=(self.width // 2 - 6, 155))
+        self._bake_title(self.bg_placeholder)
         
         # Buttons
         self.buttons = []
@@ -41,6 +50,15 @@ class MainMenuState(State):
         
         # Start Prompt Font
         self.prompt_font = AssetManager.get_font('assets/Colorfiction_HandDrawnFonts/Colorfiction - Gothic - Regular.otf', 70)
+
+        # 3-layer START prompt: static text, only its alpha pulses, so render once
+        # (moved up to make room for the space key)
+        prompt_x, prompt_y = self.width // 2, self.height - 100
+        self.prompt_layers = []
+        for color, offset in (((0, 0, 0), 4), ((111, 196, 169), 2), ((255, 255, 255), 0)):
+            layer_surf = self.prompt_font.render("START", False, color).convert()
+            layer_rect = layer_surf.get_rect(midbottom=(prompt_x + offset, prompt_y + offset))
+            self.prompt_layers.append((layer_surf, layer_rect))
         
         # Space Key Prompt
         try:
@@ -51,6 +69,8 @@ class MainMenuState(State):
             print("Failed to load SPACE.png")
             self.space_key = None
         
+        self.prompt_surf, self.prompt_rect = self._compose_prompt()
+
         # Input Cooldown to prevent accidental restarts
         self.input_cooldown = 0.5 # 500ms
         self.time_entered: float = 0.0
@@ -93,6 +113,24 @@ class MainMenuState(State):
         except Exception as e:
             print(f"Failed to load background frames: {e}")
         
+    def _bake_title(self, background):
+        """Draw the static two-layer title onto a background surface once,
+        so draw() doesn't re-blit it over every frame."""
+        background.blit(self.title_surf, self.title_rect)
+        background.blit(self.title_surf_top, self.title_rect_top)
+
+    def _compose_prompt(self):
+        """Flatten the START layers and the space key into one surface, so the
+        pulsing prompt is a single alpha change and blit per frame."""
+        parts = list(self.prompt_layers)
+        if self.space_key:
+            parts.append((self.space_key, self.space_key_rect))
+        bounds = parts[0][1].unionall([rect for _, rect in parts[1:]])
+        composite = pg.Surface(bounds.size, pg.SRCALPHA)
+        for part_surf, part_rect in parts:
+            composite.blit(part_surf, part_rect.move(-bounds.x, -bounds.y))
+        return composite.convert_alpha(), bounds
+
     def create_buttons(self):
         # TODO: Implement your own buttons here using the guide!
         # Example:
@@ -111,10 +149,15 @@ class MainMenuState(State):
         
     def on_enter(self):
         self.time_entered = pg.time.get_ticks() / 1000.0
+        if not self.buttons:
+            pg.event.set_blocked(list(self._MOTION_EVENTS))
         # Start background music
         if hasattr(self.manager, 'audio_manager') and self.manager.audio_manager:
             self.manager.audio_manager.play_music("background_music", volume=0.5)
 
+    def on_exit(self):
+        pg.event.set_allowed(list(self._MOTION_EVENTS))
+
     # Redefining handle_event to pass to buttons
     def handle_event(self, event):
         for btn in self.buttons:
@@ -130,6 +173,8 @@ class MainMenuState(State):
         # Convert frames to display format on main thread when thread finishes
         if self.loading_thread and not self.loading_thread.is_alive() and not self.converted_frames:
             self.frames = [f.convert() for f in self.frames]
+            for frame in self.frames:
+                self._bake_title(frame)
             self.converted_frames = True
 
         # Update Background Animation
@@ -143,45 +188,18 @@ class MainMenuState(State):
             btn.update(dt) # Update animations
 
     def draw(self, surface):
-        if self.frames:
+        # Only blit the background once update() has converted it to display format
+        if self.frames and self.converted_frames:
             surface.blit(self.frames[self.current_frame_index], (0, 0))
         else:
             surface.blit(self.bg_placeholder, (0, 0))
             # Optional: Draw "Loading..." text
-            
-        surface.blit(self.title_surf, self.title_rect)
-        surface.blit(self.title_surf_top, self.title_rect_top)
+        # (the title is baked into the background frames and placeholder)
         
         for btn in self.buttons:
             btn.draw(surface)
             
-        # Draw 3-Layer Start Prompt
-        import math
+        # Draw the pulsing START prompt and space key (pre-composited)
         alpha = (math.sin(pg.time.get_ticks() * 0.005) + 1) / 2 * 255
-        
-        text = "START"
-        # Move text up to make room for space key
-        center_pos = (self.width // 2, self.height - 100)
-        
-        # Layer 1: Shadow (Black)
-        surf1 = self.prompt_font.render(text, False, (0, 0, 0))
-        surf1.set_alpha(int(alpha))
-        rect1 = surf1.get_rect(midbottom=(center_pos[0] + 4, center_pos[1] + 4))
-        surface.blit(surf1, rect1)
-        
-        # Layer 2: Middle (Dark Gray/Red) - Let's use a dark red for style or just gray
-        surf2 = self.prompt_font.render(text, False, (111, 196, 169)) # Using theme color
-        surf2.set_alpha(int(alpha))
-        rect2 = surf2.get_rect(midbottom=(center_pos[0] + 2, center_pos[1] + 2))
-        surface.blit(surf2, rect2)
-        
-        # Layer 3: Top (White)
-        surf3 = self.prompt_font.render(text, False, (255, 255, 255))
-        surf3.set_alpha(int(alpha))
-        rect3 = surf3.get_rect(midbottom=center_pos)
-        surface.blit(surf3, rect3)
-        
-        # Draw Space Key Prompt
-        if self.space_key:
-            self.space_key.set_alpha(int(alpha))
-            surface.blit(self.space_key, self.space_key_rect)
+        self.prompt_surf.set_alpha(int(alpha))
+        surface.blit(self.prompt_surf, self.prompt_rect)
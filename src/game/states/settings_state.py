@@ -116,8 +116,16 @@ class SettingsState(State):
             on_click=self._on_back
         )
         
-        # Dynamic interactable zones (updated every frame/draw for correctness)
-        self.hitboxes = []
+        # Interactable zones for mouse hover/clicks
+        self.hitboxes = self._build_hitboxes()
+
+        # Cached composition of boards, title and option rows (see draw). Only
+        # the board area ever holds pixels, so that is all that gets cleared
+        # and blended each frame rather than the whole screen.
+        self._panel = pg.Surface((self.width, self.height), pg.SRCALPHA)
+        self._panel_rect = self._stone_rect.union(self._parch_rect).clip(self._panel.get_rect())
+        self._panel.set_clip(self._panel_rect)
+        self._panel_key = None
         
     def _on_back(self):
         # Save final state just in case
@@ -213,10 +221,46 @@ class SettingsState(State):
     def update(self, dt):
         self.back_button.update(dt)
         
+    def _build_hitboxes(self):
+        """Row and arrow hitboxes; the layout is fixed, so these are built once."""
+        hitboxes = []
+        for idx in range(len(self.options)):
+            row_y = self.row_start_y + idx * self.row_spacing
+            row_rect = pg.Rect(self.label_x - 10, row_y - 8, self._parch_rect.width - int(self._parch_rect.width * 0.24) + 20, 42)
+            hitboxes.append({"type": "row", "rect": row_rect, "index": idx})
+            hitboxes.append({"type": "left", "rect": pg.Rect(self.val_center_x - 90, row_y + 2, 28, 28), "index": idx})
+            hitboxes.append({"type": "right", "rect": pg.Rect(self.val_center_x + 60, row_y + 2, 28, 28), "index": idx})
+        return hitboxes
+
     def draw(self, surface):
         # 1. Backdrop
         surface.blit(self._backdrop, (0, 0))
-        
+
+        # 2-4. Boards, title and option rows only change on input or hover, so
+        # they are composed into a cached panel that is re-rendered on change
+        mouse_pos = pg.mouse.get_pos()
+        panel_key = (
+            self.selected_index,
+            self.current_quality, self.current_fps, self.current_music, self.current_sfx,
+            tuple(hb["rect"].collidepoint(mouse_pos) for hb in self.hitboxes),
+        )
+        if panel_key != self._panel_key:
+            self._panel_key = panel_key
+            self._panel.fill((0, 0, 0, 0), self._panel_rect)
+            self._render_panel(self._panel, mouse_pos)
+        surface.blit(self._panel, self._panel_rect, area=self._panel_rect)
+
+        # Draw Back Button
+        is_back_selected = (self.selected_index == len(self.options))
+        if is_back_selected:
+            # Draw a subtle selection highlight around the back button
+            back_rect = self.back_button._internal.rect
+            rect_to_draw = (back_rect.x - 4, back_rect.y - 4, back_rect.width + 8, back_rect.height + 8)
+            pg.draw.rect(surface, self.highlight_color, rect_to_draw, 2, border_radius=4)
+            
+        self.back_button.draw(surface)
+
+    def _render_panel(self, surface, mouse_pos):
         # 2. Boards
         surface.blit(self._stone, self._stone_rect)
         surface.blit(self._parchment, self._parch_rect)
@@ -228,9 +272,6 @@ class SettingsState(State):
         surface.blit(title_surf, (title_x, title_y))
         
         # 4. Draw options
-        self.hitboxes = []
-        mouse_pos = pg.mouse.get_pos()
-        
         for idx, opt in enumerate(self.options):
             row_y = self.row_start_y + idx * self.row_spacing
             is_selected = (idx == self.selected_index)
@@ -239,13 +280,6 @@ class SettingsState(State):
             row_rect = pg.Rect(self.label_x - 10, row_y - 8, self._parch_rect.width - int(self._parch_rect.width * 0.24) + 20, 42)
             is_hovered = row_rect.collidepoint(mouse_pos)
             
-            # Register row selection hitbox
-            self.hitboxes.append({
-                "type": "row",
-                "rect": row_rect,
-                "index": idx
-            })
-            
             color = self.highlight_color if (is_selected or is_hovered) else self.text_color
             
             # Draw label
@@ -272,11 +306,6 @@ class SettingsState(State):
             # Left arrow
             left_arrow_rect = pg.Rect(self.val_center_x - 90, row_y + 2, 28, 28)
             arrow_l_hover = left_arrow_rect.collidepoint(mouse_pos)
-            self.hitboxes.append({
-                "type": "left",
-                "rect": left_arrow_rect,
-                "index": idx
-            })
             
             # Draw left arrow triangle
             al_color = self.arrow_hover_color if arrow_l_hover else self.arrow_color
@@ -288,11 +317,6 @@ class SettingsState(State):
             # Right arrow
             right_arrow_rect = pg.Rect(self.val_center_x + 60, row_y + 2, 28, 28)
             arrow_r_hover = right_arrow_rect.collidepoint(mouse_pos)
-            self.hitboxes.append({
-                "type": "right",
-                "rect": right_arrow_rect,
-                "index": idx
-            })
             
             # Draw right arrow triangle
             ar_color = self.arrow_hover_color if arrow_r_hover else self.arrow_color
@@ -300,13 +324,3 @@ class SettingsState(State):
             p2 = (self.val_center_x + 85, row_y + 16)
             p3 = (self.val_center_x + 70, row_y + 26)
             pg.draw.polygon(surface, ar_color, [p1, p2, p3])
-            
-        # Draw Back Button
-        is_back_selected = (self.selected_index == len(self.options))
-        if is_back_selected:
-            # Draw a subtle selection highlight around the back button
-            back_rect = self.back_button._internal.rect
-            rect_to_draw = (back_rect.x - 4, back_rect.y - 4, back_rect.width + 8, back_rect.height + 8)
-            pg.draw.rect(surface, self.highlight_color, rect_to_draw, 2, border_radius=4)
-            
-        self.back_button.draw(surface)
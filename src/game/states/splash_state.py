@@ -1,5 +1,6 @@
 import pygame as pg
 from v3x_zulfiqar_gideon import State, AssetManager
+from src.game.systems.render_batch import blit_batch
 
 class SplashState(State):
     def __init__(self, manager):
@@ -34,6 +35,12 @@ class SplashState(State):
         self.wait_time = 1.0 
         self.min_loading_time = 0.5
         self.loading_timer = 0
+
+        # Glyph atlas for the "Loading... N%" readout; the percentage changes
+        # most frames while loading, so it is assembled from pre-rendered
+        # characters instead of a font.render per frame. Built on first use.
+        self._loading_label = None
+        self._loading_glyphs = None
         
     def handle_event(self, event):
         # Consume events to prevent "Space bar buffering" into next state
@@ -100,7 +107,22 @@ class SplashState(State):
                 
                 # Percent
                 percent = int(progress * 100)
-                font = AssetManager.get_font('assets/Colorfiction_HandDrawnFonts/Colorfiction - Papyrus.otf', 30)
-                text_surf = font.render(f"Loading... {percent}%", False, (180, 180, 180))
-                text_rect = text_surf.get_rect(midbottom=(self.width // 2, bar_y - 10))
-                surface.blit(text_surf, text_rect)
+                self._draw_loading_text(surface, f"{percent}%", (self.width // 2, bar_y - 10))
+
+    def _draw_loading_text(self, surface, text, midbottom):
+        """Blit "Loading... " followed by *text* from the glyph atlas, centred at *midbottom*."""
+        if self._loading_glyphs is None:
+            font = AssetManager.get_font('assets/Colorfiction_HandDrawnFonts/Colorfiction - Papyrus.otf', 30)
+            color = (180, 180, 180)
+            self._loading_label = font.render("Loading... ", False, color)
+            self._loading_glyphs = {c: font.render(c, False, color) for c in "0123456789%"}
+        label = self._loading_label
+        glyphs = [self._loading_glyphs[c] for c in text]
+        x = midbottom[0] - (label.get_width() + sum(g.get_width() for g in glyphs)) // 2
+        y = midbottom[1] - label.get_height()
+        blit_seq = [(label, (x, y))]
+        x += label.get_width()
+        for glyph in glyphs:
+            blit_seq.append((glyph, (x, y)))
+            x += glyph.get_width()
+        blit_batch(surface, blit_seq)
@@ -1,5 +1,6 @@
 import pygame as pg
 from v3x_zulfiqar_gideon import State, AssetManager, SceneHighlighter, UIButton, NotificationBanner
+from src.game.systems import image_cache
 
 
 
@@ -75,7 +76,7 @@ class StoryState(State):
         )
 
         # ── Scene image ──────────────────────────────────────────────────────
-        self.scene_image = pg.image.load("assets/scenes/intro_scene.jpg").convert()
+        self.scene_image = image_cache.load("assets/scenes/intro_scene.jpg", alpha=False)
         img_w, img_h = self.scene_image.get_size()
         scale = self.width / img_w
         self.scene_image = pg.transform.smoothscale(
@@ -84,6 +85,12 @@ class StoryState(State):
         self.scene_rect = self.scene_image.get_rect(
             center=(self.width // 2, self.height // 2)
         )
+        # The scene is opaque; once fully faded in it repaints every pixel it
+        # covers, so the black clear underneath is only needed if it doesn't
+        # cover the whole screen
+        self._scene_covers_screen = self.scene_rect.contains(
+            pg.Rect(0, 0, self.width, self.height)
+        )
 
         # ── Story paragraphs (kept for reference / future scroll) ────────────
         self.story_paragraphs = [
@@ -308,25 +315,31 @@ class StoryState(State):
     # ── Draw ─────────────────────────────────────────────────────────────────
 
     def draw(self, surface):
-        surface.fill((0, 0, 0))
-
-        # Scene image with fade-in
-        if self.alpha >= 255:
-            surface.blit(self.scene_image, self.scene_rect)
+        if self._menu_ready and self._menu_alpha >= 255:
+            # The menu has fully faded the scene to black; skip drawing the
+            # scene and spotlight only to cover them with the opaque overlay
+            surface.fill((0, 0, 0))
         else:
-            # Set alpha on original (very fast)
-            self.scene_image.set_alpha(self.alpha)
-            surface.blit(self.scene_image, self.scene_rect)
-            self.scene_image.set_alpha(255) # Reset for next frame
-
-        # Spotlight highlight
-        if self._scene_faded_in:
-            self._highlighter.draw(surface)
-
-        # Fade scene out to black as menu fades in
-        if self._menu_ready and self._menu_alpha > 0:
-            self._black_overlay.set_alpha(self._menu_alpha)
-            surface.blit(self._black_overlay, (0, 0))
+            if self.alpha < 255 or not self._scene_covers_screen:
+                surface.fill((0, 0, 0))
+
+            # Scene image with fade-in
+            if self.alpha >= 255:
+                surface.blit(self.scene_image, self.scene_rect)
+            else:
+                # Set alpha on original (very fast)
+                self.scene_image.set_alpha(self.alpha)
+                surface.blit(self.scene_image, self.scene_rect)
+                self.scene_image.set_alpha(255) # Reset for next frame
+
+            # Spotlight highlight
+            if self._scene_faded_in:
+                self._highlighter.draw(surface)
+
+            # Fade scene out to black as menu fades in
+            if self._menu_ready and self._menu_alpha > 0:
+                self._black_overlay.set_alpha(self._menu_alpha)
+                surface.blit(self._black_overlay, (0, 0))
 
         # Parchment menu (fades in after delay)
         if self._menu_ready:
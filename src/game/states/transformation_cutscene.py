@@ -16,7 +16,8 @@ from typing import Callable, Optional
 
 import pygame as pg
 
-from v3x_zulfiqar_gideon import AssetManager, State, NotificationBanner
+from v3x_zulfiqar_gideon import State, NotificationBanner
+from src.game.systems import image_cache
 
 
 class _Phase(IntEnum):
@@ -132,17 +133,13 @@ class TransformationCutscene(State):
     def _load_scaled(
         self, directory: str, flip: bool = False
     ) -> list[pg.Surface]:
-        """Load animation frames, scale them up, optionally flip horizontally."""
-        raw_frames = AssetManager.get_animation_frames(directory)
-        scaled: list[pg.Surface] = []
-        for f in raw_frames:
-            w = int(f.get_width() * self._SPRITE_SCALE)
-            h = int(f.get_height() * self._SPRITE_SCALE)
-            s = pg.transform.smoothscale(f, (w, h))
-            if flip:
-                s = pg.transform.flip(s, True, False)
-            scaled.append(s)
-        return scaled
+        """Load animation frames, scale them up, optionally flip horizontally.
+
+        Nearest-neighbour scaling keeps the pixel art crisp (matching the
+        in-game player) and the scaled (and mirrored) set is shared across
+        cutscene runs.
+        """
+        return image_cache.scaled_frames(directory, self._SPRITE_SCALE, flip=flip)
 
     # ─── State interface ─────────────────────────────────────────────────────
 
@@ -5,15 +5,22 @@ Environment Manager — Data-driven manager for game backgrounds, sky layers, gr
 from __future__ import annotations
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, Sky
+from src.game.systems.render_batch import blit_batch
 
 
 class ParallaxLayer:
     """Represents a single parallax background layer with flexible stretch, scale, and offset controls."""
 
+    __slots__ = (
+        "texture_path", "screen_width", "screen_height", "scroll_ratio", "repeat_x",
+        "scale_x", "scale_y", "stretch_fill", "pos_y_offset",
+        "image", "strip", "opaque", "width", "height", "x1", "x2",
+    )
+
     def __init__(
         self,
         texture_path: str,
@@ -46,9 +53,24 @@ class ParallaxLayer:
             target_width = max(screen_width, int(target_height * aspect_ratio * scale_x))
 
         self.image = pg.transform.smoothscale(raw_texture, (target_width, target_height))
+        # Fully opaque layers (usually the farthest backdrop) drop per-pixel alpha
+        # so each frame's blit is a straight copy instead of an alpha blend.
+        self.opaque = pg.mask.from_surface(self.image, 254).count() == target_width * target_height
+        if self.opaque:
+            self.image = self.image.convert()
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
+        # Repeating layers are drawn from a two-copy strip in the image's own
+        # pixel format, so the seamless pair is one blit instead of two
+        self.strip: Optional[pg.Surface] = None
+        if repeat_x:
+            self.strip = pg.Surface(
+                (self.width * 2, self.height), self.image.get_flags() & pg.SRCALPHA, self.image
+            )
+            self.strip.blit(self.image, (0, 0))
+            self.strip.blit(self.image, (self.width, 0))
+
         self.x1: float = 0.0
         self.x2: float = float(self.width)
 
@@ -61,20 +83,58 @@ class ParallaxLayer:
             self.x1 = self.x2 + self.width
         if self.x2 <= -self.width:
             self.x2 = self.x1 + self.width
+        # Scrolling backwards: bring the trailing copy round to the left so
+        # the pair keeps covering the left screen edge
+        if self.x1 > 0 and self.x2 > 0:
+            if self.x1 > self.x2:
+                self.x1 = self.x2 - self.width
+            else:
+                self.x2 = self.x1 - self.width
 
-    def draw(self, surface: pg.Surface) -> None:
+    def _y_pos(self) -> int:
         if self.stretch_fill:
-            y_pos = int(self.pos_y_offset)
-        else:
-            y_pos = (self.screen_height - self.height) + int(self.pos_y_offset)
-        surface.blit(self.image, (int(self.x1), y_pos))
-        if self.repeat_x:
-            surface.blit(self.image, (int(self.x2), y_pos))
+            return int(self.pos_y_offset)
+        return (self.screen_height - self.height) + int(self.pos_y_offset)
+
+    def covers_screen(self) -> bool:
+        """True if this layer alone paints every screen pixel opaquely, so
+        nothing drawn behind it can show through."""
+        if not (self.opaque and self.repeat_x and self.width >= self.screen_width):
+            return False
+        y_pos = self._y_pos()
+        return y_pos <= 0 and y_pos + self.height >= self.screen_height
+
+    def blit_args(self) -> List[Tuple[pg.Surface, Tuple[int, int]]]:
+        """Return the ``(image, pos)`` pairs this layer draws this frame."""
+        y_pos = self._y_pos()
+        screen_w = self.screen_width
+        width = self.width
+        x = self.x1
+        if self.strip is not None:
+            # The two copies always sit edge to edge; draw the pair from the left one
+            x = min(x, self.x2)
+            if x + width >= screen_w:
+                # Right copy is wholly off-screen: the single image is enough
+                return [(self.image, (int(x), y_pos))] if x > -width else []
+            return [(self.strip, (int(x), y_pos))]
+        # A copy lying wholly off-screen would be clipped to nothing anyway
+        return [(self.image, (int(x), y_pos))] if -width < x < screen_w else []
+
+    def draw(self, surface: pg.Surface) -> None:
+        blit_batch(surface, self.blit_args())
 
 
 class EnvironmentProp:
     """Represents a sliced prop or tileset object placed into the environment."""
 
+    # Levels place hundreds of props and draw() reads several fields of each
+    # per frame; slots drop the per-instance dict and speed those lookups
+    __slots__ = (
+        "texture_path", "slice_rect", "pos_x", "pos_y", "scale", "layer_index",
+        "parallax_ratio", "flip_x", "flip_y", "is_ground", "collision_type",
+        "image", "width", "height",
+    )
+
     def __init__(
         self,
         texture_path: str,
@@ -125,10 +185,12 @@ class EnvironmentProp:
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
+    def blit_args(self, cam_x: float = 0.0) -> Tuple[pg.Surface, Tuple[int, int]]:
+        """Return the ``(image, pos)`` pair for this prop at camera offset *cam_x*."""
+        return self.image, (int(self.pos_x - cam_x * self.parallax_ratio), int(self.pos_y))
+
     def draw(self, surface: pg.Surface, cam_x: float = 0.0) -> None:
-        draw_x = int(self.pos_x - cam_x * self.parallax_ratio)
-        draw_y = int(self.pos_y)
-        surface.blit(self.image, (draw_x, draw_y))
+        surface.blit(*self.blit_args(cam_x))
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -426,20 +488,43 @@ class EnvironmentManager:
             if player_layer and stack.get("visible", True):
                 player_layer.update(player_speed, dt)
 
+    def _backdrop_position(self, indices: List[int]) -> Optional[int]:
+        """Position in *indices* of the front-most visible layer that covers the screen."""
+        for pos in range(len(indices) - 1, -1, -1):
+            stack = self.layer_stacks.get(indices[pos])
+            if not stack or not stack.get("visible", True):
+                continue
+            player_layer = stack.get("parallax_layer")
+            if player_layer and player_layer.covers_screen():
+                return pos
+        return None
+
     def draw(self, surface: pg.Surface, cam_x: float = 0.0, max_layer: Optional[int] = None) -> None:
         """Draw sky followed by explicit layers in strict back-to-front depth order."""
-        surface.fill((20, 20, 32))
-
-        if self.sky:
-            self.sky.draw(surface)
-
-        prop_indices = {p.layer_index for p in self.props}
-        all_indices = sorted(set(self.layer_stacks.keys()) | prop_indices)
+        # Bucket props by layer in one pass instead of rescanning them per layer
+        props_by_layer: Dict[int, List[EnvironmentProp]] = {}
+        for prop in self.props:
+            props_by_layer.setdefault(prop.layer_index, []).append(prop)
+        all_indices = sorted(set(self.layer_stacks.keys()) | props_by_layer.keys())
         if max_layer is not None:
             active_indices = [idx for idx in all_indices if idx <= max_layer]
         else:
             active_indices = all_indices
 
+        # The sky and any layers/props behind the front-most full-screen opaque
+        # layer would be completely overdrawn, so start drawing from it; the
+        # clear fill is only needed when no such layer paints every pixel
+        backdrop = self._backdrop_position(active_indices)
+        if backdrop is None:
+            surface.fill((20, 20, 32))
+            if self.sky:
+                self.sky.draw(surface)
+        else:
+            active_indices = active_indices[backdrop:]
+
+        # Collect every layer/prop blit back-to-front and issue them in one call
+        blit_seq: List[Tuple[pg.Surface, Tuple[int, int]]] = []
+        screen_w = self.screen_width
         for l_idx in active_indices:
             stack = self.layer_stacks.get(l_idx)
             is_visible = stack.get("visible", True) if stack else True
@@ -449,11 +534,16 @@ class EnvironmentManager:
             if stack:
                 player_layer = stack.get("parallax_layer")
                 if player_layer:
-                    player_layer.draw(surface)
+                    blit_seq.extend(player_layer.blit_args())
+
+            # Props are placed along the whole level; only the on-screen ones are blitted
+            for prop in props_by_layer.get(l_idx, ()):
+                image, pos = prop.blit_args(cam_x)
+                if -prop.width < pos[0] < screen_w:
+                    blit_seq.append((image, pos))
 
-            for prop in self.props:
-                if prop.layer_index == l_idx:
-                    prop.draw(surface, cam_x=cam_x)
+        if blit_seq:
+            blit_batch(surface, blit_seq)
 
     def to_config_dict(self) -> Dict[str, Any]:
         """Exports current environment configuration dictionary for saving."""
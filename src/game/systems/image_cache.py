@@ -0,0 +1,141 @@
+"""
+Image Cache — shared, display-converted surfaces keyed by ``(path, size)``.
+
+``AssetManager.get_texture`` already memoizes the raw ``convert_alpha()``
+surface per path, but every caller that needed a *resized* copy used to run
+its own ``pg.transform.scale`` — once per NPC, per overlay, per state entry.
+This module memoizes the resized results as well, so any two call sites that
+ask for the same file at the same size share one surface.
+
+Cached surfaces are shared: callers must not draw onto them or change their
+alpha in place (``copy()`` first if that is needed). Animation frames are
+subsurfaces of one packed strip per animation, so drawing onto one frame
+would also bleed into the strip.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pygame as pg
+
+from v3x_zulfiqar_gideon import AssetManager
+
+
+_cache: dict[tuple[str, Optional[tuple[int, int]], bool, bool], pg.Surface] = {}
+_frames_cache: dict[tuple[str, float, bool], list[pg.Surface]] = {}
+# id(source list) -> (source list, mirrored list); holding the source keeps
+# its id from being reused by another list
+_flipped_cache: dict[int, tuple[list[pg.Surface], list[pg.Surface]]] = {}
+
+
+def load(
+    path: str,
+    size: Optional[tuple[int, int]] = None,
+    alpha: bool = True,
+    smooth: bool = False,
+) -> pg.Surface:
+    """
+    Return the image at *path*, optionally resized to *size*.
+
+    Args:
+        path: Image file path.
+        size: Target ``(width, height)``; ``None`` keeps the native size.
+        alpha: ``True`` for per-pixel alpha (``convert_alpha``), ``False`` for
+            opaque images such as full-screen backdrops (``convert``).
+        smooth: Resize with ``smoothscale`` instead of nearest-neighbour
+            (for painted UI art; pixel-art sprites should keep the default).
+
+    Returns:
+        A display-format surface shared with every other caller using the
+        same arguments.
+    """
+    key = (path, size, alpha, smooth)
+    surf = _cache.get(key)
+    if surf is not None:
+        return surf
+
+    if alpha:
+        base = AssetManager.get_texture(path)
+    else:
+        base = _cache.get((path, None, False, False))
+        if base is None:
+            base = pg.image.load(path).convert()
+            _cache[(path, None, False, False)] = base
+
+    if size is None or size == base.get_size():
+        surf = base
+    elif smooth:
+        surf = pg.transform.smoothscale(base, size)
+    else:
+        surf = pg.transform.scale(base, size)
+    _cache[key] = surf
+    return surf
+
+
+def pack_frames(frames: list[pg.Surface]) -> list[pg.Surface]:
+    """
+    Copy *frames* side by side into one per-pixel-alpha strip and return
+    subsurfaces of it, one per frame, in order and at the original sizes.
+
+    An animation then lives in a single pixel buffer instead of one
+    allocation per frame; the subsurfaces blit exactly like the originals.
+    """
+    if len(frames) < 2:
+        return list(frames)
+    strip = pg.Surface(
+        (sum(f.get_width() for f in frames), max(f.get_height() for f in frames)), pg.SRCALPHA
+    ).convert_alpha()
+    packed = []
+    x = 0
+    for frame in frames:
+        strip.blit(frame, (x, 0))
+        packed.append(strip.subsurface((x, 0), frame.get_size()))
+        x += frame.get_width()
+    return packed
+
+
+def scaled_frames(directory: str, scale: float, flip: bool = False) -> list[pg.Surface]:
+    """
+    Return every frame in *directory* scaled by *scale* (and mirrored
+    horizontally if *flip*), sharing one list per ``(directory, scale, flip)``.
+    Empty directories are not cached.
+    """
+    key = (directory, scale, flip)
+    frames = _frames_cache.get(key)
+    if frames is not None:
+        return frames
+
+    if flip:
+        frames = pack_frames([pg.transform.flip(f, True, False) for f in scaled_frames(directory, scale)])
+    else:
+        frames = pack_frames([
+            pg.transform.scale(f, (int(f.get_width() * scale), int(f.get_height() * scale)))
+            for f in AssetManager.get_animation_frames(directory)
+        ])
+    if frames:
+        _frames_cache[key] = frames
+    return frames
+
+
+def flipped(frames: list[pg.Surface]) -> list[pg.Surface]:
+    """
+    Return a horizontally mirrored copy of the frame list *frames*, built on
+    first request and shared by every later caller passing the same list.
+
+    Meant for frame lists that are themselves cached and shared (entity
+    class-level caches); a per-instance list would be kept alive here.
+    """
+    entry = _flipped_cache.get(id(frames))
+    if entry is not None:
+        return entry[1]
+    mirrored = [pg.transform.flip(f, True, False) for f in frames]
+    _flipped_cache[id(frames)] = (frames, mirrored)
+    return mirrored
+
+
+def clear() -> None:
+    """Drop every cached surface (e.g. after a display mode change)."""
+    _cache.clear()
+    _frames_cache.clear()
+    _flipped_cache.clear()
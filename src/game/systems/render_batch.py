@@ -0,0 +1,27 @@
+"""
+Render Batch — one Python→C call for a whole list of plain image blits.
+
+pygame-ce's ``Surface.fblits`` skips building the per-blit return list that
+``Surface.blits`` produces; on upstream pygame this falls back to
+``blits(doreturn=False)``. Every batched draw path goes through
+``blit_batch`` so the check lives in one place.
+"""
+
+from __future__ import annotations
+
+from typing import Final, Iterable, Tuple, Union
+
+import pygame as pg
+
+
+_HAS_FBLITS: Final[bool] = hasattr(pg.Surface, "fblits")
+
+BlitPos = Union[Tuple[int, int], pg.Rect]
+
+
+def blit_batch(surface: pg.Surface, blit_seq: Iterable[Tuple[pg.Surface, BlitPos]]) -> None:
+    """Blit every ``(image, pos)`` pair in *blit_seq* onto *surface*, in order."""
+    if _HAS_FBLITS:
+        surface.fblits(blit_seq)
+    else:
+        surface.blits(blit_seq, doreturn=False)
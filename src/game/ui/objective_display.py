@@ -43,6 +43,10 @@ class ObjectiveDisplay(ParchmentDisplay):
 
         self._full_raw_text: str = ""
         self._loaded_theme: Optional[str] = None
+
+        # Rendered text is reused until its inputs change (draw runs per frame)
+        self._title_cache: Tuple[Any, Optional[pg.Surface]] = (None, None)
+        self._lines_cache: Tuple[Any, List[pg.Surface]] = (None, [])
         self._load_effects()
 
     def _load_effects(self) -> None:
@@ -141,6 +145,18 @@ class ObjectiveDisplay(ParchmentDisplay):
             self.dismiss()
             return True
 
+    def _text_lines(self, length: int, alpha: Optional[int] = None) -> List[pg.Surface]:
+        """Wrapped line surfaces for the first *length* characters, re-rendered
+        only when the revealed text (or its fade) changes."""
+        key = (self._full_raw_text, length, alpha, self._cfg["text_color"])
+        if self._lines_cache[0] != key:
+            lines = self._wrap_text(self._full_raw_text[:length], self._font, self._text_max_w, self._cfg["text_color"])
+            if alpha is not None:
+                for line_surf in lines:
+                    line_surf.set_alpha(alpha)
+            self._lines_cache = (key, lines)
+        return self._lines_cache[1]
+
     def draw(self, surface: Any) -> None:
         """Render background, elemental intro FX, typewriter text, and prompt."""
         if not self._active:
@@ -153,7 +169,10 @@ class ObjectiveDisplay(ParchmentDisplay):
 
         # 2. Title rendering
         title_color = self._cfg.get("title_color", (200, 40, 40) if "necromancer" in self._current_theme else (180, 140, 60))
-        title_surf = self._title_font.render(self._title, True, title_color)
+        title_key = (self._title, title_color)
+        if self._title_cache[0] != title_key:
+            self._title_cache = (title_key, self._title_font.render(self._title, True, title_color).convert_alpha())
+        title_surf = self._title_cache[1]
         title_x = self._parch_rect.centerx - title_surf.get_width() // 2
         title_y = self._text_y
         surface.blit(title_surf, (title_x, title_y))
@@ -173,14 +192,12 @@ class ObjectiveDisplay(ParchmentDisplay):
         elif self._fx_state == FXState.SMOKE_SETTLE:
             # Draw partial text starting to show through smoke
             visible_len = max(1, int(len(self._full_raw_text) * 0.2))
-            partial_text = self._full_raw_text[:visible_len]
-            lines = self._wrap_text(partial_text, self._font, self._text_max_w, self._cfg["text_color"])
+            lines = self._text_lines(visible_len, alpha=100)
             y = content_y_start
             for line_surf in lines:
                 if y + line_surf.get_height() > self._text_y + self._text_max_h:
                     break
                 lx = self._text_x + (self._text_max_w - line_surf.get_width()) // 2
-                line_surf.set_alpha(100)
                 surface.blit(line_surf, (lx, y))
                 y += line_surf.get_height() + self._line_spacing
 
@@ -195,8 +212,7 @@ class ObjectiveDisplay(ParchmentDisplay):
         elif self._fx_state in (FXState.TYPEWRITER, FXState.COMPLETE):
             # Render typewriter or full text
             curr_len = int(self._char_count) if self._fx_state == FXState.TYPEWRITER else len(self._full_raw_text)
-            displayed_text = self._full_raw_text[:curr_len]
-            lines = self._wrap_text(displayed_text, self._font, self._text_max_w, self._cfg["text_color"])
+            lines = self._text_lines(curr_len)
 
             y = content_y_start
             for line_surf in lines:
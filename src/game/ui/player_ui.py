@@ -2,6 +2,24 @@ from typing import Callable, Optional
 import math
 import pygame as pg
 from v3x_zulfiqar_gideon import AssetManager
+from src.game.systems import image_cache
+from src.game.systems.render_batch import blit_batch
+
+
+def _soul_bar_style(fill: tuple, border: tuple) -> tuple:
+    """(fill, border, shimmer) colours for one soul-bar tier."""
+    return fill, border, tuple(min(255, c + 40) for c in fill)
+
+
+# Soul-bar colours per whole percent of the quota (0..100), so the HUD reads
+# one entry per frame instead of walking the threshold ladder.
+_SOUL_BAR_COMPLETE = _soul_bar_style((255, 215, 50), (255, 200, 0))
+_SOUL_BAR_STYLES = tuple(
+    _soul_bar_style((200, 40, 40), (255, 60, 60)) if pct >= 95
+    else _soul_bar_style((200, 140, 30), (230, 170, 50)) if pct >= 80
+    else _soul_bar_style((120, 50, 200), (160, 60, 255))
+    for pct in range(101)
+)
 
 class PlayerUI:
     def __init__(self):
@@ -30,9 +48,9 @@ class PlayerUI:
         # Load dragon HP bar sprite frames (0 = full, 7 = empty)
         self.health_frames = []
         for i in range(8):
-            frame = AssetManager.get_texture(f"assets/dragonhpbar/health_bar_{i}.png")
-            scaled = pg.transform.scale(frame, (frame.get_width() * 3, frame.get_height() * 3))
-            self.health_frames.append(scaled)
+            path = f"assets/dragonhpbar/health_bar_{i}.png"
+            frame = AssetManager.get_texture(path)
+            self.health_frames.append(image_cache.load(path, (frame.get_width() * 3, frame.get_height() * 3)))
 
         self.health_bar_pos = (20, 10)
         bar_h = self.health_frames[0].get_height()
@@ -67,11 +85,22 @@ class PlayerUI:
 
         # Performance surface caches for low-end GPU/CPU hardware
         self._framed_icon_cache: dict = {}
-        self._souls_label_surf: pg.Surface = self.small_font.render("SOULS", True, (140, 120, 180))
+        self._souls_label_surf: pg.Surface = self.small_font.render("SOULS", True, (140, 120, 180)).convert_alpha()
         self._relics_cache: tuple = (None, None)
-        self._time_cache: tuple = (None, None)
-        self._dist_cache: tuple = (None, None)
         self._soul_count_cache: tuple = (None, None)
+        self._percent_surf_cache: dict[int, pg.Surface] = {}
+        self._resource_bar_cache: dict[tuple, tuple[int, pg.Surface]] = {}
+        self._soul_glow_surf: Optional[pg.Surface] = None  # refilled each pulse frame
+
+        # Glyph atlas for the clock and distance readouts: the distance changes
+        # almost every frame while running, so those strings are assembled
+        # from pre-rendered characters instead of a font.render per change
+        white = (255, 255, 255)
+        self._glyph_atlas: dict[str, pg.Surface] = {
+            c: self.small_font.render(c, True, white).convert_alpha() for c in "0123456789:-"
+        }
+        self._time_label_surf: pg.Surface = self.small_font.render("Time: ", True, white).convert_alpha()
+        self._dist_label_surf: pg.Surface = self.small_font.render("Dist: ", True, white).convert_alpha()
 
         from typing import Optional, Any
         self.power_icons_manager: Optional[Any] = None
@@ -82,11 +111,12 @@ class PlayerUI:
             print(f"[PlayerUI] Could not initialize PowerIconsManager: {e}")
 
     def load_icon(self, path, size):
+        """Display-format icon at *size*, shared through the image cache."""
         try:
-            icon = AssetManager.get_texture(path)
-            return pg.transform.scale(icon, size)
-        except Exception:
-            surface = pg.Surface(size, pg.SRCALPHA)
+            return image_cache.load(path, size)
+        except (FileNotFoundError, pg.error) as e:
+            print(f"[PlayerUI] Could not load icon {path}: {e}")
+            surface = pg.Surface(size, pg.SRCALPHA).convert_alpha()
             surface.fill((255, 0, 255))
             return surface
 
@@ -131,12 +161,15 @@ class PlayerUI:
         return surface
 
     def start_timer(self):
+        """Start the HUD run clock; called once when gameplay is entered."""
         self.start_time = pg.time.get_ticks()
     
-    def get_elapsed_time(self):
+    def get_elapsed_time(self, now=None):
         if self.start_time == 0:
             return 0
-        return (pg.time.get_ticks() - self.start_time) / 1000.0
+        if now is None:
+            now = pg.time.get_ticks()
+        return (now - self.start_time) / 1000.0
     
     def format_time(self, seconds):
         mins = int(seconds // 60)
@@ -172,11 +205,14 @@ class PlayerUI:
             if self._soul_complete_callback is not None:
                 self._soul_complete_callback()
 
-    def update(self) -> None:
+    def update(self, current_time_ms: Optional[int] = None) -> None:
         """Update UI timers (e.g. pulse decay)."""
-        current_time = pg.time.get_ticks()
-        self.power_ups = [pu for pu in self.power_ups 
-                         if current_time - pu["start_time"] < pu["duration"]]
+        # Usually no power-up is active; only rebuild the list once one expires
+        if self.power_ups:
+            current_time = pg.time.get_ticks() if current_time_ms is None else current_time_ms
+            if any(current_time - pu["start_time"] >= pu["duration"] for pu in self.power_ups):
+                self.power_ups = [pu for pu in self.power_ups
+                                  if current_time - pu["start_time"] < pu["duration"]]
 
         # Decay soul pulse animation
         if self._soul_pulse_timer > 0:
@@ -245,30 +281,39 @@ class PlayerUI:
         bar_y = pos[1] + (icon.get_height() // 2) - 8
         bar_w, bar_h = self._resource_bar_size
         
-        # Background bar
-        bg_rect = pg.Rect(bar_x, bar_y, bar_w, bar_h)
-        pg.draw.rect(surface, bg_color, bg_rect, border_radius=4)
-        
-        # Fill bar
-        if ratio > 0:
-            fill_w = max(2, int(bar_w * ratio))
-            fill_rect = pg.Rect(bar_x, bar_y, fill_w, bar_h)
-            pg.draw.rect(surface, fill_color, fill_rect, border_radius=4)
-            
-            # Subtle top highlight
-            highlight_rect = pg.Rect(bar_x, bar_y, fill_w, bar_h // 2)
-            highlight_color = (min(255, fill_color[0] + 50), min(255, fill_color[1] + 50), min(255, fill_color[2] + 50))
-            pg.draw.rect(surface, highlight_color, highlight_rect, border_radius=4)
-            
-        # Border
-        pg.draw.rect(surface, (200, 200, 220), bg_rect, width=1, border_radius=4)
-
-    def draw(self, surface):
-        if self.start_time == 0:
-            self.start_time = pg.time.get_ticks()
+        fill_w = max(2, int(bar_w * ratio)) if ratio > 0 else 0
+
+        # Only redraw the bar when its fill width changes (it is dirty)
+        cache_key = (fill_color, bg_color)
+        cached = self._resource_bar_cache.get(cache_key)
+        if cached is None or cached[0] != fill_w:
+            bar_surf = pg.Surface((bar_w, bar_h), pg.SRCALPHA)
+            bg_rect = pg.Rect(0, 0, bar_w, bar_h)
+
+            # Background bar
+            pg.draw.rect(bar_surf, bg_color, bg_rect, border_radius=4)
+
+            # Fill bar
+            if fill_w:
+                pg.draw.rect(bar_surf, fill_color, (0, 0, fill_w, bar_h), border_radius=4)
+
+                # Subtle top highlight
+                highlight_color = (min(255, fill_color[0] + 50), min(255, fill_color[1] + 50), min(255, fill_color[2] + 50))
+                pg.draw.rect(bar_surf, highlight_color, (0, 0, fill_w, bar_h // 2), border_radius=4)
+
+            # Border
+            pg.draw.rect(bar_surf, (200, 200, 220), bg_rect, width=1, border_radius=4)
+            cached = (fill_w, bar_surf.convert_alpha())
+            self._resource_bar_cache[cache_key] = cached
+        surface.blit(cached[1], (bar_x, bar_y))
+
+    def draw(self, surface, now: Optional[int] = None):
+        """Draw the HUD; *now* is the frame's tick count in ms, if the caller has it."""
+        if now is None:
+            now = pg.time.get_ticks()
 
         # Small idle float offset
-        float_y = int(math.sin(pg.time.get_ticks() * 0.003) * 2)
+        float_y = int(math.sin(now * 0.003) * 2)
 
         # ── Health Bar ───────────────────────────────────────────────────────
         health_ratio = max(0.0, min(1.0, self.current_health / self.max_health))
@@ -276,7 +321,9 @@ class PlayerUI:
         frame_idx = max(0, min(7, frame_idx))
         hp_frame = self.health_frames[frame_idx]
         hp_pos = (self.health_bar_pos[0], self.health_bar_pos[1] + float_y)
-        surface.blit(hp_frame, hp_pos)
+        # Plain image blits for the non-overlapping HUD pieces are collected
+        # here and issued in one batched call; the bars below use pg.draw
+        blit_seq = [(hp_frame, hp_pos)]
 
         # ── Mana Bar ─────────────────────────────────────────────────────────
         self._draw_resource_bar(
@@ -297,45 +344,44 @@ class PlayerUI:
 
         # Draw Relics counter with golden glowing frame
         relic_y = self.relic_icon_pos[1] + float_y
-        self._draw_framed_icon(surface, self.relic_icon, (self.relic_icon_pos[0], relic_y), border_color=(255, 215, 0), opacity=255)
+        relic_frame = self._get_framed_icon_surface(self.relic_icon, (255, 215, 0), 255)
+        blit_seq.append((relic_frame, (self.relic_icon_pos[0] - 4, relic_y - 4)))
         if self._relics_cache[0] != self.relics:
-            relic_surf = self.medium_font.render(f"x {self.relics}", True, (255, 255, 255))
+            relic_surf = self.medium_font.render(f"x {self.relics}", True, (255, 255, 255)).convert_alpha()
             self._relics_cache = (self.relics, relic_surf)
         if self._relics_cache[1] is not None:
-            surface.blit(self._relics_cache[1], (self.relic_icon_pos[0] + 44, relic_y + 8))
+            blit_seq.append((self._relics_cache[1], (self.relic_icon_pos[0] + 44, relic_y + 8)))
         
         y_offset = 0
         for power_up in self.power_ups:
             icon = self.power_up_icons.get(power_up["type"], None)
             if icon:
-                surface.blit(icon, (self.power_up_icon_pos[0], self.power_up_icon_pos[1] + y_offset + float_y))
-                elapsed = pg.time.get_ticks() - power_up["start_time"]
+                blit_seq.append((icon, (self.power_up_icon_pos[0], self.power_up_icon_pos[1] + y_offset + float_y)))
+                elapsed = now - power_up["start_time"]
                 remaining = max(0, power_up["duration"] - elapsed)
                 percent = int((remaining / power_up["duration"]) * 100)
-                time_text = self.small_font.render(f"{percent}%", True, (255, 255, 255))
-                surface.blit(time_text, (self.power_up_icon_pos[0] + 35, self.power_up_icon_pos[1] + y_offset + 4))
+                time_text = self._percent_surf_cache.get(percent)
+                if time_text is None:
+                    time_text = self.small_font.render(f"{percent}%", True, (255, 255, 255)).convert_alpha()
+                    self._percent_surf_cache[percent] = time_text
+                blit_seq.append((time_text, (self.power_up_icon_pos[0] + 35, self.power_up_icon_pos[1] + y_offset + 4)))
                 y_offset += 35
         
-        elapsed_seconds = self.get_elapsed_time()
-        if self._time_cache[0] != elapsed_seconds:
-            time_surf = self.small_font.render(f"Time: {self.format_time(elapsed_seconds)}", True, (255, 255, 255))
-            self._time_cache = (elapsed_seconds, time_surf)
-        time_text = self._time_cache[1]
-        time_rect = time_text.get_rect(topright=(self.time_pos[0], self.time_pos[1] + float_y))
+        time_str = self.format_time(int(self.get_elapsed_time(now)))
+        time_rect = self._layout_glyph_text(
+            blit_seq, self._time_label_surf, time_str, (self.time_pos[0], self.time_pos[1] + float_y)
+        )
         time_icon_rect = self.time_icon.get_rect(midright=(time_rect.left - 8, time_rect.centery))
-        surface.blit(self.time_icon, time_icon_rect)
-        surface.blit(time_text, time_rect)
+        blit_seq.append((self.time_icon, time_icon_rect))
 
         # Distance display (right below time)
-        dist_int = int(self.distance)
-        if self._dist_cache[0] != dist_int:
-            dist_surf = self.small_font.render(f"Dist: {dist_int}", True, (255, 255, 255))
-            self._dist_cache = (dist_int, dist_surf)
-        dist_text = self._dist_cache[1]
-        dist_rect = dist_text.get_rect(topright=(self.time_pos[0], time_rect.bottom + 4))
+        dist_rect = self._layout_glyph_text(
+            blit_seq, self._dist_label_surf, str(int(self.distance)), (self.time_pos[0], time_rect.bottom + 4)
+        )
         dist_icon_rect = self.dist_icon.get_rect(midright=(dist_rect.left - 8, dist_rect.centery))
-        surface.blit(self.dist_icon, dist_icon_rect)
-        surface.blit(dist_text, dist_rect)
+        blit_seq.append((self.dist_icon, dist_icon_rect))
+
+        blit_batch(surface, blit_seq)
 
         # Draw Power HUD Icons overlay if available
         if self.power_icons_manager is not None:
@@ -344,9 +390,24 @@ class PlayerUI:
                 current_stamina=self.current_stamina,
                 max_stamina=self.max_stamina,
                 current_mana=getattr(self, "current_mana", 100.0),
-                max_mana=getattr(self, "max_mana", 100.0)
+                max_mana=getattr(self, "max_mana", 100.0),
+                now=now,
             )
 
+    def _layout_glyph_text(self, blit_seq: list, label: pg.Surface, text: str, topright: tuple) -> pg.Rect:
+        """Append *label* followed by *text* from the glyph atlas, right-aligned
+        at *topright*, to *blit_seq*; returns the covered rect."""
+        glyphs = [self._glyph_atlas[c] for c in text]
+        x = topright[0] - sum(g.get_width() for g in glyphs) - label.get_width()
+        y = topright[1]
+        rect = pg.Rect(x, y, topright[0] - x, label.get_height())
+        blit_seq.append((label, (x, y)))
+        x += label.get_width()
+        for glyph in glyphs:
+            blit_seq.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return rect
+
     def _draw_soul_harvest(self, surface: pg.Surface, float_y: int) -> None:
         souls_y = self.souls_icon_pos[1] + float_y
         total = self.current_soul_total
@@ -354,21 +415,9 @@ class PlayerUI:
         ratio = min(1.0, total / target) if target > 0 else 0.0
 
         if self._soul_complete:
-            bar_fill = (255, 215, 50)
-            bar_border = (255, 200, 0)
-            text_color = (255, 240, 180)
-        elif ratio >= 0.95:
-            bar_fill = (200, 40, 40)
-            bar_border = (255, 60, 60)
-            text_color = (255, 180, 180)
-        elif ratio >= 0.80:
-            bar_fill = (200, 140, 30)
-            bar_border = (230, 170, 50)
-            text_color = (255, 220, 160)
+            bar_fill, bar_border, shimmer = _SOUL_BAR_COMPLETE
         else:
-            bar_fill = (120, 50, 200)
-            bar_border = (160, 60, 255)
-            text_color = (220, 200, 255)
+            bar_fill, bar_border, shimmer = _SOUL_BAR_STYLES[int(ratio * 100)]
 
         pulse_alpha = 0
         if self._soul_pulse_timer > 0:
@@ -395,15 +444,15 @@ class PlayerUI:
             pg.draw.rect(surface, bar_fill, fill_rect, border_radius=4)
 
             top_rect = pg.Rect(bar_x, bar_y_center, fill_w, bar_h // 2)
-            shimmer = (*[min(255, c + 40) for c in bar_fill[:3]],)
             pg.draw.rect(surface, shimmer, top_rect, border_radius=4)
 
         if pulse_alpha > 0:
-            glow_surf = pg.Surface((bar_w + 6, bar_h + 6), pg.SRCALPHA).convert_alpha()
+            glow_surf = self._soul_glow_surf
+            if glow_surf is None:
+                glow_surf = self._soul_glow_surf = pg.Surface((bar_w + 6, bar_h + 6), pg.SRCALPHA).convert_alpha()
             glow_surf.fill((255, 220, 80, pulse_alpha))
             surface.blit(glow_surf, (bar_x - 3, bar_y_center - 3))
 
         pg.draw.rect(surface, bar_border, bg_rect, width=1, border_radius=4)
 
-        label_text = self.small_font.render("SOULS", True, (140, 120, 180))
-        surface.blit(label_text, (bar_x, bar_y_center + bar_h + 2))
\ No newline at end of file
+        surface.blit(self._souls_label_surf, (bar_x, bar_y_center + bar_h + 2))
\ No newline at end of file
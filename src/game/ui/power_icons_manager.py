@@ -4,6 +4,14 @@ import math
 import pygame as pg
 from typing import Dict, Any, Optional, Tuple
 
+from src.game.systems import image_cache
+
+# Unit vertices of the hexagon icon frame, scaled per draw instead of
+# recomputing six radians/cos/sin triples for every icon on every frame
+_HEXAGON_UNIT: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(60 * i - 30)), math.sin(math.radians(60 * i - 30))) for i in range(6)
+)
+
 class PowerIconsManager:
     """
     Runtime manager for displaying configured Power HUD icons on screen.
@@ -37,12 +45,7 @@ class PowerIconsManager:
                 path = os.path.join(folder, f"icon_glow_{i:02d}.png")
                 if os.path.exists(path):
                     try:
-                        img = pg.image.load(path)
-                        try:
-                            img = img.convert_alpha()
-                        except Exception:
-                            pass
-                        self.glow_frames.append(img)
+                        self.glow_frames.append(image_cache.load(path))
                     except Exception as e:
                         print(f"[PowerIconsManager] Could not load glow frame {path}: {e}")
 
@@ -82,7 +85,6 @@ class PowerIconsManager:
             try:
                 with open(self.config_path, "r") as f:
                     self.config = json.load(f)
-                self._preload_assets()
             except Exception as e:
                 print(f"[PowerIconsManager] Failed to load {self.config_path}: {e}")
                 self.config = self.get_default_config()
@@ -160,15 +162,9 @@ class PowerIconsManager:
             path = pdata.get("asset_path", "")
             if path and os.path.exists(path):
                 try:
-                    img = pg.image.load(path)
-                    try:
-                        img = img.convert_alpha()
-                    except Exception:
-                        pass
                     w = int(pdata.get("width", 52) * pdata.get("scale", 1.0))
                     h = int(pdata.get("height", 52) * pdata.get("scale", 1.0))
-                    scaled = pg.transform.smoothscale(img, (w, h))
-                    self.icon_surfaces[pkey] = scaled
+                    self.icon_surfaces[pkey] = image_cache.load(path, (w, h), smooth=True)
                 except Exception as e:
                     print(f"[PowerIconsManager] Could not load image {path}: {e}")
                     self.icon_surfaces[pkey] = self._create_placeholder_icon(pkey, pdata)
@@ -206,10 +202,7 @@ class PowerIconsManager:
             pg.draw.rect(surface, (14, 18, 26, 200), rect, border_radius=8)
             pg.draw.rect(surface, color, rect, width=2 if not active else 3, border_radius=8)
         elif style == "hexagon":
-            pts = []
-            for i in range(6):
-                angle = math.radians(60 * i - 30)
-                pts.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+            pts = [(cx + r * ux, cy + r * uy) for ux, uy in _HEXAGON_UNIT]
             pg.draw.polygon(surface, (14, 18, 26, 200), pts)
             pg.draw.polygon(surface, color, pts, width=2)
         elif style == "glowing":
@@ -301,13 +294,15 @@ class PowerIconsManager:
         current_stamina: Optional[float] = None,
         max_stamina: Optional[float] = None,
         current_mana: Optional[float] = None,
-        max_mana: Optional[float] = None
+        max_mana: Optional[float] = None,
+        now: Optional[int] = None,
     ):
         """
         Draw all active power HUD icons to target Pygame surface.
         cooldowns: dict mapping power_key -> progress ratio (0.0 = ready, 1.0 = on full cooldown)
         active_powers: dict mapping power_key -> bool (is currently active / held)
         current_stamina: player's current stamina (dims icons when stamina is insufficient)
+        now: the frame's tick count in ms, if the caller already has it
         """
         cooldowns = cooldowns or {}
         active_powers = active_powers or {}
@@ -403,7 +398,7 @@ class PowerIconsManager:
                 if show_badges and keybind:
                     badge_bg = tuple(pdata.get("badge_bg", [0, 140, 200]))
                     if keybind not in self._badge_cache:
-                        self._badge_cache[keybind] = self.badge_font.render(keybind, True, (255, 255, 255))
+                        self._badge_cache[keybind] = self.badge_font.render(keybind, True, (255, 255, 255)).convert_alpha()
                     badge_txt = self._badge_cache[keybind]
                     bw = badge_txt.get_width() + 8
                     bh = 16
@@ -416,7 +411,8 @@ class PowerIconsManager:
                     surface.blit(badge_txt, (bx + 4, by + 1))
 
         # Render active Power Rangers-style pop-in action FX with icon_glow animated frames
-        now = pg.time.get_ticks()
+        if now is None:
+            now = pg.time.get_ticks()
         remaining_effects = []
         for fx in self.active_pop_effects:
             elapsed = now - fx["start_time"]
@@ -40,6 +40,8 @@ from typing import Optional
 import pygame as pg
 
 from v3x_zulfiqar_gideon import AssetManager, UITheme
+from src.game.systems import image_cache
+from src.game.systems.render_batch import blit_batch
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -300,6 +302,12 @@ class TutorialOverlay:
         # ── Surface Caches ──────────────────────────────────────────────────
         self._prompt_surf_cache: dict = {}
         self._counter_surf_cache: dict = {}
+        # Rendered title and wrapped description lines, keyed by step
+        self._title_surf_cache: dict = {}
+        self._desc_lines_cache: dict = {}
+        # Resampled key icons keyed by (step, key, w, h); the pulse only ever
+        # visits a handful of integer sizes, so each is scaled once.
+        self._pulse_surf_cache: dict = {}
 
         # ── Pre-load key images per step ────────────────────────────────────
         self._step_key_imgs: list[list[pg.Surface]] = []
@@ -323,10 +331,7 @@ class TutorialOverlay:
 
     @staticmethod
     def _load_scaled_frames(directory: str, scale: float) -> list[pg.Surface]:
-        return [
-            pg.transform.scale(f, (f.get_width() * scale, f.get_height() * scale))
-            for f in AssetManager.get_animation_frames(directory)
-        ]
+        return image_cache.scaled_frames(directory, scale)
 
     # ─── Public interface ────────────────────────────────────────────────────
 
@@ -391,38 +396,47 @@ class TutorialOverlay:
         p = self._pos                           # shorthand
         step = self._steps[self._step_idx]
 
+        # Every layer is a plain image blit; they are collected back to front
+        # and issued in one batched call at the end
+
         # ── 1. Dark backdrop ────────────────────────────────────────────────
-        surface.blit(self._backdrop, (0, 0))
+        blit_seq = [(self._backdrop, (0, 0))]
 
         # ── 2. Parchment banner ─────────────────────────────────────────────
-        surface.blit(self._banner, p["banner_topleft"])
+        blit_seq.append((self._banner, p["banner_topleft"]))
 
         # ── 3. Player sprite (left side) ────────────────────────────────────
         frames = self._step_player_frames[self._step_idx]
         if frames:
             sprite = frames[min(self._player_frame, len(frames) - 1)]
-            surface.blit(sprite, sprite.get_rect(center=p["sprite_center"]))
+            blit_seq.append((sprite, sprite.get_rect(center=p["sprite_center"])))
 
         # ── 4. Oracle tower (right side) ────────────────────────────────────
         if self._oracle_frames:
             oracle = self._oracle_frames[min(self._oracle_frame, len(self._oracle_frames) - 1)]
-            surface.blit(oracle, oracle.get_rect(center=p["oracle_center"]))
+            blit_seq.append((oracle, oracle.get_rect(center=p["oracle_center"])))
 
         # ── 5. Title (centre-top) ──────────────────────────────────────────
-        title_surf = self._title_font.render(step.title, True, self._title_color)
+        title_surf = self._title_surf_cache.get(self._step_idx)
+        if title_surf is None:
+            title_surf = self._title_font.render(step.title, True, self._title_color).convert_alpha()
+            self._title_surf_cache[self._step_idx] = title_surf
         title_rect = title_surf.get_rect(
             centerx=p["title_centerx"],
             top=p["title_top"],
         )
-        surface.blit(title_surf, title_rect)
+        blit_seq.append((title_surf, title_rect))
 
         # ── 6. Description text (below title) ──────────────────────────────
-        desc_lines = self._wrap_text(
-            step.description, self._desc_font, p["text_max_width"], self._desc_color
-        )
+        desc_lines = self._desc_lines_cache.get(self._step_idx)
+        if desc_lines is None:
+            desc_lines = self._wrap_text(
+                step.description, self._desc_font, p["text_max_width"], self._desc_color
+            )
+            self._desc_lines_cache[self._step_idx] = desc_lines
         y = title_rect.bottom + self._desc_title_gap
         for line_surf in desc_lines:
-            surface.blit(line_surf, line_surf.get_rect(centerx=p["text_centerx"], top=y))
+            blit_seq.append((line_surf, line_surf.get_rect(centerx=p["text_centerx"], top=y)))
             y += line_surf.get_height() + self._desc_line_gap
 
         # ── 7. Key icons (pulsing, below description) ──────────────────────
@@ -434,13 +448,17 @@ class TutorialOverlay:
         kx = p["text_centerx"] - total_w // 2
         ky = y + self._key_gap
 
-        for img in key_imgs:
+        for key_idx, img in enumerate(key_imgs):
             pw, ph = int(img.get_width() * pulse), int(img.get_height() * pulse)
             if pw == img.get_width() and ph == img.get_height():
                 pulsed = img
             else:
-                pulsed = pg.transform.scale(img, (pw, ph))
-            surface.blit(pulsed, pulsed.get_rect(midtop=(kx + img.get_width() // 2, ky)))
+                pulse_key = (self._step_idx, key_idx, pw, ph)
+                pulsed = self._pulse_surf_cache.get(pulse_key)
+                if pulsed is None:
+                    pulsed = pg.transform.scale(img, (pw, ph))
+                    self._pulse_surf_cache[pulse_key] = pulsed
+            blit_seq.append((pulsed, pulsed.get_rect(midtop=(kx + img.get_width() // 2, ky))))
             kx += img.get_width() + self._key_spacing
 
         # ── 8. "Press KEY to continue" prompt ──────────────────────────────
@@ -448,23 +466,25 @@ class TutorialOverlay:
         prompt_key = (self._step_idx, tuple(step.key_names))
         if prompt_key not in self._prompt_surf_cache:
             prompt_str = f"Press {' / '.join(step.key_names)} to continue"
-            self._prompt_surf_cache[prompt_key] = self._prompt_font.render(prompt_str, True, self._prompt_color)
-        prompt_surf = self._prompt_surf_cache[prompt_key].copy()
-        prompt_surf.set_alpha(alpha)
-        surface.blit(prompt_surf, prompt_surf.get_rect(
+            self._prompt_surf_cache[prompt_key] = self._prompt_font.render(prompt_str, True, self._prompt_color).convert_alpha()
+        prompt_surf = self._prompt_surf_cache[prompt_key]
+        prompt_surf.set_alpha(alpha)  # private to this overlay; reset every frame
+        blit_seq.append((prompt_surf, prompt_surf.get_rect(
             centerx=p["prompt_centerx"],
             bottom=p["prompt_bottom"],
-        ))
+        )))
 
         # ── 9. Step counter (bottom-right) ─────────────────────────────────
         if self._step_idx not in self._counter_surf_cache:
             counter_str = f"{self._step_idx + 1} / {len(self._steps)}"
-            self._counter_surf_cache[self._step_idx] = self._prompt_font.render(counter_str, True, self._counter_color)
+            self._counter_surf_cache[self._step_idx] = self._prompt_font.render(counter_str, True, self._counter_color).convert_alpha()
         counter_surf = self._counter_surf_cache[self._step_idx]
-        surface.blit(counter_surf, counter_surf.get_rect(
+        blit_seq.append((counter_surf, counter_surf.get_rect(
             right=p["counter_right"],
             bottom=p["counter_bottom"],
-        ))
+        )))
+
+        blit_batch(surface, blit_seq)
 
     # ─── Internal helpers ────────────────────────────────────────────────────
 
@@ -57,3 +57,17 @@ def test_objective_display_typewriter_update():
     # Advance 1 second (1000ms)
     overlay.update(1000.0)
     assert overlay._char_count > 0
+
+
+def test_objective_display_reuses_rendered_text_between_frames():
+    overlay = ObjectiveDisplay()
+    overlay.show("Reused text", "Test", theme="default")
+    overlay.update(1000.0)
+    screen = pg.Surface((1280, 720))
+
+    overlay.draw(screen)
+    title_surf = overlay._title_cache[1]
+    lines = overlay._lines_cache[1]
+    overlay.draw(screen)
+    assert overlay._title_cache[1] is title_surf
+    assert overlay._lines_cache[1] is lines
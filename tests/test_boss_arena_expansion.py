@@ -41,7 +41,7 @@ def test_boss_arena_expansion():
         from src.game.states.game_state import GameState
         manager = MagicMock()
         state = GameState(manager)
-        player = state.player.sprite
+        player = state.player
         assert player is not None
         assert player.right_bound_ratio == 0.65
         
@@ -70,7 +70,7 @@ def test_boss_arena_deactivation():
         from src.game.states.game_state import GameState
         manager = MagicMock()
         state = GameState(manager)
-        player = state.player.sprite
+        player = state.player
         assert player is not None
         
         player.right_bound_ratio = 0.90
@@ -0,0 +1,125 @@
+"""Unit tests for the ambient bat Enemy's shared frames and flight path."""
+
+import math
+
+import pygame as pg
+import pytest
+
+from src.game.entities import enemy as enemy_module
+from src.game.entities.enemy import BatSwarm, Enemy, EnemyPool, EnemyState
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_pygame():
+    if not pg.get_init():
+        pg.init()
+    if not pg.display.get_init() or pg.display.get_surface() is None:
+        pg.display.init()
+        pg.display.set_mode((1280, 720))
+    yield
+
+
+def test_sin_table_matches_math_sin():
+    for step in (0.03, 0.05, 0.07):
+        sin_step = step * enemy_module._SIN_TABLE_SIZE / math.tau
+        for t in range(0, 2000, 7):
+            idx = int(t * sin_step) & enemy_module._SIN_TABLE_MASK
+            assert enemy_module._SIN_TABLE[idx] == pytest.approx(math.sin(step * t), abs=0.01)
+
+
+def test_bats_with_same_scale_share_frame_lists():
+    bats = [Enemy() for _ in range(12)]
+    by_scale = {}
+    for bat in bats:
+        frames = bat.animations[EnemyState.FLY]
+        scale = round(bat.depth_scale_factor, 3)
+        if scale in by_scale:
+            assert frames is by_scale[scale]
+        by_scale[scale] = frames
+
+
+def test_bat_bobs_around_y_base():
+    bat = Enemy()
+    bat.y_base = 200
+    bat.rect.midleft = (600, 200)
+    for _ in range(120):
+        bat.update(1.0 / 60.0, scroll_speed=0)
+        assert abs(bat.rect.y - bat.y_base - bat.y_avoid_offset) <= bat.y_amplitude + 1
+
+
+def test_pool_recycles_killed_bats():
+    pool = EnemyPool()
+    group = pg.sprite.Group()
+    bat = pool.acquire(1300, 150)
+    group.add(bat)
+    assert bat.rect.midleft == (1300, 150)
+    assert bat.y_base == 150
+
+    bat.kill()
+    assert not group
+    assert len(pool) == 1
+
+    # A second kill() must not hand the same bat out twice
+    bat.kill()
+    assert len(pool) == 1
+
+    again = pool.acquire(1400, 90)
+    assert again is bat
+    assert again.rect.midleft == (1400, 90)
+    assert again.y_avoid_offset == 0.0
+    assert len(pool) == 0
+
+
+def test_warm_frame_caches_covers_every_depth_scale():
+    Enemy.warm_frame_caches()
+    warmed = set(Enemy._fly_frames_caches)
+    for _ in range(50):
+        Enemy()
+    assert set(Enemy._fly_frames_caches) == warmed
+
+
+def test_pool_acquires_whole_wave():
+    pool = EnemyPool()
+    recycled = pool.acquire(0, 0)
+    recycled.kill()
+
+    wave = pool.acquire_many([(1300, 80), (1350, 120), (1400, 160)])
+    assert len(wave) == 3
+    assert recycled in wave
+    assert [bat.rect.midleft for bat in wave] == [(1300, 80), (1350, 120), (1400, 160)]
+    assert len(pool) == 0
+
+
+def test_bat_leaving_screen_returns_to_pool():
+    pool = EnemyPool()
+    group = pg.sprite.Group()
+    bat = pool.acquire(-500, 100)
+    group.add(bat)
+    bat.update(1.0 / 60.0, scroll_speed=0)
+    assert not group
+    assert len(pool) == 1
+
+
+def test_swarm_separation_matches_per_bat_scan():
+    swarm = BatSwarm()
+    positions = [(600, 200), (620, 210), (640, 200), (900, 400), (610, 203)]
+    bats = []
+    for x, y in positions:
+        bat = Enemy()
+        bat.rect.center = (x, y)
+        bats.append(bat)
+        swarm.add(bat)
+
+    expected = [bat._separation_from_group() for bat in bats]
+    ordered, forces = swarm.resolve_separation()
+    resolved = dict(zip(ordered, forces))
+    for bat, force in zip(bats, expected):
+        assert resolved[bat] == pytest.approx(force)
+
+
+def test_swarm_iterates_bats_back_to_front():
+    swarm = BatSwarm()
+    bats = [Enemy() for _ in range(8)]
+    swarm.add(bats)
+    depths = [bat.depth_scale_factor for bat in swarm]
+    assert depths == sorted(depths)
@@ -0,0 +1,120 @@
+"""Unit tests for EntityAudioMixin's per-entity-type config cache."""
+
+import threading
+
+import pytest
+
+from src.game.audio import audio_lock, sound_preload
+from src.game.audio.audio_lock import save_config_and_lock
+from src.game.audio.entity_audio_mixin import EntityAudioMixin
+from src.game.audio.sound_preload import preload_sounds
+
+
+class RecordingLibrary(dict):
+    """Sound library that records which thread registered each name."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = {}
+
+    def setdefault(self, name, sound):
+        self.threads[name] = threading.get_ident()
+        return super().setdefault(name, sound)
+
+
+class FakeAudioManager:
+    def __init__(self):
+        self.sound_library = RecordingLibrary()
+
+    @property
+    def loaded(self):
+        return list(self.sound_library.threads)
+
+
+@pytest.fixture(autouse=True)
+def fake_sound(monkeypatch):
+    """Build placeholder sounds instead of decoding files with the mixer."""
+    monkeypatch.setattr(sound_preload.pg.mixer, "Sound", lambda path: ("sound", path))
+
+
+class DummyEntity(EntityAudioMixin):
+    pass
+
+
+@pytest.fixture
+def audio_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "growl.wav").write_bytes(b"RIFF")
+    save_config_and_lock(
+        {"sounds": {"growl": "growl.wav"}, "states": {"ATTACK": {"3": "growl"}}},
+        "game_data/goblin_audio_config.json",
+        "game_data/goblin_audio_config.lock",
+    )
+    EntityAudioMixin.clear_entity_audio_cache()
+    yield tmp_path
+    EntityAudioMixin.clear_entity_audio_cache()
+
+
+def test_config_validated_once_per_entity_type(audio_dir, monkeypatch):
+    calls = []
+    real_verify = audio_lock.verify_config_integrity
+
+    def counting_verify(config_path, lock_path):
+        calls.append(config_path)
+        return real_verify(config_path, lock_path)
+
+    monkeypatch.setattr(audio_lock, "verify_config_integrity", counting_verify)
+    manager = FakeAudioManager()
+
+    first = DummyEntity()
+    first._init_entity_audio_config(manager, "goblin")
+    second = DummyEntity()
+    second._init_entity_audio_config(manager, "goblin")
+
+    assert len(calls) == 1
+    assert manager.loaded == ["growl"]
+    assert first._eam_config is second._eam_config
+    assert second._eam_config["states"]["ATTACK"]["3"] == "growl"
+    # Per-instance trigger state stays separate
+    assert first._eam_frames_played is not second._eam_frames_played
+
+
+def test_clear_cache_forces_reload(audio_dir):
+    manager = FakeAudioManager()
+    entity = DummyEntity()
+    entity._init_entity_audio_config(manager, "goblin")
+    cached = entity._eam_config
+
+    EntityAudioMixin.clear_entity_audio_cache()
+    entity._init_entity_audio_config(manager, "goblin")
+    assert entity._eam_config is not cached
+    assert entity._eam_config == cached
+
+
+def test_preload_loads_each_missing_sound_once():
+    manager = FakeAudioManager()
+    manager.sound_library["existing"] = "already.wav"
+    sounds = {f"sfx_{i}": f"sfx_{i}.wav" for i in range(10)}
+    sounds.update({"existing": "other.wav", "unset": ""})
+
+    preload_sounds(manager, sounds)
+
+    assert sorted(manager.loaded) == sorted(f"sfx_{i}" for i in range(10))
+    assert manager.sound_library["sfx_3"] == ("sound", "sfx_3.wav")
+    assert manager.sound_library["existing"] == "already.wav"
+    # Decoding runs on the pool; registration stays on the calling thread
+    assert set(manager.sound_library.threads.values()) == {threading.get_ident()}
+
+
+def test_preload_skips_sounds_that_fail_to_decode(monkeypatch):
+    def failing_sound(path):
+        if path == "broken.wav":
+            raise FileNotFoundError(path)
+        return ("sound", path)
+
+    monkeypatch.setattr(sound_preload.pg.mixer, "Sound", failing_sound)
+    manager = FakeAudioManager()
+
+    preload_sounds(manager, {"ok": "ok.wav", "broken": "broken.wav"})
+
+    assert manager.loaded == ["ok"]
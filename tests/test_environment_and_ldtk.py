@@ -43,6 +43,59 @@ def test_environment_manager_custom_config():
     assert env.ground_y == 550
 
 
+def test_parallax_layer_drops_alpha_only_when_opaque(tmp_path):
+    opaque_path = str(tmp_path / "opaque.png")
+    pg.image.save(pg.Surface((64, 36)), opaque_path)
+    translucent = pg.Surface((64, 36), pg.SRCALPHA)
+    translucent.fill((0, 0, 0, 0))
+    translucent.fill((200, 100, 50, 255), pg.Rect(0, 18, 64, 18))
+    translucent_path = str(tmp_path / "translucent.png")
+    pg.image.save(translucent, translucent_path)
+
+    opaque_layer = ParallaxLayer(opaque_path, 640, 360, stretch_fill=True)
+    assert not opaque_layer.image.get_flags() & pg.SRCALPHA
+
+    translucent_layer = ParallaxLayer(translucent_path, 640, 360, stretch_fill=True)
+    assert translucent_layer.image.get_flags() & pg.SRCALPHA
+
+    # Only the opaque layer can hide the sky and the layers behind it
+    assert opaque_layer.covers_screen()
+    assert not translucent_layer.covers_screen()
+    assert not ParallaxLayer(opaque_path, 640, 360, stretch_fill=True, pos_y_offset=40).covers_screen()
+
+
+def test_parallax_layer_skips_offscreen_copy(tmp_path):
+    path = str(tmp_path / "wide.png")
+    pg.image.save(pg.Surface((64, 36)), path)
+    layer = ParallaxLayer(path, 640, 360, scale_x=2.0, stretch_fill=True)
+    assert layer.width == 1280
+
+    # Second copy starts beyond the right edge: only one blit
+    assert len(layer.blit_args()) == 1
+
+    # Both copies on screen: drawn as one blit of the two-copy strip
+    layer.update(player_speed=4000.0, dt=1.0)
+    blits = layer.blit_args()
+    assert len(blits) == 1
+    assert blits[0][0] is layer.strip
+    assert blits[0][1][0] == int(min(layer.x1, layer.x2))
+    assert layer.strip.get_width() == 2 * layer.width
+
+
+def test_parallax_layer_wraps_when_scrolling_backwards(tmp_path):
+    path = str(tmp_path / "wide.png")
+    pg.image.save(pg.Surface((64, 36)), path)
+    layer = ParallaxLayer(path, 640, 360, scale_x=2.0, stretch_fill=True)
+
+    # Moving left pushes both copies right; the left edge must stay covered
+    for _ in range(5):
+        layer.update(player_speed=-3000.0, dt=1.0)
+        x = min(layer.x1, layer.x2)
+        assert -layer.width < x <= 0
+        assert abs(layer.x1 - layer.x2) == layer.width
+        assert layer.blit_args()
+
+
 def test_ldtk_importer_conversion():
     ldtk_data = {
         "levels": [
@@ -0,0 +1,105 @@
+"""Unit tests for the shared (path, size) image cache."""
+
+import pygame as pg
+import pytest
+
+from src.game.systems import image_cache
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_pygame():
+    if not pg.get_init():
+        pg.init()
+    if not pg.display.get_init() or pg.display.get_surface() is None:
+        pg.display.init()
+        pg.display.set_mode((1280, 720))
+    yield
+
+
+@pytest.fixture
+def png_path(tmp_path):
+    surf = pg.Surface((8, 4), pg.SRCALPHA)
+    surf.fill((10, 20, 30, 128))
+    path = tmp_path / "sample.png"
+    pg.image.save(surf, str(path))
+    image_cache.clear()
+    yield str(path)
+    image_cache.clear()
+
+
+def test_load_is_memoized_per_path_and_size(png_path):
+    native = image_cache.load(png_path)
+    assert native.get_size() == (8, 4)
+    assert image_cache.load(png_path) is native
+
+    doubled = image_cache.load(png_path, (16, 8))
+    assert doubled.get_size() == (16, 8)
+    assert image_cache.load(png_path, (16, 8)) is doubled
+    assert image_cache.load(png_path, (8, 4)) is native
+
+
+def test_opaque_load_uses_separate_entry(png_path):
+    opaque = image_cache.load(png_path, alpha=False)
+    assert opaque is not image_cache.load(png_path)
+    assert not opaque.get_flags() & pg.SRCALPHA
+    assert image_cache.load(png_path, alpha=False) is opaque
+
+
+def test_smooth_resize_uses_separate_entry(png_path):
+    nearest = image_cache.load(png_path, (16, 8))
+    smooth = image_cache.load(png_path, (16, 8), smooth=True)
+    assert smooth is not nearest
+    assert smooth.get_size() == (16, 8)
+    assert image_cache.load(png_path, (16, 8), smooth=True) is smooth
+
+
+def test_scaled_frames_shared_per_directory_and_scale(tmp_path):
+    for i in range(3):
+        pg.image.save(pg.Surface((10, 6)), str(tmp_path / f"frame_{i}.png"))
+    image_cache.clear()
+
+    frames = image_cache.scaled_frames(str(tmp_path), 2.0)
+    assert len(frames) == 3
+    assert frames[0].get_size() == (20, 12)
+    assert image_cache.scaled_frames(str(tmp_path), 2.0) is frames
+    assert image_cache.scaled_frames(str(tmp_path), 1.0) is not frames
+
+
+def test_flipped_frames_cached_alongside_unflipped(tmp_path):
+    frame = pg.Surface((10, 6))
+    frame.fill((255, 0, 0), pg.Rect(0, 0, 1, 6))
+    pg.image.save(frame, str(tmp_path / "frame_0.png"))
+    image_cache.clear()
+
+    plain = image_cache.scaled_frames(str(tmp_path), 1.0)
+    mirrored = image_cache.scaled_frames(str(tmp_path), 1.0, flip=True)
+    assert mirrored is not plain
+    assert mirrored[0].get_at((9, 0)) == plain[0].get_at((0, 0))
+    assert image_cache.scaled_frames(str(tmp_path), 1.0, flip=True) is mirrored
+
+
+def test_scaled_frames_share_one_packed_strip(tmp_path):
+    for i, width in enumerate((10, 12, 8)):
+        frame = pg.Surface((width, 6), pg.SRCALPHA)
+        frame.fill((40 * i, 80, 120, 100 + i))
+        pg.image.save(frame, str(tmp_path / f"frame_{i}.png"))
+    image_cache.clear()
+
+    frames = image_cache.scaled_frames(str(tmp_path), 1.0)
+    assert [f.get_size() for f in frames] == [(10, 6), (12, 6), (8, 6)]
+    parent = frames[0].get_parent()
+    assert parent is not None
+    assert all(f.get_parent() is parent for f in frames)
+    assert frames[2].get_at((7, 5)) == (80, 80, 120, 102)
+
+
+def test_flipped_shared_per_frame_list():
+    frame = pg.Surface((10, 6))
+    frame.fill((255, 0, 0), pg.Rect(0, 0, 1, 6))
+    frames = [frame]
+    image_cache.clear()
+
+    mirrored = image_cache.flipped(frames)
+    assert mirrored[0].get_at((9, 0)) == frame.get_at((0, 0))
+    assert image_cache.flipped(frames) is mirrored
+    assert image_cache.flipped([frame]) is not mirrored
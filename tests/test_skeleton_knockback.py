@@ -64,3 +64,53 @@ def test_skeleton_knockback_horizontal_fallback_lift():
 
     assert skeleton._knockback_vel_x == 10.0 * 1.5
     assert skeleton._gravity == -10.0 * 0.4
+
+
+def test_skeletons_share_cached_and_mirrored_frames():
+    player = MockPlayer()
+    first = Skeleton(200, 600, player, tier="minion", custom_scale=1.0)  # type: ignore
+    second = Skeleton(400, 600, player, tier="minion", custom_scale=1.0)  # type: ignore
+
+    chase = first.animations[SkeletonState.CHASE]
+    assert second.animations[SkeletonState.CHASE] is chase
+
+    flipped = first._animations_flipped[SkeletonState.CHASE]
+    assert second._animations_flipped[SkeletonState.CHASE] is flipped
+    assert len(flipped) == len(chase)
+    assert flipped[0].get_size() == chase[0].get_size()
+
+
+def test_offscreen_idle_skeleton_only_scrolls():
+    player = MockPlayer()
+    skeleton = Skeleton(5000, 600, player, tier="minion", custom_scale=1.0)  # type: ignore
+    for _ in range(30):
+        skeleton.update(dt=1.0 / 60.0, scroll_speed=0)
+    assert skeleton.state == SkeletonState.IDLE
+
+    frame = skeleton.animation_index
+    x = skeleton.rect.x
+    skeleton.update(dt=1.0 / 60.0, scroll_speed=4)
+    assert skeleton.rect.x == x - 4
+    assert skeleton.animation_index == frame
+
+    # Once the player is within detection range the full update resumes
+    player.rect.centerx = skeleton.rect.centerx - 200
+    skeleton.update(dt=1.0 / 60.0, scroll_speed=0)
+    assert skeleton.state == SkeletonState.CHASE
+
+
+def test_health_bar_blits_prerendered_fill():
+    player = MockPlayer()
+    skeleton = Skeleton(200, 600, player, tier="minion", custom_scale=1.0, custom_health=100.0)  # type: ignore
+    skeleton._health = 25.0
+
+    target = pg.Surface((1280, 720))
+    target.fill((0, 0, 0))
+    skeleton._draw_health_bar(target)
+
+    bar_x = skeleton.rect.centerx - 20
+    bar_y = skeleton.rect.top - 10
+    assert target.get_at((bar_x + 9, bar_y))[:3] == (255, 0, 0)
+    assert target.get_at((bar_x + 10, bar_y))[:3] == (50, 50, 50)
+    assert target.get_at((bar_x + 39, bar_y + 4))[:3] == (50, 50, 50)
+    assert len(Skeleton._health_bar_cache) == 41
@@ -35,6 +35,7 @@ from src.game.effects.vfx_manager import VisualEffectManager, VisualEffect
 from src.game.entities.skeleton import Skeleton
 from src.game.entities.player import Player
 from src.game.entities.green_monster import GreenMonster, GatekeeperState, MagicShotProjectile
+from src.game.entities.boss_fx import AlphaFlash
 
 def test_vfx_manager_spawn_impact():
     VisualEffectManager.clear()
@@ -45,6 +46,52 @@ def test_vfx_manager_spawn_impact():
     
     assert len(VisualEffectManager._active_effects) == 1
 
+def test_visual_effect_steps_frames_and_expires():
+    frames = [pg.Surface((4, 4)) for _ in range(3)]
+    group = pg.sprite.Group()
+    fx = VisualEffect(10, 10, frames, fps=10.0)
+    group.add(fx)
+
+    fx.update(dt=0.05)
+    assert fx.frame_index == 0 and fx.image is frames[0]
+    fx.update(dt=0.06)
+    assert fx.frame_index == 1 and fx.image is frames[1]
+    # A long frame skips ahead rather than lagging behind
+    fx.update(dt=0.1)
+    assert fx.frame_index == 2 and fx.image is frames[2]
+    fx.update(dt=0.1)
+    assert not group
+
+
+def test_vfx_manager_reuses_finished_effects():
+    VisualEffectManager.clear()
+    first = VisualEffectManager.spawn_hit_vfx(100, 100)
+    first.kill()
+    assert not VisualEffectManager._active_effects
+
+    second = VisualEffectManager.spawn_hit_vfx(300, 200)
+    assert second is first
+    assert second.frame_index == 0 and second.image is second.frames[0]
+    assert second.rect.center == (300, 200)
+    assert len(VisualEffectManager._active_effects) == 1
+
+
+def test_magic_shot_cycles_frames_on_integer_index():
+    player = MagicMock()
+    player.rect = pg.Rect(5000, 5000, 10, 10)
+    shot = MagicShotProjectile(600, 300, 1, 1.0, 10.0, 0.0, player)
+    shot.frames = [pg.Surface((4, 4)) for _ in range(3)]
+    shot._frame_count = 3
+
+    shot.update(dt=0.03)
+    assert shot.frame_index == 0
+    shot.update(dt=0.03)
+    assert shot.frame_index == 1 and shot.image is shot.frames[1]
+    # Wraps around instead of indexing past the last frame
+    shot.update(dt=0.1)
+    assert shot.frame_index == 0 and shot.image is shot.frames[0]
+
+
 def test_gatekeeper_enraged_phase():
     with patch("v3x_zulfiqar_gideon.asset_manager.AssetManager.get_texture") as mock_tex, \
          patch("v3x_zulfiqar_gideon.asset_manager.AssetManager.get_font") as mock_font:
@@ -71,3 +118,17 @@ def test_gatekeeper_enraged_phase():
         boss.take_damage(60.0)
         assert boss._health == 140.0
         assert boss.is_enraged is True
+
+
+def test_teleport_flash_leaves_shared_frames_untouched():
+    shared = pg.Surface((8, 8), pg.SRCALPHA)
+    flash = AlphaFlash()
+
+    flashed = flash.apply(shared, 100)
+    assert flashed is not shared and flashed.get_alpha() == 100
+    assert shared.get_alpha() == 255
+    # Same frame next update: the copy is reused, not re-made
+    assert flash.apply(flashed, 200) is flashed and flashed.get_alpha() == 200
+    # Flash over: back to the shared frame itself
+    assert flash.apply(flashed, None) is shared
+    assert shared.get_alpha() == 255